@@ -1,7 +1,7 @@
 # config/settings.py
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 import logging
 
@@ -24,10 +24,40 @@ class Settings:
     capture_fps: int = 5
     capture_quality: int = 80
     
+    # Frecuencia (Hz) de cada carril del monitoreo por carriles
+    lane_rates: Dict[str, float] = field(default_factory=lambda: {
+        'critical': 10.0,    # Barras de HP/MP y condiciones (captura el frame)
+        'normal': 4.0,       # Lista de batalla y objetivos
+        'background': 1.0    # Minimapa, inventario, chat y disposición de UI
+    })
+    
     # Configuración de detección
     detection_confidence: float = 0.7
     detection_interval: float = 0.5  # segundos
     
+    # Configuración de lectura de texto (fuente bitmap del cliente)
+    glyphs_dir: str = "templates/glyphs"  # Se genera con scripts/capture_glyphs.py
+    glyph_threshold: int = 150
+    
+    # Sprites de cadáveres para el loot (se escalan al tamaño de tile)
+    corpses_dir: str = "templates/corpses"
+    
+    # Sondas de píxel para iconos de condición (coordenadas relativas al ancla).
+    # El ancla es un elemento de UI detectado: los iconos van en la fila que
+    # queda justo debajo de la barra de MP (20 px de barra + 4 px de separación)
+    condition_probes: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {
+        'poisoned':   {'anchor': 'mp_bar', 'points': [(3, 28), (5, 30), (7, 28)],
+                       'color': (40, 170, 30), 'tolerance': 40},
+        'burning':    {'anchor': 'mp_bar', 'points': [(15, 27), (17, 30), (19, 32)],
+                       'color': (20, 120, 240), 'tolerance': 40},
+        'paralyzed':  {'anchor': 'mp_bar', 'points': [(27, 28), (29, 30), (31, 28)],
+                       'color': (40, 40, 200), 'tolerance': 40},
+        'pz_locked':  {'anchor': 'mp_bar', 'points': [(39, 27), (41, 30), (43, 32)],
+                       'color': (30, 30, 160), 'tolerance': 35},
+        'hungry':     {'anchor': 'mp_bar', 'points': [(51, 28), (53, 30), (55, 28)],
+                       'color': (40, 90, 140), 'tolerance': 40},
+    })
+    
     # Configuración de colores
     colors: Dict[str, Any] = field(default_factory=lambda: {
         'hp': {
@@ -44,11 +74,73 @@ class Settings:
         }
     })
     
+    # Barra de acciones: tecla de cada slot, de izquierda a derecha, y slot
+    # (índice desde 0) de cada acción con nombre, p. ej. {'heal': 0}. Las
+    # acciones que no están en action_bar_slots se buscan por su tecla de
+    # action_keys: con los valores por defecto 'heal' (f1) es el slot 0 y
+    # 'mana_potion' (f2) el 1. El overlay de esos slots corrige los cooldowns
+    action_bar_keys: List[str] = field(default_factory=lambda: [f"f{i}" for i in range(1, 13)])
+    action_bar_slots: Dict[str, int] = field(default_factory=dict)
+    
     # Configuración de acciones
     emergency_hp_threshold: int = 30  # % de HP para emergencia
     emergency_mp_threshold: int = 20  # % de MP para emergencia
     auto_heal_enabled: bool = True
     auto_mana_enabled: bool = True
+    auto_cure_enabled: bool = True  # Curar envenenamiento y parálisis
+    auto_attack_enabled: bool = True
+    auto_loot_enabled: bool = True
+    loot_corpse_max_age: float = 10.0  # Segundos que se guarda un cadáver visto en combate
+    human_like_variation: float = 0.2  # Variación aleatoria de las pausas (0-1)
+    
+    # Curación predictiva: cura según el HP previsto para cuando llegue la cura
+    predictive_healing: bool = True
+    hp_filter_alpha: float = 0.3  # Peso de cada lectura en el HP filtrado
+    hp_filter_beta: float = 0.03  # Peso de cada lectura en el ritmo de cambio
+    expected_action_latency: float = 0.15  # Segundos captura → envío hasta tener medidas
+    hp_fast_path_drop: float = 25.0  # Caída (puntos) de una lectura que cura sin esperar al filtro
+    
+    # Tareas periódicas de mantenimiento: intervalo y jitter (±) en segundos
+    maintenance_tasks: Dict[str, Dict[str, float]] = field(default_factory=lambda: {
+        'eat_food': {'interval': 120.0, 'jitter': 15.0},
+        'read_skills': {'interval': 5.0, 'jitter': 0.0},
+        'save_state': {'interval': 300.0, 'jitter': 0.0}
+    })
+    state_autosave_file: str = "data/bot_state_autosave.json"
+    
+    # Backend de entrada: 'pyautogui' (real) o 'recording' (sin pantalla, para pruebas y benchmarks)
+    input_backend: str = "pyautogui"
+    
+    # Pausa (segundos) del hilo de entrada tras cada tipo de acción
+    action_pauses: Dict[str, float] = field(default_factory=lambda: {
+        'heal': 0.05,
+        'mana_potion': 0.05,
+        'attack': 0.1,
+        'loot': 0.2,
+        'move': 0.1,
+        'chat': 0.1
+    })
+    
+    # Prioridad (0 = máxima) y validez en segundos por tipo de acción;
+    # las que falten usan los valores por defecto de ActionScheduler
+    action_priorities: Dict[str, int] = field(default_factory=dict)
+    action_ttls: Dict[str, float] = field(default_factory=dict)
+    
+    # Cooldowns: duración por grupo y {'acción': {'group': ..., 'cooldown': ...}};
+    # se combinan con los valores por defecto de CooldownTracker
+    cooldown_groups: Dict[str, float] = field(default_factory=dict)
+    action_cooldowns: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    
+    # Teclas de las acciones con nombre
+    action_keys: Dict[str, str] = field(default_factory=lambda: {
+        'heal': 'f1',
+        'mana_potion': 'f2',
+        'cure_poison': 'f3',     # exana pox
+        'cure_paralysis': 'f4',  # utani hur
+        'attack': 'space',
+        'food': 'f8',
+        'inventory': 'i'
+    })
     
     def __post_init__(self):
         """Validación y carga de configuración desde archivo"""
@@ -147,6 +239,18 @@ class Settings:
                 return color_dict
         return None
     
+    def get_action_key(self, action: str) -> Optional[str]:
+        """
+        Obtiene la tecla asignada a una acción
+        
+        Args:
+            action: Nombre de la acción (heal, mana_potion, food...)
+        
+        Returns:
+            Tecla o None si no está configurada
+        """
+        return self.action_keys.get(action)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convierte la configuración a diccionario"""
         return {k: getattr(self, k) for k in self.__dataclass_fields__.keys()}
@@ -167,5 +271,8 @@ class Settings:
         print(f"💙 MP emergencia: {self.emergency_mp_threshold}%")
         print(f"🩹 Auto-curación: {'✅' if self.auto_heal_enabled else '❌'}")
         print(f"🔵 Auto-maná: {'✅' if self.auto_mana_enabled else '❌'}")
+        print(f"🧪 Auto-cura de condiciones: {'✅' if self.auto_cure_enabled else '❌'}")
+        print(f"⚔️  Auto-ataque: {'✅' if self.auto_attack_enabled else '❌'}")
+        print(f"💰 Auto-loot: {'✅' if self.auto_loot_enabled else '❌'}")
         
         print("="*50)
\ No newline at end of file
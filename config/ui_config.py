@@ -97,6 +97,9 @@ class UIConfig:
         self.screen_height: int = 1080
         self.loaded = False
         
+        # Huella de la disposición para reutilizarla al arrancar
+        self.fingerprint: Dict[str, Any] = {}
+        
         # Cargar si el archivo existe
         if Path(self.config_file).exists():
             self.load_from_file(self.config_file)
@@ -128,6 +131,7 @@ class UIConfig:
             screen_info = data.get('screen', {})
             self.screen_width = screen_info.get('width', 1920)
             self.screen_height = screen_info.get('height', 1080)
+            self.fingerprint = data.get('fingerprint', {})
             
             self.loaded = True
             print(f"✅ Configuración de UI cargada desde {config_file}")
@@ -161,7 +165,8 @@ class UIConfig:
                     'height': self.screen_height,
                     'timestamp': datetime.now().isoformat()
                 },
-                'elements': [element.to_dict() for element in self.elements.values()]
+                'elements': [element.to_dict() for element in self.elements.values()],
+                'fingerprint': self.fingerprint
             }
             
             # Asegurar que el directorio existe
@@ -257,6 +262,7 @@ class UIConfig:
     def clear(self):
         """Elimina todos los elementos"""
         self.elements.clear()
+        self.fingerprint = {}
         print("🧹 Configuración de UI limpiada")
     
     def update_positions(self, positions: Dict[str, Dict]):
@@ -0,0 +1,295 @@
+"""
+Clase ActionScheduler - Cola de acciones por prioridad y plazo
+"""
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+from core.cooldown_tracker import CooldownTracker
+
+# Niveles de prioridad (menor = antes)
+PRIORITY_CRITICAL = 0
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 2
+PRIORITY_LOW = 3
+
+# Prioridad de cada tipo de acción: curas y maná adelantan a todo lo demás
+DEFAULT_PRIORITIES = {
+    'heal': PRIORITY_CRITICAL,
+    'mana_potion': PRIORITY_CRITICAL,
+    'cure_paralysis': PRIORITY_HIGH,
+    'cure_poison': PRIORITY_HIGH,
+    'attack': PRIORITY_HIGH,
+    'spell': PRIORITY_HIGH,
+    'hotkey': PRIORITY_NORMAL,
+    'food': PRIORITY_NORMAL,
+    'inventory': PRIORITY_NORMAL,
+    'loot': PRIORITY_NORMAL,
+    'move': PRIORITY_LOW,
+    'chat': PRIORITY_LOW
+}
+
+# Validez (segundos) de cada tipo de acción: pasado el plazo ya no tiene sentido
+DEFAULT_TTLS = {
+    'heal': 0.5,
+    'mana_potion': 1.0,
+    'cure_paralysis': 1.0,
+    'cure_poison': 1.0,
+    'attack': 1.0,
+    'spell': 1.0,
+    'loot': 5.0,
+    'move': 2.0,
+    'chat': 30.0
+}
+
+
+@dataclass(order=True)
+class ScheduledAction:
+    """Acción en cola, ordenada por (prioridad, plazo, orden de llegada)"""
+    priority: int
+    deadline: float
+    seq: int
+    name: str = field(compare=False)
+    func: Callable[..., Any] = field(compare=False)
+    args: Tuple = field(compare=False, default=())
+    kwargs: Dict[str, Any] = field(compare=False, default_factory=dict)
+    future: Future = field(compare=False, default_factory=Future)
+    key: str = field(compare=False, default='')
+    removed: bool = field(compare=False, default=False)
+
+
+class ActionScheduler:
+    """
+    Montículo de acciones pendientes con prioridad, caducidad y fusión
+
+    - Una acción más prioritaria sale antes que cualquier otra en cola,
+      aunque llegue después (una cura adelanta al loot o al chat).
+    - Las acciones cuyo plazo vence en cola se descartan en lugar de
+      enviarse tarde.
+    - Encolar una acción con la misma clave que otra pendiente no añade
+      otra: se refresca la pendiente y se devuelve su mismo Future.
+    - Con un CooldownTracker, una acción en cooldown espera en cola (o se
+      descarta si no quedará libre a tiempo) sin frenar a las demás.
+    """
+
+    def __init__(self, priorities: Optional[Dict[str, int]] = None,
+                 ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 5.0,
+                 cooldowns: Optional[CooldownTracker] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa la cola
+
+        Args:
+            priorities: Prioridad por tipo de acción (se combina con DEFAULT_PRIORITIES)
+            ttls: Validez en segundos por tipo (se combina con DEFAULT_TTLS)
+            default_ttl: Validez de los tipos sin entrada
+            cooldowns: Modelo de cooldowns; una acción en cooldown espera en
+                       cola sin bloquear a las demás (None = sin control)
+            clock: Reloj monotónico (inyectable para tests)
+        """
+        self.priorities = {**DEFAULT_PRIORITIES, **(priorities or {})}
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.cooldowns = cooldowns
+        self.clock = clock
+
+        self._heap: List[ScheduledAction] = []
+        self._pending: Dict[str, ScheduledAction] = {}
+        self._seq = itertools.count()
+        self._condition = threading.Condition()
+
+        self.stats = {'pushed': 0, 'dispatched': 0, 'expired': 0, 'collapsed': 0, 'cancelled': 0,
+                      'gated': 0}
+
+    def push(self, name: str, func: Callable[..., Any], *args,
+             priority: Optional[int] = None, since: Optional[float] = None,
+             ttl: Optional[float] = None, key: Optional[str] = None, **kwargs) -> Future:
+        """
+        Encola una acción
+
+        Args:
+            name: Tipo de acción (decide prioridad y validez por defecto)
+            func: Llamada que envía la entrada
+            *args, **kwargs: Argumentos de func
+            priority: Prioridad explícita (None = la del tipo)
+            since: Instante desde el que cuenta la validez (None = ahora);
+                   normalmente la captura que motivó la acción
+            ttl: Validez explícita en segundos (None = la del tipo)
+            key: Clave de fusión (None = el tipo de acción)
+
+        Returns:
+            Future con el resultado de func (cancelado si caduca)
+        """
+        if priority is None:
+            priority = self.priorities.get(name, PRIORITY_NORMAL)
+        if ttl is None:
+            ttl = self.ttls.get(name, self.default_ttl)
+        deadline = (self.clock() if since is None else since) + ttl
+        key = name if key is None else key
+
+        with self._condition:
+            previous = self._pending.get(key)
+            if previous is not None:
+                # Fusionar: la decisión más reciente sustituye a la pendiente
+                previous.removed = True
+                future = previous.future
+                priority = min(priority, previous.priority)
+                deadline = max(deadline, previous.deadline)
+                self.stats['collapsed'] += 1
+            else:
+                future = Future()
+                self.stats['pushed'] += 1
+
+            entry = ScheduledAction(priority, deadline, next(self._seq), name, func,
+                                    args, kwargs, future, key)
+            heapq.heappush(self._heap, entry)
+            self._pending[key] = entry
+            self._condition.notify()
+        return future
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[ScheduledAction]:
+        """
+        Saca la acción más prioritaria que siga vigente y fuera de cooldown
+
+        Args:
+            timeout: Espera máxima si no hay ninguna lista (None = sin límite)
+
+        Returns:
+            La acción, o None si se agotó la espera
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                entry, next_ready = self._pop_valid()
+                if entry is not None:
+                    self.stats['dispatched'] += 1
+                    return entry
+
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                if next_ready is not None:
+                    remaining = next_ready if remaining is None else min(remaining, next_ready)
+                self._condition.wait(remaining)
+
+    def wait_urgent(self, timeout: float, priority: int) -> bool:
+        """
+        Espera hasta timeout salvo que llegue una acción más prioritaria
+
+        Args:
+            timeout: Espera máxima en segundos
+            priority: Solo interrumpen acciones con prioridad menor que esta
+
+        Returns:
+            True si la espera se cortó por una acción urgente
+        """
+        end = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                remaining = end - time.monotonic()
+                now = self.clock()
+                urgent = [self._cooldown_left(entry, now) for entry in self._pending.values()
+                          if entry.priority < priority]
+                if any(wait <= 0 for wait in urgent):
+                    return True
+                if remaining <= 0:
+                    return False
+                # Una urgente en cooldown interrumpe en cuanto quede libre
+                self._condition.wait(min([remaining] + urgent))
+
+    def requeue(self, entry: ScheduledAction):
+        """Devuelve a la cola una acción sacada y no enviada"""
+        with self._condition:
+            if entry.key in self._pending:
+                # Ya hay una decisión más reciente en cola
+                entry.future.cancel()
+                return
+            if entry.future.done():
+                return
+            heapq.heappush(self._heap, entry)
+            self._pending[entry.key] = entry
+            self.stats['dispatched'] -= 1
+            self._condition.notify()
+
+    def clear(self) -> int:
+        """
+        Cancela todas las acciones en cola
+
+        Returns:
+            Número de acciones canceladas
+        """
+        with self._condition:
+            cancelled = 0
+            for entry in self._heap:
+                if not entry.removed and entry.future.cancel():
+                    cancelled += 1
+            self._heap.clear()
+            self._pending.clear()
+            self.stats['cancelled'] += cancelled
+            return cancelled
+
+    def peek(self) -> Optional[ScheduledAction]:
+        """Siguiente acción sin sacarla (puede estar caducada)"""
+        with self._condition:
+            for entry in sorted(self._heap):
+                if not entry.removed:
+                    return entry
+            return None
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def _cooldown_left(self, entry: ScheduledAction, now: float) -> float:
+        """Segundos de cooldown que le quedan a una acción (con el lock)"""
+        if self.cooldowns is None:
+            return 0.0
+        return self.cooldowns.ready_in(entry.name, now)
+
+    def _pop_valid(self) -> Tuple[Optional[ScheduledAction], Optional[float]]:
+        """
+        Saca la primera entrada vigente y lista (con el lock)
+
+        Descarta las caducadas y las que no saldrán de cooldown antes de su
+        plazo; las que sí lo harán se quedan en cola.
+
+        Returns:
+            (entrada o None, segundos hasta que la primera retenida quede lista)
+        """
+        now = self.clock()
+        held = []
+        next_ready = None
+        result = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if entry.removed:
+                continue
+            if entry.deadline < now:
+                del self._pending[entry.key]
+                entry.future.cancel()
+                self.stats['expired'] += 1
+                continue
+
+            wait = self._cooldown_left(entry, now)
+            if wait > 0:
+                if now + wait > entry.deadline:
+                    del self._pending[entry.key]
+                    entry.future.cancel()
+                    self.stats['gated'] += 1
+                else:
+                    held.append(entry)
+                    next_ready = wait if next_ready is None else min(next_ready, wait)
+                continue
+
+            del self._pending[entry.key]
+            result = entry
+            break
+
+        for entry in held:
+            heapq.heappush(self._heap, entry)
+        return result, next_ready
@@ -0,0 +1,305 @@
+"""
+Clase AsyncPipeline - Runtime asyncio por etapas con colas acotadas
+"""
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.screen_capturer import Frame
+
+
+@dataclass
+class StageMetrics:
+    """Métricas de una etapa del pipeline"""
+    name: str
+    processed: int = 0
+    dropped: int = 0
+    errors: int = 0
+    busy_time: float = 0.0
+    max_queue_depth: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def occupancy(self) -> float:
+        """Fracción del tiempo que la etapa estuvo trabajando"""
+        elapsed = time.monotonic() - self.started_at
+        return self.busy_time / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte a diccionario"""
+        return {
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'occupancy': self.occupancy,
+            'max_queue_depth': self.max_queue_depth
+        }
+
+
+class DropOldestQueue:
+    """
+    Cola asyncio acotada que descarta el elemento más antiguo al llenarse
+
+    asyncio.Queue no expone su contenido, así que los elementos en cola se
+    reflejan en un deque propio (mismo orden FIFO, solo se usa desde el bucle).
+    """
+
+    def __init__(self, maxsize: int, metrics: StageMetrics):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.metrics = metrics
+        self._items: Deque[Any] = deque()
+
+    def put(self, item: Any):
+        """Encola sin bloquear; si está llena descarta el más antiguo"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self._items.popleft()
+            self.metrics.dropped += 1
+        self.queue.put_nowait(item)
+        self._items.append(item)
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.queue.qsize())
+
+    async def get(self) -> Any:
+        """Espera el siguiente elemento"""
+        item = await self.queue.get()
+        self._items.popleft()
+        return item
+
+    def qsize(self) -> int:
+        """Elementos en cola"""
+        return self.queue.qsize()
+
+    def items(self) -> List[Any]:
+        """Copia de los elementos en cola, del más antiguo al más nuevo"""
+        return list(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._items
+
+
+class AsyncPipeline:
+    """Captura → detección → estado → acción como etapas independientes"""
+
+    def __init__(self, capture: Callable[[], np.ndarray],
+                 detect: Callable[[Frame], Dict[str, Any]],
+                 update: Callable[[Dict[str, Any]], None],
+                 decide: Callable[[], List[str]],
+                 act: Callable[[str, float, float], Any],
+                 rate_hz: float, queue_size: int = 2):
+        """
+        Inicializa el pipeline
+
+        Args:
+            capture: Captura de pantalla (bloqueante, se ejecuta en un hilo)
+            detect: Detección sobre un Frame (bloqueante, en un hilo)
+            update: Aplica el resultado de la detección al estado
+            decide: Devuelve las acciones a ejecutar según el estado
+            act: Ejecuta una acción; recibe (acción, instante de captura,
+                 instante de decisión) (bloqueante, en el hilo de entrada)
+            rate_hz: Frecuencia de captura
+            queue_size: Capacidad de las colas entre etapas
+        """
+        self.capture = capture
+        self.detect = detect
+        self.update = update
+        self.decide = decide
+        self.act = act
+        self.period = 1.0 / rate_hz
+        self.queue_size = queue_size
+
+        # Etapas lentas que analizan el último frame a su propio ritmo
+        self.slow_stages: Dict[str, tuple] = {}
+
+        self.metrics: Dict[str, StageMetrics] = {}
+        self.queues: Dict[str, DropOldestQueue] = {}
+        self.is_running = False
+        self._stop_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def add_slow_stage(self, name: str, func: Callable[[np.ndarray], Any], rate_hz: float):
+        """
+        Añade una etapa lenta (minimapa, OCR, inventario...)
+
+        La etapa corre en su propio hilo a la vez que la detección: si lee o
+        modifica estado compartido con ella (posiciones de la UI, detectores)
+        debe protegerlo con el mismo cerrojo.
+
+        Args:
+            name: Nombre de la etapa
+            func: Análisis sobre una captura (bloqueante, en su propio hilo)
+            rate_hz: Frecuencia máxima de la etapa
+        """
+        self.slow_stages[name] = (func, 1.0 / rate_hz)
+
+    def run(self, duration: Optional[float] = None):
+        """
+        Ejecuta el pipeline hasta stop() o durante duration segundos
+
+        Args:
+            duration: Duración máxima en segundos (None = sin límite)
+        """
+        asyncio.run(self.run_async(duration))
+
+    async def run_async(self, duration: Optional[float] = None):
+        """Versión asíncrona de run()"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self.is_running = True
+
+        names = ['capture', 'detect', 'state', 'act'] + list(self.slow_stages)
+        self.metrics = {name: StageMetrics(name) for name in names}
+        self.queues = {
+            'detect': DropOldestQueue(self.queue_size, self.metrics['detect']),
+            'state': DropOldestQueue(self.queue_size, self.metrics['state']),
+            'act': DropOldestQueue(self.queue_size, self.metrics['act']),
+        }
+        for name in self.slow_stages:
+            self.queues[name] = DropOldestQueue(1, self.metrics[name])
+
+        # Un hilo por etapa bloqueante: una etapa lenta nunca ocupa el de otra
+        executors = {name: ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+                     for name in ['capture', 'detect', 'act'] + list(self.slow_stages)}
+
+        tasks = [
+            asyncio.create_task(self._capture_stage(executors['capture'])),
+            asyncio.create_task(self._detect_stage(executors['detect'])),
+            asyncio.create_task(self._state_stage()),
+            asyncio.create_task(self._act_stage(executors['act'])),
+        ]
+        for name, (func, period) in self.slow_stages.items():
+            tasks.append(asyncio.create_task(self._slow_stage(name, func, period, executors[name])))
+
+        try:
+            if duration is None:
+                await self._stop_event.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), duration)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.is_running = False
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+
+    def stop(self):
+        """Detiene el pipeline (se puede llamar desde cualquier hilo)"""
+        self.is_running = False
+        if self._loop is not None and not self._loop.is_closed() and self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Ocupación, descartes y profundidad de cola por etapa"""
+        metrics = {}
+        for name, stage in self.metrics.items():
+            metrics[name] = stage.to_dict()
+            queue = self.queues.get(name)
+            metrics[name]['queue_depth'] = queue.qsize() if queue else 0
+        return metrics
+
+    async def _run_blocking(self, name: str, executor: ThreadPoolExecutor, func, *args):
+        """Ejecuta una llamada bloqueante en un hilo y mide la ocupación"""
+        stage = self.metrics[name]
+        start = time.monotonic()
+        try:
+            return await self._loop.run_in_executor(executor, func, *args)
+        finally:
+            stage.busy_time += time.monotonic() - start
+
+    async def _capture_stage(self, executor: ThreadPoolExecutor):
+        """Captura a frecuencia fija y reparte el frame a las etapas"""
+        stage = self.metrics['capture']
+        deadline = self._loop.time()
+        tick = 0
+
+        while self.is_running:
+            delay = deadline - self._loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            captured_at = time.monotonic()
+            try:
+                image = await self._run_blocking('capture', executor, self.capture)
+            except Exception:
+                stage.errors += 1
+                image = None
+
+            if image is not None:
+                frame = Frame(tick, captured_at, image)
+                self.queues['detect'].put(frame)
+                for name in self.slow_stages:
+                    self.queues[name].put(frame)
+                stage.processed += 1
+
+            tick += 1
+            deadline += self.period
+            now = self._loop.time()
+            if now > deadline:
+                deadline += (int((now - deadline) // self.period) + 1) * self.period
+
+    async def _detect_stage(self, executor: ThreadPoolExecutor):
+        """Detección del estado sobre el frame más reciente"""
+        stage = self.metrics['detect']
+        while self.is_running:
+            frame = await self.queues['detect'].get()
+            try:
+                status = await self._run_blocking('detect', executor, self.detect, frame)
+                self.queues['state'].put((frame, status))
+                stage.processed += 1
+            except Exception:
+                stage.errors += 1
+
+    async def _state_stage(self):
+        """Actualiza el estado y encola las acciones decididas"""
+        stage = self.metrics['state']
+        while self.is_running:
+            frame, status = await self.queues['state'].get()
+            start = time.monotonic()
+            try:
+                self.update(status)
+                actions = self.decide()
+                decided_at = time.monotonic()
+                pending = {item[0] for item in self.queues['act'].items()}
+                for action in actions:
+                    if action not in pending:
+                        self.queues['act'].put((action, frame.captured_at, decided_at))
+                stage.processed += 1
+            except Exception:
+                stage.errors += 1
+            finally:
+                stage.busy_time += time.monotonic() - start
+
+    async def _act_stage(self, executor: ThreadPoolExecutor):
+        """Envía las acciones de una en una por el hilo de entrada"""
+        stage = self.metrics['act']
+        while self.is_running:
+            action, captured_at, decided_at = await self.queues['act'].get()
+            try:
+                await self._run_blocking('act', executor, self.act, action, captured_at, decided_at)
+                stage.processed += 1
+            except Exception:
+                stage.errors += 1
+
+    async def _slow_stage(self, name: str, func, period: float, executor: ThreadPoolExecutor):
+        """Analiza el último frame disponible como mucho una vez por periodo"""
+        stage = self.metrics[name]
+        while self.is_running:
+            next_run = self._loop.time() + period
+            frame = await self.queues[name].get()
+            try:
+                await self._run_blocking(name, executor, func, frame.image)
+                stage.processed += 1
+            except Exception:
+                stage.errors += 1
+
+            delay = next_run - self._loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
@@ -1,18 +1,21 @@
 """
 Clase BotActions - Manejo de acciones automatizadas del bot
 """
-import pyautogui
 import time
 import random
 import threading
+from concurrent.futures import Future
 from typing import Optional, Dict, Tuple, List, Any
 from dataclasses import dataclass
-import keyboard
-from pynput import mouse
 
 from core.screen_capturer import ScreenCapturer
+from core.action_scheduler import ActionScheduler
+from core.cooldown_tracker import CooldownTracker
+from core.input_backend import InputBackend, create_input_backend
+from core.input_dispatcher import InputDispatcher
 from config.settings import Settings
 from utils.logger import AppLogger
+from utils.performance_monitor import LatencyTracker
 
 @dataclass
 class ActionResult:
@@ -22,19 +25,33 @@ class ActionResult:
     duration: float
     timestamp: float
     
+    # Instantes monotónicos de la reacción (solo acciones lanzadas por el bucle)
+    captured_at: Optional[float] = None
+    decided_at: Optional[float] = None
+    dispatched_at: Optional[float] = None
+    
+    @property
+    def reaction_latency(self) -> Optional[float]:
+        """Segundos desde la captura que motivó la acción hasta el envío de la tecla"""
+        if self.captured_at is None or self.dispatched_at is None:
+            return None
+        return self.dispatched_at - self.captured_at
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convierte a diccionario"""
         return {
             'success': self.success,
             'message': self.message,
             'duration': self.duration,
-            'timestamp': self.timestamp
+            'timestamp': self.timestamp,
+            'reaction_latency': self.reaction_latency
         }
 
 class BotActions:
     """Clase para manejar todas las acciones automatizadas del bot"""
     
-    def __init__(self, capturer: ScreenCapturer, settings: Settings, logger: AppLogger = None):
+    def __init__(self, capturer: ScreenCapturer, settings: Settings, logger: AppLogger = None,
+                 backend: Optional[InputBackend] = None):
         """
         Inicializa el manejador de acciones
         
@@ -42,24 +59,33 @@ class BotActions:
             capturer: Instancia de ScreenCapturer
             settings: Configuración del bot
             logger: Logger para registro
+            backend: Backend de entrada (None = el de settings.input_backend)
         """
         self.capturer = capturer
         self.settings = settings
         self.logger = logger or AppLogger()
-        
-        # Configurar pyautogui
-        pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.1
+        self.input = backend or create_input_backend(getattr(settings, 'input_backend', 'pyautogui'))
         
         # Estado de las acciones
         self.is_acting = False
-        self.action_queue = []
+        self.cooldowns = CooldownTracker(getattr(settings, 'cooldown_groups', None),
+                                         getattr(settings, 'action_cooldowns', None))
+        self.action_queue = ActionScheduler(getattr(settings, 'action_priorities', None),
+                                            getattr(settings, 'action_ttls', None),
+                                            cooldowns=self.cooldowns)
         self.action_history = []
         self.max_history_size = 100
         
-        # Control de ratón y teclado
-        self.mouse_listener = None
-        self.keyboard_listener = None
+        # Lector de la barra de acciones (opcional) para no pulsar slots en cooldown
+        self.action_bar = None
+        
+        # Latencias captura → decisión → envío por acción
+        self.latency = LatencyTracker()
+        self._dispatch = threading.local()
+        
+        # Hilo de entrada: envía en orden de prioridad lo encolado con submit()
+        self.dispatcher = InputDispatcher(getattr(settings, 'action_pauses', None),
+                                          scheduler=self.action_queue)
         
         # Bloqueo para operaciones concurrentes
         self.action_lock = threading.Lock()
@@ -86,7 +112,7 @@ class BotActions:
             self.logger.debug(f"Curando con tecla: {key}")
             
             # Presionar tecla de cura
-            pyautogui.press(key)
+            self._press(key)
             
             # Pequeña pausa aleatoria para parecer humano
             self._human_delay(0.1, 0.3)
@@ -124,7 +150,7 @@ class BotActions:
             self.logger.debug(f"Usando poción de maná con tecla: {key}")
             
             # Presionar tecla de maná
-            pyautogui.press(key)
+            self._press(key)
             
             self._human_delay(0.1, 0.3)
             
@@ -141,12 +167,14 @@ class BotActions:
             self.logger.error(f"Error en use_mana_potion: {e}")
             return result
     
-    def attack_target(self, attack_key: Optional[str] = None) -> ActionResult:
+    def attack_target(self, attack_key: Optional[str] = None,
+                      target_position: Optional[Tuple[int, int]] = None) -> ActionResult:
         """
         Ataca al objetivo actual
         
         Args:
             attack_key: Tecla de ataque (None = usar configuración)
+            target_position: Fila de la lista de batalla a atacar (None = usar tecla)
         
         Returns:
             Resultado de la acción
@@ -154,6 +182,21 @@ class BotActions:
         start_time = time.time()
         
         try:
+            if target_position:
+                x, y = target_position
+                self.logger.debug(f"Atacando objetivo en lista de batalla: ({x}, {y})")
+                
+                # Click en la fila de la lista de batalla
+                self._dispatch.at = time.monotonic()
+                self.input.click(x, y)
+                self._human_delay(0.2, 0.5)
+                
+                duration = time.time() - start_time
+                result = ActionResult(True, f"Ataque a objetivo en ({x}, {y})", duration, start_time)
+                self._add_to_history(result)
+                
+                return result
+            
             key = attack_key or self.settings.get_action_key('attack')
             if not key:
                 return ActionResult(False, "No hay tecla de ataque configurada", 0, start_time)
@@ -161,7 +204,7 @@ class BotActions:
             self.logger.debug(f"Atacando con tecla: {key}")
             
             # Presionar tecla de ataque
-            pyautogui.press(key)
+            self._press(key)
             
             self._human_delay(0.2, 0.5)
             
@@ -194,24 +237,25 @@ class BotActions:
             self.logger.debug("Intentando lootear...")
             
             # Guardar posición actual del ratón
-            original_pos = pyautogui.position()
+            original_pos = self.input.position()
             
             # Mover a la posición del cuerpo si se especifica
             if position:
                 x, y = position
-                pyautogui.moveTo(x, y, duration=0.2)
+                self.input.move_to(x, y, duration=0.2)
                 self._human_delay(0.1, 0.2)
             
             # Ctrl + Click derecho (común para loot en Tibia)
-            pyautogui.keyDown('ctrl')
+            self._dispatch.at = time.monotonic()
+            self.input.key_down('ctrl')
             self._human_delay(0.1, 0.2)
-            pyautogui.rightClick()
+            self.input.right_click()
             self._human_delay(0.1, 0.2)
-            pyautogui.keyUp('ctrl')
+            self.input.key_up('ctrl')
             
             # Volver a posición original
             if position:
-                pyautogui.moveTo(original_pos, duration=0.2)
+                self.input.move_to(*original_pos, duration=0.2)
             
             self._human_delay(0.3, 0.5)
             
@@ -248,7 +292,7 @@ class BotActions:
             self.logger.debug(f"Abriendo/cerrando inventario con tecla: {key}")
             
             # Presionar tecla del inventario
-            pyautogui.press(key)
+            self._press(key)
             
             # Esperar a que se abra/cierre
             self._human_delay(0.3, 0.5)
@@ -283,20 +327,20 @@ class BotActions:
             self.logger.debug(f"Moviendo a posición: ({screen_x}, {screen_y})")
             
             # Guardar posición actual
-            original_x, original_y = pyautogui.position()
+            original_x, original_y = self.input.position()
             
             # Mover ratón a la posición objetivo
-            pyautogui.moveTo(screen_x, screen_y, duration=0.3)
+            self.input.move_to(screen_x, screen_y, duration=0.3)
             self._human_delay(0.1, 0.2)
             
             # Click izquierdo para mover
-            pyautogui.click()
+            self.input.click()
             
             # Pequeña pausa después del movimiento
             self._human_delay(0.5, 1.0)
             
             # Volver a posición original (opcional)
-            # pyautogui.moveTo(original_x, original_y, duration=0.3)
+            # self.input.move_to(original_x, original_y, duration=0.3)
             
             duration = time.time() - start_time
             result = ActionResult(True, f"Movido a ({screen_x}, {screen_y})", duration, start_time)
@@ -324,17 +368,20 @@ class BotActions:
         """
         start_time = time.time()
         
+        if not self._slot_ready(spell_key):
+            return ActionResult(False, f"Hechizo {spell_key} en cooldown", 0, start_time)
+        
         try:
             self.logger.debug(f"Lanzando hechizo con tecla: {spell_key}")
             
             # Presionar tecla del hechizo
-            pyautogui.press(spell_key)
+            self._press(spell_key)
             self._human_delay(0.2, 0.3)
             
             # Si hay posición objetivo, hacer click
             if target_pos:
                 x, y = target_pos
-                pyautogui.click(x=x, y=y)
+                self.input.click(x, y)
                 self._human_delay(0.1, 0.2)
             
             duration = time.time() - start_time
@@ -370,7 +417,7 @@ class BotActions:
             self.logger.debug(f"Comiendo con tecla: {key}")
             
             # Presionar tecla de comida
-            pyautogui.press(key)
+            self._press(key)
             
             # Comer toma tiempo
             self._human_delay(0.5, 1.0)
@@ -400,6 +447,9 @@ class BotActions:
         """
         start_time = time.time()
         
+        if not self._slot_ready(hotkey_name):
+            return ActionResult(False, f"Hotkey {hotkey_name} en cooldown o vacío", 0, start_time)
+        
         try:
             key = self.settings.get_action_key(hotkey_name)
             if not key:
@@ -408,7 +458,7 @@ class BotActions:
             self.logger.debug(f"Usando hotkey {hotkey_name} con tecla: {key}")
             
             # Presionar tecla
-            pyautogui.press(key)
+            self._press(key)
             
             self._human_delay(0.1, 0.3)
             
@@ -442,7 +492,7 @@ class BotActions:
             self.logger.debug(f"Enviando mensaje al chat {channel}: {message[:50]}...")
             
             # Presionar Enter para abrir chat
-            pyautogui.press('enter')
+            self.input.press('enter')
             self._human_delay(0.1, 0.2)
             
             # Escribir canal si es necesario
@@ -454,15 +504,15 @@ class BotActions:
                 }.get(channel, "")
                 
                 if channel_prefix:
-                    pyautogui.write(channel_prefix)
+                    self.input.write(channel_prefix)
                     self._human_delay(0.1, 0.2)
             
             # Escribir mensaje
-            pyautogui.write(message)
+            self.input.write(message)
             self._human_delay(0.1, 0.2)
             
             # Presionar Enter para enviar
-            pyautogui.press('enter')
+            self.input.press('enter')
             
             self._human_delay(0.2, 0.4)
             
@@ -479,6 +529,83 @@ class BotActions:
             self.logger.error(f"Error en send_chat_message: {e}")
             return result
     
+    def perform(self, name: str, handler, captured_at: Optional[float] = None,
+                decided_at: Optional[float] = None) -> ActionResult:
+        """
+        Ejecuta una acción decidida por el bucle y registra sus latencias
+        
+        Args:
+            name: Nombre de la acción (clave de los histogramas)
+            handler: Método de acción sin argumentos (p. ej. heal_character)
+            captured_at: Instante monotónico de la captura que la motivó
+            decided_at: Instante monotónico de la decisión
+        
+        Returns:
+            Resultado de la acción con los instantes de la reacción
+        """
+        self._dispatch.at = None
+        result = handler()
+        result.captured_at = captured_at
+        result.decided_at = decided_at
+        result.dispatched_at = self._dispatch.at
+        
+        if result.success and result.dispatched_at is not None:
+            self.cooldowns.record(name, result.dispatched_at)
+            if captured_at is not None:
+                self.latency.record(f"{name}.capture_to_dispatch", result.dispatched_at - captured_at)
+                if decided_at is not None:
+                    self.latency.record(f"{name}.capture_to_decision", decided_at - captured_at)
+            if decided_at is not None:
+                self.latency.record(f"{name}.decision_to_dispatch", result.dispatched_at - decided_at)
+        return result
+    
+    def submit(self, name: str, handler, captured_at: Optional[float] = None,
+               decided_at: Optional[float] = None, priority: Optional[int] = None,
+               key: Optional[str] = None) -> Future:
+        """
+        Versión no bloqueante de perform(): la acción se envía desde el hilo de entrada
+        
+        Las curas adelantan en la cola al loot, al movimiento y al chat; una
+        acción que sigue en cola cuando vence su validez (contada desde la
+        captura) se descarta, y repetir una acción pendiente no la duplica.
+        
+        Args:
+            name: Nombre de la acción (decide prioridad, validez y pausa)
+            handler: Método de acción sin argumentos
+            captured_at: Instante monotónico de la captura que la motivó
+            decided_at: Instante monotónico de la decisión
+            priority: Prioridad explícita (None = la del tipo de acción)
+            key: Clave de fusión en la cola (None = el nombre; p. ej. un loot por cadáver)
+        
+        Returns:
+            Future con el ActionResult (cancelado si caduca en cola)
+        """
+        return self.dispatcher.submit(name, self.perform, name, handler, captured_at, decided_at,
+                                      priority=priority, since=captured_at, key=key)
+    
+    def get_latency_report(self) -> Dict[str, Dict[str, Any]]:
+        """Percentiles p50/p95/p99 (ms) de las latencias por acción"""
+        return self.latency.get_report()
+    
+    def _press(self, key: str):
+        """Pulsa una tecla anotando el instante de envío"""
+        self._dispatch.at = time.monotonic()
+        self.input.press(key)
+    
+    def _slot_ready(self, action: str) -> bool:
+        """
+        Consulta la última lectura de la barra de acciones
+        
+        Args:
+            action: Nombre de la acción o tecla del slot
+        
+        Returns:
+            False solo si el slot está vacío o en cooldown
+        """
+        if self.action_bar is None:
+            return True
+        return self.action_bar.is_ready(action)
+    
     def _human_delay(self, min_delay: float = 0.1, max_delay: float = 0.3):
         """
         Espera un tiempo aleatorio (para parecer más humano)
@@ -487,8 +614,8 @@ class BotActions:
             min_delay: Mínimo delay en segundos
             max_delay: Máximo delay en segundos
         """
-        if self.settings.actions.human_like_variation > 0:
-            variation = self.settings.actions.human_like_variation
+        variation = getattr(self.settings, 'human_like_variation', 0.0)
+        if variation > 0:
             base_delay = random.uniform(min_delay, max_delay)
             random_factor = random.uniform(1 - variation, 1 + variation)
             delay = base_delay * random_factor
@@ -522,35 +649,17 @@ class BotActions:
         self.logger.info("Historial de acciones limpiado")
     
     def start_emergency_listeners(self):
-        """Inicia listeners de emergencia para detener el bot"""
-        def on_mouse_click(x, y, button, pressed):
-            if pressed and button == mouse.Button.middle:
-                self.logger.warning("🚨 Click medio detectado - Parada de emergencia")
-                self.emergency_stop()
-                return False
-        
-        def on_key_press(key):
-            try:
-                if hasattr(key, 'char') and key.char == '`':
-                    self.logger.warning("🚨 Tecla ` detectada - Parada de emergencia")
-                    self.emergency_stop()
-                    return False
-            except:
-                pass
-        
-        # Iniciar listeners
-        self.mouse_listener = mouse.Listener(on_click=on_mouse_click)
-        self.keyboard_listener = keyboard.on_press(on_key_press)
-        
-        self.mouse_listener.start()
+        """Inicia listeners de emergencia para detener el bot (click medio o tecla `)"""
+        def on_emergency(reason: str):
+            self.logger.warning(f"🚨 {reason} - Parada de emergencia")
+            self.emergency_stop()
+        
+        self.input.start_listeners(on_emergency)
         self.logger.info("Listeners de emergencia iniciados")
     
     def stop_emergency_listeners(self):
         """Detiene los listeners de emergencia"""
-        if self.mouse_listener:
-            self.mouse_listener.stop()
-        if self.keyboard_listener:
-            keyboard.unhook_all()
+        self.input.stop_listeners()
         self.logger.info("Listeners de emergencia detenidos")
     
     def emergency_stop(self):
@@ -570,11 +679,10 @@ class BotActions:
             self.action_queue.clear()
             
             # Mover ratón a esquina (activar failsafe de pyautogui)
-            screen_width, screen_height = self.capturer.get_screen_resolution()
-            pyautogui.moveTo(10, 10, duration=0.1)
+            self.input.move_to(10, 10, duration=0.1)
             
             # Presionar Escape para cancelar acciones
-            pyautogui.press('esc')
+            self.input.press('esc')
             
             # Detener listeners
             self.stop_emergency_listeners()
@@ -658,7 +766,8 @@ class BotActions:
             'is_acting': self.is_acting,
             'queue_size': len(self.action_queue),
             'history_size': len(self.action_history),
-            'emergency_listeners_active': self.mouse_listener is not None and self.mouse_listener.is_alive()
+            'emergency_listeners_active': self.input.listeners_active,
+            'input_backend': self.input.name
         }
     
     def print_status(self):
@@ -682,4 +791,13 @@ class BotActions:
                 success_icon = "✅" if action.success else "❌"
                 print(f"  {success_icon} {action.message} ({action.duration:.2f}s)")
         
+        # Latencias de reacción (captura → envío)
+        latencies = {name: summary for name, summary in self.get_latency_report().items()
+                     if name.endswith('.capture_to_dispatch')}
+        if latencies:
+            print("\n⏱️  Latencia captura → tecla:")
+            for name, summary in latencies.items():
+                print(f"  • {name.split('.')[0]}: p50 {summary['p50_ms']:.0f}ms, "
+                      f"p95 {summary['p95_ms']:.0f}ms, p99 {summary['p99_ms']:.0f}ms")
+        
         print("="*50)
\ No newline at end of file
@@ -4,10 +4,21 @@ Clase BotState - Manejo del estado del bot y del personaje
 import time
 import json
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+
+from core.hp_predictor import AlphaBetaFilter
+from core.status_aggregates import SeriesAggregates
+from core.status_history import (StatusHistory, STATUS_DTYPE, FLAG_HAS_POSITION,
+                                 FLAG_INVENTORY_KNOWN, FLAG_INVENTORY_OPEN,
+                                 encode_status, decode_status)
+
+# Condiciones con campo propio en CharacterStatus
+CONDITION_FIELDS = ('poisoned', 'burning', 'paralyzed', 'pz_locked', 'hungry')
+
 @dataclass
 class CharacterStatus:
     """Estado actual del personaje"""
@@ -19,6 +30,23 @@ class CharacterStatus:
     target_exists: bool = False
     in_combat: bool = False
     in_safe_zone: bool = False
+    captured_at: Optional[float] = None  # Instante monotónico de la captura leída
+    
+    # Condiciones leídas de los iconos de estado
+    poisoned: bool = False
+    burning: bool = False
+    paralyzed: bool = False
+    pz_locked: bool = False
+    hungry: bool = False
+    conditions: Dict[str, bool] = field(default_factory=dict)
+    
+    def copy(self) -> 'CharacterStatus':
+        """Copia independiente del estado"""
+        return replace(
+            self,
+            position=self.position.copy() if self.position else None,
+            conditions=self.conditions.copy()
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convierte a diccionario"""
@@ -31,6 +59,13 @@ class CharacterStatus:
             'target_exists': self.target_exists,
             'in_combat': self.in_combat,
             'in_safe_zone': self.in_safe_zone,
+            'captured_at': self.captured_at,
+            'poisoned': self.poisoned,
+            'burning': self.burning,
+            'paralyzed': self.paralyzed,
+            'pz_locked': self.pz_locked,
+            'hungry': self.hungry,
+            'conditions': self.conditions,
             'datetime': datetime.fromtimestamp(self.timestamp).isoformat()
         }
 
@@ -64,8 +99,8 @@ class BotState:
     def __init__(self):
         self.character_status = CharacterStatus(timestamp=time.time())
         self.bot_status = BotStatus()
-        self.status_history: List[CharacterStatus] = []
         self.max_history_size = 1000
+        self.status_history = StatusHistory(self.max_history_size)
         
         # Estadísticas
         self.stats = {
@@ -73,6 +108,8 @@ class BotState:
             'mp_low_count': 0,
             'heals_performed': 0,
             'mana_potions_used': 0,
+            'food_eaten': 0,
+            'conditions_cured': 0,
             'attacks_performed': 0,
             'errors_detected': 0,
             'start_time': time.time()
@@ -87,8 +124,19 @@ class BotState:
             'mp_change_alert': 15.0   # Cambio significativo en MP
         }
         
-        # Estado anterior para detección de cambios
-        self.previous_status: Optional[CharacterStatus] = None
+        # Agregados incrementales de HP y MP (media, mín/máx, ritmo, tiempo bajo umbral)
+        self.aggregates: Dict[str, SeriesAggregates] = {}
+        self._create_aggregates()
+        
+        # Curación predictiva: HP filtrado y predicho al instante en que llegaría la cura
+        self.hp_filter = AlphaBetaFilter()
+        self.predictive_healing = True
+        self.expected_latency = 0.15  # Segundos captura → envío (TibiaBot lo actualiza)
+        self.hp_fast_path_drop = 25.0  # Caída (puntos) de una lectura que cura sin esperar al filtro
+        
+        # Estado anterior para detección de cambios (una fila preasignada)
+        self._previous = np.zeros(1, dtype=STATUS_DTYPE)[0]
+        self._has_previous = False
         
         print("🤖 BotState inicializado")
     
@@ -100,28 +148,29 @@ class BotState:
             **kwargs: Campos a actualizar
         """
         # Guardar estado anterior
-        self.previous_status = CharacterStatus(
-            timestamp=self.character_status.timestamp,
-            hp_percentage=self.character_status.hp_percentage,
-            mp_percentage=self.character_status.mp_percentage,
-            inventory_open=self.character_status.inventory_open,
-            position=self.character_status.position.copy() if self.character_status.position else None,
-            target_exists=self.character_status.target_exists,
-            in_combat=self.character_status.in_combat,
-            in_safe_zone=self.character_status.in_safe_zone
-        )
+        encode_status(self.character_status, self._previous)
+        self._has_previous = True
         
         # Actualizar campos
         for key, value in kwargs.items():
             if hasattr(self.character_status, key):
                 setattr(self.character_status, key, value)
         
+        # Las condiciones con campo propio se reflejan también en él
+        if 'conditions' in kwargs:
+            for name, active in kwargs['conditions'].items():
+                if name in CONDITION_FIELDS:
+                    setattr(self.character_status, name, active)
+        
         # Actualizar timestamp
         self.character_status.timestamp = time.time()
         
         # Agregar al historial
         self._add_to_history()
         
+        # Actualizar agregados
+        self._update_aggregates()
+        
         # Actualizar estadísticas
         self._update_stats()
         
@@ -141,25 +190,34 @@ class BotState:
         
         self.bot_status.last_update = time.time()
     
+    @property
+    def previous_status(self) -> Optional[CharacterStatus]:
+        """Estado anterior a la última actualización (reconstruido, sin 'conditions')"""
+        if not self._has_previous:
+            return None
+        return decode_status(self._previous, CharacterStatus)
+    
     def _add_to_history(self):
-        """Agrega el estado actual al historial"""
-        # Crear una copia del estado actual
-        status_copy = CharacterStatus(
-            timestamp=self.character_status.timestamp,
-            hp_percentage=self.character_status.hp_percentage,
-            mp_percentage=self.character_status.mp_percentage,
-            inventory_open=self.character_status.inventory_open,
-            position=self.character_status.position.copy() if self.character_status.position else None,
-            target_exists=self.character_status.target_exists,
-            in_combat=self.character_status.in_combat,
-            in_safe_zone=self.character_status.in_safe_zone
-        )
-        
-        self.status_history.append(status_copy)
-        
-        # Mantener tamaño máximo
-        if len(self.status_history) > self.max_history_size:
-            self.status_history = self.status_history[-self.max_history_size:]
+        """Agrega el estado actual al historial (se escribe en el búfer circular)"""
+        self.status_history.append(self.character_status)
+    
+    def _create_aggregates(self):
+        """Crea los agregados con los umbrales actuales como niveles"""
+        self.aggregates = {
+            'hp': SeriesAggregates(levels={
+                'low_hp': self.thresholds['low_hp'],
+                'critical_hp': self.thresholds['critical_hp']
+            }),
+            'mp': SeriesAggregates(levels={'low_mp': self.thresholds['low_mp']})
+        }
+    
+    def _update_aggregates(self):
+        """Añade la lectura actual a los agregados (en el instante de su captura)"""
+        status = self.character_status
+        t = status.captured_at if status.captured_at is not None else time.monotonic()
+        self.aggregates['hp'].update(t, status.hp_percentage)
+        self.aggregates['mp'].update(t, status.mp_percentage)
+        self.hp_filter.update(t, status.hp_percentage)
     
     def _update_stats(self):
         """Actualiza estadísticas basadas en el estado actual"""
@@ -175,36 +233,35 @@ class BotState:
     
     def _detect_significant_changes(self):
         """Detecta cambios significativos en el estado"""
-        if self.previous_status is None:
+        if not self._has_previous:
             return
         
+        previous = self._previous
+        previous_flags = int(previous['flags'])
         changes = []
         
-        # Detectar cambio significativo en HP
-        if (self.character_status.hp_percentage is not None and 
-            self.previous_status.hp_percentage is not None):
-            hp_change = abs(self.character_status.hp_percentage - self.previous_status.hp_percentage)
+        # Detectar cambio significativo en HP (NaN = desconocido: la comparación da False)
+        if self.character_status.hp_percentage is not None:
+            hp_change = abs(self.character_status.hp_percentage - float(previous['hp']))
             if hp_change >= self.thresholds['hp_change_alert']:
                 changes.append(f"HP cambió {hp_change:.1f}%")
         
         # Detectar cambio significativo en MP
-        if (self.character_status.mp_percentage is not None and 
-            self.previous_status.mp_percentage is not None):
-            mp_change = abs(self.character_status.mp_percentage - self.previous_status.mp_percentage)
+        if self.character_status.mp_percentage is not None:
+            mp_change = abs(self.character_status.mp_percentage - float(previous['mp']))
             if mp_change >= self.thresholds['mp_change_alert']:
                 changes.append(f"MP cambió {mp_change:.1f}%")
         
         # Detectar cambio en posición
-        if (self.character_status.position and self.previous_status.position):
+        if self.character_status.position and previous_flags & FLAG_HAS_POSITION:
             pos1 = self.character_status.position
-            pos2 = self.previous_status.position
-            if pos1.get('x') != pos2.get('x') or pos1.get('y') != pos2.get('y'):
+            if pos1.get('x', 0) != previous['x'] or pos1.get('y', 0) != previous['y']:
                 changes.append(f"Posición cambió a ({pos1.get('x')}, {pos1.get('y')})")
         
         # Detectar cambio en inventario
-        if (self.character_status.inventory_open is not None and 
-            self.previous_status.inventory_open is not None and
-            self.character_status.inventory_open != self.previous_status.inventory_open):
+        if (self.character_status.inventory_open is not None and
+            previous_flags & FLAG_INVENTORY_KNOWN and
+            self.character_status.inventory_open != bool(previous_flags & FLAG_INVENTORY_OPEN)):
             state = "ABIERTO" if self.character_status.inventory_open else "CERRADO"
             changes.append(f"Inventario {state}")
         
@@ -241,6 +298,9 @@ class BotState:
             'bot': self.bot_status.to_dict(),
             'stats': self.get_stats(),
             'history_size': len(self.status_history),
+            'aggregates': {name: agg.to_dict() for name, agg in self.aggregates.items()},
+            'hp_prediction': {**self.hp_filter.to_dict(), 'predicted': self.predict_hp(),
+                              'horizon': self.expected_latency},
             'thresholds': self.thresholds
         }
     
@@ -262,15 +322,106 @@ class BotState:
             return False
         return self.character_status.mp_percentage < self.thresholds['low_mp']
     
+    def get_ewma(self, series: str) -> Optional[float]:
+        """
+        Media exponencial de una serie
+        
+        Args:
+            series: 'hp' o 'mp'
+        
+        Returns:
+            Media suavizada, o None sin lecturas
+        """
+        return self.aggregates[series].ewma
+    
+    def get_window_min(self, series: str) -> Optional[float]:
+        """Mínimo de la serie en la ventana de los agregados (2 s por defecto)"""
+        return self.aggregates[series].window_min()
+    
+    def get_window_max(self, series: str) -> Optional[float]:
+        """Máximo de la serie en la ventana de los agregados"""
+        return self.aggregates[series].window_max()
+    
+    def get_rate(self, series: str) -> Optional[float]:
+        """
+        Ritmo de cambio de la serie en la ventana
+        
+        Args:
+            series: 'hp' o 'mp'
+        
+        Returns:
+            Puntos porcentuales por segundo (negativo = perdiendo), o None
+            sin lecturas suficientes
+        """
+        return self.aggregates[series].rate()
+    
+    def time_below(self, series: str, threshold: str, now: Optional[float] = None) -> float:
+        """
+        Segundos seguidos con la serie por debajo de un umbral
+        
+        Args:
+            series: 'hp' o 'mp'
+            threshold: Nombre del umbral ('low_hp', 'critical_hp', 'low_mp')
+            now: Instante monotónico de referencia (None = última lectura)
+        """
+        return self.aggregates[series].time_below(threshold, now)
+    
+    def time_above(self, series: str, threshold: str, now: Optional[float] = None) -> float:
+        """Segundos seguidos con la serie por encima (o en) un umbral"""
+        return self.aggregates[series].time_above(threshold, now)
+    
+    def time_since_above(self, series: str, threshold: str,
+                         now: Optional[float] = None) -> Optional[float]:
+        """
+        Segundos desde la última lectura por encima de un umbral
+        
+        Por ejemplo time_since_above('mp', 'low_mp') es el tiempo desde la
+        última vez que el maná estaba repuesto. None si nunca lo estuvo.
+        """
+        return self.aggregates[series].time_since_above(threshold, now)
+    
+    def predict_hp(self, horizon: Optional[float] = None) -> Optional[float]:
+        """
+        HP esperado tras la última lectura
+        
+        Args:
+            horizon: Segundos desde la captura leída (None = expected_latency)
+        
+        Returns:
+            HP predicho en %, o None sin lecturas
+        """
+        if self.hp_filter.last_time is None:
+            return None
+        horizon = self.expected_latency if horizon is None else horizon
+        return self.hp_filter.predict(self.hp_filter.last_time + horizon)
+    
     def should_heal(self) -> bool:
-        """Determina si se debe curar"""
-        return self.is_hp_low()
+        """
+        Determina si se debe curar
+        
+        Con curación predictiva se decide con el HP filtrado y previsto para
+        cuando la cura llegue (captura + latencia esperada), así que una sola
+        lectura baja por ruido no cura. La excepción es una caída respecto a
+        lo esperado de al menos hp_fast_path_drop puntos hasta debajo de
+        low_hp: un golpe así cura en la misma lectura.
+        """
+        measured = self.character_status.hp_percentage
+        if not self.predictive_healing or measured is None:
+            return self.is_hp_low()
+        
+        predicted = self.predict_hp()
+        if predicted is None:
+            return self.is_hp_low()
+        if predicted < self.thresholds['low_hp']:
+            return True
+        return (measured < self.thresholds['low_hp']
+                and -self.hp_filter.last_residual >= self.hp_fast_path_drop)
     
     def should_use_mana_potion(self) -> bool:
         """Determina si se debe usar poción de maná"""
         return self.is_mp_low()
     
-    def get_status_history(self, limit: int = 100) -> List[CharacterStatus]:
+    def get_status_history(self, limit: int = 100) -> np.ndarray:
         """
         Obtiene el historial de estados
         
@@ -278,9 +429,15 @@ class BotState:
             limit: Número máximo de estados a devolver
         
         Returns:
-            Lista de estados históricos
+            Vista de solo lectura (STATUS_DTYPE) con los últimos estados, del
+            más antiguo al más reciente. Se sobrescribe con las siguientes
+            actualizaciones: copiar con .copy() si hay que conservarla.
         """
-        return self.status_history[-limit:] if self.status_history else []
+        return self.status_history.last(limit)
+    
+    def get_status_history_objects(self, limit: int = 100) -> List[CharacterStatus]:
+        """Historial como lista de CharacterStatus (crea objetos; fuera del bucle)"""
+        return [decode_status(record, CharacterStatus) for record in self.status_history.last(limit)]
     
     def save_state_to_file(self, filename: str = None):
         """
@@ -340,7 +497,13 @@ class BotState:
                 position=char_data.get('position'),
                 target_exists=char_data.get('target_exists', False),
                 in_combat=char_data.get('in_combat', False),
-                in_safe_zone=char_data.get('in_safe_zone', False)
+                in_safe_zone=char_data.get('in_safe_zone', False),
+                poisoned=char_data.get('poisoned', False),
+                burning=char_data.get('burning', False),
+                paralyzed=char_data.get('paralyzed', False),
+                pz_locked=char_data.get('pz_locked', False),
+                hungry=char_data.get('hungry', False),
+                conditions=char_data.get('conditions', {})
             )
             
             # Cargar estado del bot
@@ -360,6 +523,7 @@ class BotState:
             
             # Cargar umbrales
             self.thresholds = data.get('thresholds', self.thresholds.copy())
+            self._create_aggregates()
             
             print(f"📂 Estado cargado desde {filename}")
             return True
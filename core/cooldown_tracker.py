@@ -0,0 +1,174 @@
+"""
+Clase CooldownTracker - Cooldowns por grupo y por acción
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Exhaust compartido por grupo (segundos)
+DEFAULT_GROUPS = {
+    'healing': 1.0,   # Hechizos de cura
+    'attack': 2.0,    # Hechizos de ataque
+    'support': 2.0,   # Hechizos de apoyo (haste, utamo...)
+    'potion': 1.0     # Pociones y runas
+}
+
+# Grupo y cooldown propio de cada acción con nombre
+DEFAULT_ACTIONS = {
+    'heal': {'group': 'healing', 'cooldown': 1.0},
+    'mana_potion': {'group': 'potion', 'cooldown': 1.0},
+    'cure_poison': {'group': 'healing', 'cooldown': 6.0},
+    'cure_paralysis': {'group': 'support', 'cooldown': 2.0},
+    'spell': {'group': 'attack', 'cooldown': 2.0}
+}
+
+
+class CooldownTracker:
+    """
+    Modelo de cooldowns para no pulsar teclas que el servidor ignoraría
+
+    Cada envío arranca el temporizador de la acción y el de su grupo; las
+    lecturas del overlay de la barra de acciones corrigen el modelo cuando
+    están disponibles. Justo después de un envío el overlay aún no lo
+    refleja, así que las lecturas de ese margen se ignoran.
+    """
+
+    def __init__(self, groups: Optional[Dict[str, float]] = None,
+                 actions: Optional[Dict[str, Dict[str, Any]]] = None,
+                 clock: Callable[[], float] = time.monotonic, settle: float = 0.5):
+        """
+        Inicializa el modelo
+
+        Args:
+            groups: Duración por grupo (se combina con DEFAULT_GROUPS)
+            actions: {'acción': {'group': ..., 'cooldown': ...}} (se combina con DEFAULT_ACTIONS)
+            clock: Reloj monotónico (inyectable para tests)
+            settle: Segundos tras un envío en los que el overlay no corrige la acción
+        """
+        self.groups = {**DEFAULT_GROUPS, **(groups or {})}
+        self.actions = {**DEFAULT_ACTIONS, **(actions or {})}
+        self.clock = clock
+        self.settle = settle
+
+        # Instante en que vuelve a estar disponible cada acción / grupo
+        self._action_ready: Dict[str, float] = {}
+        self._group_ready: Dict[str, float] = {}
+        # Último envío de cada acción / grupo (para ignorar el overlay que aún no lo muestra)
+        self._recorded_at: Dict[str, float] = {}
+        self._group_recorded_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        self.stats = {'recorded': 0, 'observed': 0, 'ignored': 0, 'corrections': 0}
+
+    def record(self, action: str, at: Optional[float] = None):
+        """
+        Registra el envío de una acción
+
+        Args:
+            action: Nombre de la acción
+            at: Instante monotónico del envío (None = ahora)
+        """
+        spec = self.actions.get(action)
+        if spec is None:
+            return
+        at = self.clock() if at is None else at
+
+        with self._lock:
+            self._recorded_at[action] = at
+            self._action_ready[action] = at + spec.get('cooldown', 0.0)
+            group = spec.get('group')
+            if group is not None:
+                self._group_recorded_at[group] = at
+            if group in self.groups:
+                self._group_ready[group] = max(self._group_ready.get(group, 0.0),
+                                               at + self.groups[group])
+            self.stats['recorded'] += 1
+
+    def observe(self, action: str, fraction: float, at: Optional[float] = None) -> bool:
+        """
+        Corrige el modelo con el overlay de cooldown leído en pantalla
+
+        Args:
+            action: Nombre de la acción
+            fraction: Fracción del slot cubierta por el overlay (0 = lista)
+            at: Instante monotónico de la captura (None = ahora)
+
+        Returns:
+            True si la lectura se aplicó al modelo
+        """
+        spec = self.actions.get(action)
+        if spec is None:
+            return False
+        at = self.clock() if at is None else at
+        # El overlay muestra lo que falte de la acción o de su grupo
+        duration = max(spec.get('cooldown', 0.0), self.groups.get(spec.get('group'), 0.0))
+        observed = at + fraction * duration
+
+        with self._lock:
+            # Captura anterior a un envío de la acción o de su grupo, o demasiado
+            # cercana a él: el overlay aún no lo muestra y lo contradiría
+            recorded_at = max(self._recorded_at.get(action, float('-inf')),
+                              self._group_recorded_at.get(spec.get('group'), float('-inf')))
+            if at < recorded_at + self.settle:
+                self.stats['ignored'] += 1
+                return False
+
+            self.stats['observed'] += 1
+            predicted = self._ready_at(action)
+            if abs(predicted - observed) > 0.1 and (predicted > at or observed > at):
+                self.stats['corrections'] += 1
+
+            self._action_ready[action] = observed
+            group = spec.get('group')
+            if fraction <= 0 and group in self._group_ready:
+                # Lista en pantalla: su grupo tampoco la bloquea
+                self._group_ready[group] = min(self._group_ready[group], at)
+            return True
+
+    def observe_action_bar(self, action_bar, at: Optional[float] = None) -> int:
+        """
+        Aplica la última lectura de la barra de acciones
+
+        Args:
+            action_bar: ActionBarDetector con estados leídos
+            at: Instante monotónico de la captura leída
+
+        Returns:
+            Número de acciones corregidas con el overlay
+        """
+        observed = 0
+        for action in self.actions:
+            slot = action_bar.get_slot(action)
+            if slot is None or slot.empty:
+                continue
+            if self.observe(action, slot.cooldown, at):
+                observed += 1
+        return observed
+
+    def ready_in(self, action: str, now: Optional[float] = None) -> float:
+        """Segundos que faltan para poder enviar la acción (0 = lista)"""
+        now = self.clock() if now is None else now
+        with self._lock:
+            return max(0.0, self._ready_at(action) - now)
+
+    def is_ready(self, action: str, now: Optional[float] = None) -> bool:
+        """True si ni la acción ni su grupo están en cooldown"""
+        return self.ready_in(action, now) <= 0.0
+
+    def reset(self):
+        """Olvida todos los temporizadores"""
+        with self._lock:
+            self._action_ready.clear()
+            self._group_ready.clear()
+            self._recorded_at.clear()
+            self._group_recorded_at.clear()
+
+    def get_status(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Segundos restantes de cada acción conocida"""
+        return {action: self.ready_in(action, now) for action in self.actions}
+
+    def _ready_at(self, action: str) -> float:
+        """Instante en que la acción queda libre (con el lock)"""
+        spec = self.actions.get(action, {})
+        return max(self._action_ready.get(action, 0.0),
+                   self._group_ready.get(spec.get('group'), 0.0))
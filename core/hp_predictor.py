@@ -0,0 +1,111 @@
+"""
+Clase AlphaBetaFilter - Estimación y predicción del HP a partir de sus lecturas
+"""
+import math
+from typing import Any, Dict, Optional
+
+# Hueco entre lecturas (segundos) a partir del cual se reinicia el filtro
+DEFAULT_MAX_GAP = 1.0
+# Intervalo mínimo usado para el ritmo: lecturas casi simultáneas no lo disparan
+DEFAULT_MIN_DT = 0.01
+
+
+class AlphaBetaFilter:
+    """
+    Filtro alfa-beta sobre una serie en porcentaje (valor y ritmo)
+
+    Suaviza el ruido de lectura de las barras y estima el ritmo de cambio,
+    con lo que se puede predecir el valor en el instante en que llegará una
+    acción (captura + latencia) en lugar de reaccionar al valor ya viejo.
+    Cada actualización y cada predicción es O(1).
+    """
+
+    def __init__(self, alpha: float = 0.3, beta: float = 0.03,
+                 max_gap: float = DEFAULT_MAX_GAP, min_dt: float = DEFAULT_MIN_DT,
+                 min_value: float = 0.0, max_value: float = 100.0):
+        """
+        Inicializa el filtro
+
+        Args:
+            alpha: Peso de la lectura en el valor (0-1; más alto = menos suavizado)
+            beta: Peso de la lectura en el ritmo (0-1; más alto = reacciona antes)
+            max_gap: Segundos sin lecturas tras los que se reinicia
+            min_dt: Intervalo mínimo entre lecturas para estimar el ritmo
+            min_value: Límite inferior de las predicciones
+            max_value: Límite superior de las predicciones
+        """
+        if not 0 < alpha <= 1 or not 0 <= beta <= 1:
+            raise ValueError("alpha debe estar en (0, 1] y beta en [0, 1]")
+        self.alpha = alpha
+        self.beta = beta
+        self.max_gap = max_gap
+        self.min_dt = min_dt
+        self.min_value = min_value
+        self.max_value = max_value
+        self.reset()
+
+    def reset(self):
+        """Olvida el estado estimado"""
+        self.value: Optional[float] = None
+        self.rate = 0.0
+        self.last_time: Optional[float] = None
+        self.last_residual = 0.0
+        self.updates = 0
+
+    def update(self, t: float, measurement: Optional[float]) -> Optional[float]:
+        """
+        Incorpora una lectura
+
+        Args:
+            t: Instante monotónico de la captura leída
+            measurement: Valor leído (None se ignora)
+
+        Returns:
+            Valor estimado tras la lectura
+        """
+        if measurement is None or math.isnan(measurement):
+            return self.value
+        if self.last_time is not None and t <= self.last_time:
+            return self.value
+
+        if self.value is None or t - self.last_time > self.max_gap:
+            # Primera lectura o hueco largo: no hay ritmo fiable
+            self.value = measurement
+            self.rate = 0.0
+            self.last_residual = 0.0
+        else:
+            dt = t - self.last_time
+            predicted = self.value + self.rate * dt
+            residual = measurement - predicted
+            self.value = predicted + self.alpha * residual
+            self.rate += self.beta * residual / max(dt, self.min_dt)
+            self.last_residual = residual
+
+        self.last_time = t
+        self.updates += 1
+        return self.value
+
+    def predict(self, t: float) -> Optional[float]:
+        """
+        Valor esperado en el instante t
+
+        Args:
+            t: Instante monotónico (normalmente captura + latencia esperada)
+
+        Returns:
+            Valor predicho dentro de [min_value, max_value], o None sin lecturas
+        """
+        if self.value is None:
+            return None
+        horizon = max(0.0, t - self.last_time)
+        predicted = self.value + self.rate * horizon
+        return min(self.max_value, max(self.min_value, predicted))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte a diccionario"""
+        return {
+            'value': self.value,
+            'rate': self.rate,
+            'last_residual': self.last_residual,
+            'updates': self.updates
+        }
@@ -0,0 +1,259 @@
+"""
+Backends de entrada - Envío de teclado/ratón y listeners de emergencia
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+from utils.startup import lazy_import
+
+
+def _configure_pyautogui(module):
+    """Configuración de pyautogui al importarlo"""
+    module.FAILSAFE = True
+    # Sin pausa global: InputDispatcher pausa según el tipo de acción
+    module.PAUSE = 0.0
+
+
+# Solo se importan al enviar la primera acción con PyAutoGUIBackend
+pyautogui = lazy_import('pyautogui', on_import=_configure_pyautogui)
+keyboard = lazy_import('keyboard')
+mouse = lazy_import('pynput.mouse')
+
+# Tecla que dispara la parada de emergencia
+EMERGENCY_KEY = '`'
+
+
+class InputBackend(ABC):
+    """Interfaz de envío de entrada usada por BotActions"""
+
+    name = 'base'
+
+    @abstractmethod
+    def press(self, key: str):
+        """Pulsa y suelta una tecla"""
+
+    @abstractmethod
+    def key_down(self, key: str):
+        """Mantiene pulsada una tecla"""
+
+    @abstractmethod
+    def key_up(self, key: str):
+        """Suelta una tecla"""
+
+    @abstractmethod
+    def write(self, text: str):
+        """Escribe un texto"""
+
+    @abstractmethod
+    def click(self, x: Optional[int] = None, y: Optional[int] = None, button: str = 'left'):
+        """Click en (x, y) o en la posición actual del ratón"""
+
+    @abstractmethod
+    def move_to(self, x: int, y: int, duration: float = 0.0):
+        """Mueve el ratón"""
+
+    @abstractmethod
+    def position(self) -> Tuple[int, int]:
+        """Posición actual del ratón"""
+
+    @abstractmethod
+    def start_listeners(self, on_emergency: Callable[[str], None]):
+        """
+        Empieza a escuchar los gatillos de emergencia
+
+        Args:
+            on_emergency: Llamada con el motivo al detectar uno
+        """
+
+    @abstractmethod
+    def stop_listeners(self):
+        """Deja de escuchar los gatillos de emergencia"""
+
+    @property
+    def listeners_active(self) -> bool:
+        """True si los listeners de emergencia están activos"""
+        return False
+
+    def right_click(self, x: Optional[int] = None, y: Optional[int] = None):
+        """Click derecho"""
+        self.click(x, y, button='right')
+
+
+class PyAutoGUIBackend(InputBackend):
+    """Entrada real con pyautogui; emergencias con pynput (ratón) y keyboard"""
+
+    name = 'pyautogui'
+
+    def __init__(self):
+        self.mouse_listener = None
+        self.keyboard_hook = None
+
+    def press(self, key: str):
+        pyautogui.press(key)
+
+    def key_down(self, key: str):
+        pyautogui.keyDown(key)
+
+    def key_up(self, key: str):
+        pyautogui.keyUp(key)
+
+    def write(self, text: str):
+        pyautogui.write(text)
+
+    def click(self, x: Optional[int] = None, y: Optional[int] = None, button: str = 'left'):
+        pyautogui.click(x=x, y=y, button=button)
+
+    def move_to(self, x: int, y: int, duration: float = 0.0):
+        pyautogui.moveTo(x, y, duration=duration)
+
+    def position(self) -> Tuple[int, int]:
+        x, y = pyautogui.position()
+        return x, y
+
+    def start_listeners(self, on_emergency: Callable[[str], None]):
+        def on_mouse_click(x, y, button, pressed):
+            if pressed and button == mouse.Button.middle:
+                on_emergency("Click medio detectado")
+                return False
+
+        def on_key_press(event):
+            if getattr(event, 'name', None) == EMERGENCY_KEY:
+                on_emergency(f"Tecla {EMERGENCY_KEY} detectada")
+
+        self.mouse_listener = mouse.Listener(on_click=on_mouse_click)
+        self.keyboard_hook = keyboard.on_press(on_key_press)
+        self.mouse_listener.start()
+
+    def stop_listeners(self):
+        if self.mouse_listener:
+            self.mouse_listener.stop()
+            self.mouse_listener = None
+        if self.keyboard_hook:
+            keyboard.unhook_all()
+            self.keyboard_hook = None
+
+    @property
+    def listeners_active(self) -> bool:
+        return self.mouse_listener is not None and self.mouse_listener.is_alive()
+
+
+@dataclass
+class InputEvent:
+    """Entrada registrada por RecordingBackend"""
+    kind: str
+    args: Tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = 0.0  # Instante monotónico del envío
+
+
+class RecordingBackend(InputBackend):
+    """
+    Backend sin pantalla: anota cada entrada con su instante y no la envía
+
+    Sirve para medir rendimiento y latencias en máquinas sin display y para
+    probar la lógica de acciones y de emergencia.
+    """
+
+    name = 'recording'
+
+    def __init__(self, screen_size: Tuple[int, int] = (1920, 1080),
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            screen_size: Tamaño de la pantalla simulada
+            clock: Reloj monotónico (inyectable para tests)
+        """
+        self.screen_size = screen_size
+        self.clock = clock
+        self.events: List[InputEvent] = []
+        self._position = (screen_size[0] // 2, screen_size[1] // 2)
+        self._on_emergency: Optional[Callable[[str], None]] = None
+        self._lock = threading.Lock()
+
+    def press(self, key: str):
+        self._record('press', key)
+
+    def key_down(self, key: str):
+        self._record('key_down', key)
+
+    def key_up(self, key: str):
+        self._record('key_up', key)
+
+    def write(self, text: str):
+        self._record('write', text)
+
+    def click(self, x: Optional[int] = None, y: Optional[int] = None, button: str = 'left'):
+        if x is not None and y is not None:
+            self._position = (x, y)
+        self._record('click', *self._position, button=button)
+
+    def move_to(self, x: int, y: int, duration: float = 0.0):
+        self._position = (x, y)
+        self._record('move_to', x, y, duration=duration)
+
+    def position(self) -> Tuple[int, int]:
+        return self._position
+
+    def start_listeners(self, on_emergency: Callable[[str], None]):
+        self._on_emergency = on_emergency
+
+    def stop_listeners(self):
+        self._on_emergency = None
+
+    @property
+    def listeners_active(self) -> bool:
+        return self._on_emergency is not None
+
+    def trigger_emergency(self, reason: str = "Emergencia simulada") -> bool:
+        """
+        Simula un gatillo de emergencia (click medio o tecla)
+
+        Returns:
+            True si había listeners activos que lo recibieran
+        """
+        callback = self._on_emergency
+        if callback is None:
+            return False
+        callback(reason)
+        return True
+
+    def get_events(self, kind: Optional[str] = None) -> List[InputEvent]:
+        """Entradas registradas, opcionalmente solo de un tipo"""
+        with self._lock:
+            return [event for event in self.events if kind is None or event.kind == kind]
+
+    def clear(self):
+        """Borra las entradas registradas"""
+        with self._lock:
+            self.events.clear()
+
+    def _record(self, kind: str, *args, **kwargs):
+        """Anota una entrada"""
+        with self._lock:
+            self.events.append(InputEvent(kind, args, kwargs, self.clock()))
+
+
+# Backends disponibles por nombre (Settings.input_backend)
+INPUT_BACKENDS = {
+    PyAutoGUIBackend.name: PyAutoGUIBackend,
+    RecordingBackend.name: RecordingBackend
+}
+
+
+def create_input_backend(name: str = 'pyautogui') -> InputBackend:
+    """
+    Crea un backend de entrada por nombre
+
+    Args:
+        name: 'pyautogui' (entrada real) o 'recording' (sin pantalla)
+
+    Returns:
+        Instancia del backend
+    """
+    if name not in INPUT_BACKENDS:
+        raise ValueError(f"Backend de entrada desconocido: {name} "
+                         f"(disponibles: {', '.join(INPUT_BACKENDS)})")
+    return INPUT_BACKENDS[name]()
@@ -0,0 +1,142 @@
+"""
+Clase InputDispatcher - Hilo dedicado al envío de entrada (teclado y ratón)
+"""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from core.action_scheduler import ActionScheduler
+
+# Pausa tras cada acción si su tipo no tiene una propia (segundos)
+DEFAULT_PAUSE = 0.1
+
+
+class InputDispatcher:
+    """
+    Envía las acciones de una en una desde su propio hilo
+
+    Quien envía recibe un Future y sigue trabajando: las pausas entre
+    pulsaciones (antes pyautogui.PAUSE, global) se aplican aquí según el
+    tipo de acción, sin bloquear la captura ni la detección. El orden de
+    envío lo decide el ActionScheduler (prioridad, plazo y fusión) y una
+    acción urgente corta la pausa de otra menos prioritaria.
+    """
+
+    def __init__(self, pauses: Optional[Dict[str, float]] = None,
+                 default_pause: float = DEFAULT_PAUSE,
+                 scheduler: Optional[ActionScheduler] = None):
+        """
+        Inicializa el despachador
+
+        Args:
+            pauses: Pausa en segundos tras cada tipo de acción
+            default_pause: Pausa para tipos sin entrada en pauses
+            scheduler: Cola de acciones (None = una nueva con valores por defecto)
+        """
+        self.pauses = dict(pauses or {})
+        self.default_pause = default_pause
+        self.scheduler = scheduler if scheduler is not None else ActionScheduler()
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event: Optional[threading.Event] = None
+        self._lock = threading.Lock()
+        self.is_running = False
+
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'preempted_pauses': 0}
+
+    def submit(self, action_type: str, func: Callable[..., Any], *args,
+               priority: Optional[int] = None, since: Optional[float] = None,
+               ttl: Optional[float] = None, **kwargs) -> Future:
+        """
+        Encola una acción sin esperar a que se envíe
+
+        Args:
+            action_type: Tipo de acción (decide prioridad, validez y pausa posterior)
+            func: Llamada que envía la entrada
+            *args, **kwargs: Argumentos de func
+            priority: Prioridad explícita (None = la del tipo)
+            since: Instante desde el que cuenta la validez (None = ahora)
+            ttl: Validez explícita en segundos (None = la del tipo)
+
+        Returns:
+            Future con el valor devuelto por func (cancelado si caduca en cola)
+        """
+        with self._lock:
+            self._ensure_thread()
+            self.stats['submitted'] += 1
+        return self.scheduler.push(action_type, func, *args, priority=priority,
+                                   since=since, ttl=ttl, **kwargs)
+
+    def get_pause(self, action_type: str) -> float:
+        """Pausa tras una acción del tipo indicado"""
+        return self.pauses.get(action_type, self.default_pause)
+
+    def pending(self) -> int:
+        """Acciones en cola sin enviar"""
+        return len(self.scheduler)
+
+    def cancel_pending(self) -> int:
+        """
+        Cancela las acciones en cola (la que se está enviando termina)
+
+        Returns:
+            Número de acciones canceladas
+        """
+        return self.scheduler.clear()
+
+    def stop(self, timeout: float = 2.0):
+        """Cancela lo pendiente y detiene el hilo"""
+        with self._lock:
+            self.is_running = False
+            self.cancel_pending()
+            thread, self._thread = self._thread, None
+            if self._stop_event is not None:
+                self._stop_event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def in_dispatch_thread(self) -> bool:
+        """True si se llama desde el hilo de envío"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Contadores del despachador y de la cola"""
+        stats = dict(self.stats)
+        stats.update(self.scheduler.stats)
+        stats['pending'] = self.pending()
+        return stats
+
+    def _ensure_thread(self):
+        """Arranca el hilo en el primer envío"""
+        if self._thread is None or not self._thread.is_alive():
+            self.is_running = True
+            # Cada hilo tiene su evento: uno viejo que aún termina no afecta al nuevo
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stop_event,),
+                                            name="input-dispatcher", daemon=True)
+            self._thread.start()
+
+    def _run(self, stop_event: threading.Event):
+        """Bucle del hilo de envío"""
+        while not stop_event.is_set():
+            entry = self.scheduler.pop(timeout=0.1)
+            if entry is None:
+                continue
+            if stop_event.is_set():
+                # Detenido mientras esperaba: la acción es del hilo que lo sustituya
+                self.scheduler.requeue(entry)
+                break
+            if not entry.future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                entry.future.set_result(entry.func(*entry.args, **entry.kwargs))
+                self.stats['completed'] += 1
+            except BaseException as e:
+                entry.future.set_exception(e)
+                self.stats['failed'] += 1
+
+            # Una acción más prioritaria que llegue durante la pausa no la espera
+            pause = self.get_pause(entry.name)
+            if pause > 0 and self.scheduler.wait_urgent(pause, entry.priority):
+                self.stats['preempted_pauses'] += 1
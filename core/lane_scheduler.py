@@ -0,0 +1,163 @@
+"""
+Clase LaneScheduler - Carriles de trabajo con prioridad, frecuencia e hilo propios
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.screen_capturer import Frame
+from core.tick_scheduler import TickScheduler
+
+# Carriles estándar del bot, de mayor a menor prioridad
+CRITICAL_LANE = 'critical'
+NORMAL_LANE = 'normal'
+BACKGROUND_LANE = 'background'
+
+
+@dataclass
+class LaneStats:
+    """Latencias de un carril (segundos)"""
+    runs: int = 0
+    errors: int = 0
+    durations: deque = field(default_factory=lambda: deque(maxlen=1000))
+    latencies: deque = field(default_factory=lambda: deque(maxlen=1000))  # captura → fin
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Resumen con percentiles en milisegundos"""
+        summary = {'runs': self.runs, 'errors': self.errors}
+        for name, values in (('duration', self.durations), ('latency', self.latencies)):
+            if values:
+                p50, p95, top = np.percentile(np.fromiter(values, dtype=float), [50, 95, 100]) * 1000
+                summary[name] = {'p50_ms': p50, 'p95_ms': p95, 'max_ms': top}
+        return summary
+
+
+class Lane:
+    """Carril con su lista de tareas, frecuencia e hilo"""
+
+    def __init__(self, name: str, rate_hz: float, capture: bool = False):
+        """
+        Args:
+            name: Nombre del carril
+            rate_hz: Ejecuciones por segundo
+            capture: Si el carril captura un frame nuevo en cada ejecución
+        """
+        self.name = name
+        self.rate_hz = rate_hz
+        self.capture = capture
+        self.tasks: List[Callable[[Frame], Any]] = []
+        self.stats = LaneStats()
+        self.scheduler: Optional[TickScheduler] = None
+        self.thread: Optional[threading.Thread] = None
+
+
+class LaneScheduler:
+    """Ejecuta cada carril en su propio hilo sobre el último frame capturado"""
+
+    def __init__(self, capture: Callable[[int], Frame]):
+        """
+        Inicializa el planificador
+
+        Args:
+            capture: Función que devuelve un Frame nuevo (recibe el número de tick)
+        """
+        self.capture = capture
+        self.lanes: Dict[str, Lane] = {}
+        self.is_running = False
+
+        # Último frame publicado por el carril que captura
+        self._latest: Optional[Frame] = None
+        self._frame_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+
+    def add_lane(self, name: str, rate_hz: float, capture: bool = False) -> Lane:
+        """
+        Crea un carril
+
+        Args:
+            name: Nombre del carril
+            rate_hz: Ejecuciones por segundo
+            capture: Si captura el frame (normalmente solo el carril crítico)
+
+        Returns:
+            El carril creado
+        """
+        lane = Lane(name, rate_hz, capture)
+        self.lanes[name] = lane
+        return lane
+
+    def add_task(self, lane_name: str, task: Callable[[Frame], Any]):
+        """Añade una tarea que recibe el frame del tick al carril indicado"""
+        self.lanes[lane_name].tasks.append(task)
+
+    @property
+    def latest_frame(self) -> Optional[Frame]:
+        """Último frame capturado"""
+        with self._frame_lock:
+            return self._latest
+
+    def start(self):
+        """Arranca un hilo por carril"""
+        self.is_running = True
+        for lane in self.lanes.values():
+            lane.scheduler = TickScheduler(lane.rate_hz, self._make_tick(lane))
+            lane.thread = threading.Thread(target=lane.scheduler.run, name=f"lane-{lane.name}",
+                                           daemon=True)
+            lane.thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Detiene todos los carriles y espera a sus hilos"""
+        self.is_running = False
+        self._frame_ready.set()
+        for lane in self.lanes.values():
+            if lane.scheduler is not None:
+                lane.scheduler.stop()
+        for lane in self.lanes.values():
+            if lane.thread is not None:
+                lane.thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Latencias y puntualidad por carril"""
+        stats = {}
+        for name, lane in self.lanes.items():
+            stats[name] = lane.stats.to_dict()
+            if lane.scheduler is not None:
+                stats[name]['missed_deadlines'] = lane.scheduler.stats.missed_deadlines
+                stats[name]['skipped_ticks'] = lane.scheduler.stats.skipped_ticks
+        return stats
+
+    def _make_tick(self, lane: Lane) -> Callable[[int, float], None]:
+        """Función de tick de un carril"""
+        def tick(index: int, deadline: float):
+            if lane.capture:
+                try:
+                    frame = self.capture(index)
+                except Exception:
+                    lane.stats.errors += 1
+                    return
+                with self._frame_lock:
+                    self._latest = frame
+                self._frame_ready.set()
+            else:
+                if not self._frame_ready.wait(timeout=1.0 / lane.rate_hz):
+                    return
+                frame = self.latest_frame
+                if frame is None:
+                    return
+
+            start = time.monotonic()
+            for task in lane.tasks:
+                try:
+                    task(frame)
+                except Exception:
+                    lane.stats.errors += 1
+            end = time.monotonic()
+
+            lane.stats.runs += 1
+            lane.stats.durations.append(end - start)
+            lane.stats.latencies.append(end - frame.captured_at)
+        return tick
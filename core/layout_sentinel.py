@@ -0,0 +1,184 @@
+"""
+Clase LayoutSentinel - Vigilancia barata de cambios en la disposición de la UI
+"""
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.ui_config import UIConfig, UIElement
+
+
+class LayoutSentinel:
+    """Muestrea unos pocos píxeles del marco de cada elemento en cada frame"""
+
+    def __init__(self, ui_config: UIConfig, points_per_edge: int = 4, margin: int = 2,
+                 tolerance: int = 30, min_agreement: float = 0.75,
+                 failures_to_trigger: int = 2):
+        """
+        Inicializa el centinela
+
+        Args:
+            ui_config: Configuración con las posiciones de los elementos
+            points_per_edge: Puntos muestreados en cada lado del marco
+            margin: Distancia del muestreo por fuera del rectángulo del elemento
+            tolerance: Diferencia máxima por canal respecto a la referencia
+            min_agreement: Fracción mínima de puntos que deben coincidir
+            failures_to_trigger: Frames seguidos fallando antes de avisar
+        """
+        self.ui_config = ui_config
+        self.points_per_edge = points_per_edge
+        self.margin = margin
+        self.tolerance = tolerance
+        self.min_agreement = min_agreement
+        self.failures_to_trigger = failures_to_trigger
+
+        # Puntos y colores de referencia por elemento
+        self.references: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self.failures: Dict[str, int] = {}
+
+        # Tabla aplanada de todos los elementos (se rehace al armar)
+        self._names: List[str] = []
+        self._xs = self._ys = self._owner = self._colors = None
+
+        self.stats = {'checks': 0, 'triggers': 0}
+
+    def arm(self, screenshot: np.ndarray, names: Optional[Iterable[str]] = None):
+        """
+        Guarda los colores de referencia del marco de los elementos
+
+        Args:
+            screenshot: Captura con la disposición correcta
+            names: Elementos a armar (None = todos los de la configuración)
+        """
+        if names is None:
+            self.references.clear()
+            names = self.ui_config.get_element_names()
+
+        height, width = screenshot.shape[:2]
+        for name in names:
+            element = self.ui_config.get_element(name)
+            self.failures.pop(name, None)
+            if element is None:
+                self.references.pop(name, None)
+                continue
+
+            xs, ys = self._sample_points(element)
+            inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+            xs, ys = xs[inside], ys[inside]
+            if xs.size == 0:
+                self.references.pop(name, None)
+                continue
+            self.references[name] = (xs, ys, screenshot[ys, xs].astype(np.int16))
+
+        self._compile()
+
+    def disarm(self, name: str):
+        """Deja de vigilar un elemento"""
+        self.references.pop(name, None)
+        self.failures.pop(name, None)
+        self._compile()
+
+    def check(self, screenshot: np.ndarray) -> List[str]:
+        """
+        Compara los puntos de todos los elementos con una sola indexación
+
+        Args:
+            screenshot: Captura de pantalla actual
+
+        Returns:
+            Elementos cuya disposición cambió (requieren re-detección)
+        """
+        if not self._names:
+            return []
+
+        self.stats['checks'] += 1
+        failing = self._failing(screenshot)
+
+        triggered = []
+        for name, failed in zip(self._names, failing.tolist()):
+            if not failed:
+                self.failures.pop(name, None)
+                continue
+            self.failures[name] = self.failures.get(name, 0) + 1
+            if self.failures[name] >= self.failures_to_trigger:
+                triggered.append(name)
+
+        self.stats['triggers'] += len(triggered)
+        return triggered
+
+    def verify(self, screenshot: np.ndarray) -> List[str]:
+        """
+        Comprobación única sin histéresis (ej. al arrancar)
+
+        Args:
+            screenshot: Captura de pantalla actual
+
+        Returns:
+            Elementos cuyo marco no coincide con la referencia
+        """
+        if not self._names:
+            return []
+        failing = self._failing(screenshot)
+        return [name for name, failed in zip(self._names, failing.tolist()) if failed]
+
+    def export(self) -> Dict[str, Dict[str, list]]:
+        """Referencias en formato JSON (huella de la disposición)"""
+        return {
+            name: {'points': np.stack([xs, ys], axis=1).tolist(), 'colors': colors.tolist()}
+            for name, (xs, ys, colors) in self.references.items()
+        }
+
+    def restore(self, data: Dict[str, Dict[str, list]]):
+        """
+        Carga referencias guardadas con export()
+
+        Args:
+            data: Diccionario elemento -> puntos y colores
+        """
+        self.references.clear()
+        self.failures.clear()
+        for name, entry in data.items():
+            points = np.array(entry.get('points', []), dtype=np.intp).reshape(-1, 2)
+            colors = np.array(entry.get('colors', []), dtype=np.int16).reshape(-1, 3)
+            if points.size and len(points) == len(colors):
+                self.references[name] = (points[:, 0].copy(), points[:, 1].copy(), colors)
+        self._compile()
+
+    def _failing(self, screenshot: np.ndarray) -> np.ndarray:
+        """Máscara de elementos con menos coincidencias de las necesarias"""
+        height, width = screenshot.shape[:2]
+        inside = (self._xs < width) & (self._ys < height)
+        samples = screenshot[self._ys.clip(0, height - 1), self._xs.clip(0, width - 1)]
+        diff = np.abs(samples.astype(np.int16) - self._colors)
+        matches = (diff.max(axis=1) <= self.tolerance) & inside
+
+        counts = np.bincount(self._owner, minlength=len(self._names))
+        agreed = np.bincount(self._owner, weights=matches, minlength=len(self._names))
+        return agreed < counts * self.min_agreement
+
+    def _sample_points(self, element: UIElement) -> Tuple[np.ndarray, np.ndarray]:
+        """Esquinas y puntos de cada lado, justo por fuera del elemento"""
+        left, top = element.x - self.margin, element.y - self.margin
+        right = element.x + element.width - 1 + self.margin
+        bottom = element.y + element.height - 1 + self.margin
+
+        steps = np.linspace(0.0, 1.0, self.points_per_edge + 2)
+        along_x = np.round(left + steps * (right - left)).astype(np.intp)
+        along_y = np.round(top + steps * (bottom - top)).astype(np.intp)
+
+        sides = np.full(self.points_per_edge, 1, dtype=np.intp)
+        xs = np.concatenate([along_x, along_x, sides * left, sides * right])
+        ys = np.concatenate([np.full(along_x.size, top), np.full(along_x.size, bottom),
+                             along_y[1:-1], along_y[1:-1]])
+        return xs.astype(np.intp), ys.astype(np.intp)
+
+    def _compile(self):
+        """Aplana las referencias en arrays para la comprobación por frame"""
+        self._names = list(self.references.keys())
+        if not self._names:
+            return
+        refs = [self.references[name] for name in self._names]
+        self._xs = np.concatenate([xs for xs, _, _ in refs])
+        self._ys = np.concatenate([ys for _, ys, _ in refs])
+        self._colors = np.concatenate([colors for _, _, colors in refs])
+        self._owner = np.concatenate([np.full(xs.size, i, dtype=np.intp)
+                                      for i, (xs, _, _) in enumerate(refs)])
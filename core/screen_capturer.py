@@ -1,13 +1,17 @@
 """
 Clase ScreenCapturer - Manejo eficiente de capturas de pantalla
 """
-import mss
+import time
 import numpy as np
 import cv2
 from typing import Dict, List, Optional, Union, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+from utils.startup import lazy_import, startup_report
+
+mss = lazy_import('mss')
+
 @dataclass
 class ScreenRegion:
     """Representa una región de la pantalla"""
@@ -40,6 +44,13 @@ class ScreenRegion:
             height=data.get('height', 0)
         )
 
+@dataclass
+class Frame:
+    """Captura con su instante de captura (monotónico)"""
+    tick: int
+    captured_at: float
+    image: np.ndarray
+
 class ScreenCapturer:
     """Maneja la captura de pantalla de manera eficiente"""
     
@@ -50,14 +61,31 @@ class ScreenCapturer:
         Args:
             monitor_index: Índice del monitor a capturar (1 = principal)
         """
-        self.sct = mss.mss()
         self.monitor_index = monitor_index
-        self.monitor_info = self._get_monitor_info()
         self.last_capture = None
         self.capture_count = 0
         
+        # mss se abre en la primera captura (las herramientas sin captura no lo pagan)
+        self._sct = None
+        self._monitor_info: Optional[Dict] = None
+        
         print(f"✅ ScreenCapturer inicializado para monitor {monitor_index}")
-        print(f"   Resolución: {self.monitor_info['width']}x{self.monitor_info['height']}")
+    
+    @property
+    def sct(self):
+        """Sesión de mss, creada en el primer uso"""
+        if self._sct is None:
+            with startup_report.timed('ScreenCapturer.mss'):
+                self._sct = mss.mss()
+        return self._sct
+    
+    @property
+    def monitor_info(self) -> Dict:
+        """Geometría del monitor capturado"""
+        if self._monitor_info is None:
+            self._monitor_info = self._get_monitor_info()
+            print(f"   Resolución: {self._monitor_info['width']}x{self._monitor_info['height']}")
+        return self._monitor_info
     
     def _get_monitor_info(self) -> Dict:
         """Obtiene información del monitor"""
@@ -91,6 +119,22 @@ class ScreenCapturer:
         except Exception as e:
             raise RuntimeError(f"Error capturando pantalla completa: {e}")
     
+    def capture_frame(self, tick: int = 0) -> Frame:
+        """
+        Captura toda la pantalla junto con el instante de captura
+        
+        El instante se toma antes de la captura, así las latencias medidas
+        desde él incluyen también el coste de capturar.
+        
+        Args:
+            tick: Número de ciclo al que pertenece la captura
+        
+        Returns:
+            Frame con la imagen BGR
+        """
+        captured_at = time.monotonic()
+        return Frame(tick, captured_at, self.capture_full_screen())
+    
     def capture_region(self, region: Union[Dict, ScreenRegion, Tuple]) -> np.ndarray:
         """
         Captura una región específica de la pantalla
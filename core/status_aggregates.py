@@ -0,0 +1,215 @@
+"""
+Clase SeriesAggregates - Agregados incrementales de una serie (HP, MP...)
+"""
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+# Ventana por defecto de mínimo, máximo y ritmo (segundos)
+DEFAULT_WINDOW = 2.0
+# Constante de tiempo por defecto de la media exponencial (segundos)
+DEFAULT_EWMA_TAU = 0.5
+# Ventanas tras las que se recalculan las sumas de la regresión desde cero
+REBASE_AFTER = 64
+
+
+class SeriesAggregates:
+    """
+    Mantiene en cada muestra los agregados que consulta la lógica de decisión
+
+    - Media exponencial con constante de tiempo (válida con ticks irregulares).
+    - Mínimo y máximo de la ventana con colas monótonas.
+    - Ritmo de cambio (unidades/s) por mínimos cuadrados sobre la ventana,
+      con sumas acumuladas.
+    - Por cada nivel con nombre: desde cuándo se está por debajo / encima y
+      cuándo se estuvo por encima / debajo por última vez.
+
+    Añadir una muestra es O(1) amortizado y cada consulta es O(1).
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW, ewma_tau: float = DEFAULT_EWMA_TAU,
+                 levels: Optional[Dict[str, float]] = None):
+        """
+        Inicializa los agregados
+
+        Args:
+            window: Ventana en segundos de mínimo, máximo y ritmo
+            ewma_tau: Constante de tiempo de la media exponencial
+            levels: Umbrales con nombre a seguir ({'low_hp': 50.0, ...})
+        """
+        if window <= 0 or ewma_tau <= 0:
+            raise ValueError("window y ewma_tau deben ser positivos")
+        self.window = window
+        self.ewma_tau = ewma_tau
+        self.levels = dict(levels or {})
+        self.reset()
+
+    def reset(self):
+        """Olvida todas las muestras"""
+        self.last_value: Optional[float] = None
+        self.last_time: Optional[float] = None
+        self.ewma: Optional[float] = None
+        self.samples = 0
+
+        # Ventana: muestras en orden y colas monótonas para mínimo / máximo
+        self._window: Deque[Tuple[float, float]] = deque()
+        self._min: Deque[Tuple[float, float]] = deque()
+        self._max: Deque[Tuple[float, float]] = deque()
+
+        # Sumas de la regresión; los tiempos se guardan relativos a _origin
+        self._origin = 0.0
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+
+        # Por nivel: instante en que empezó el tramo actual y último instante a cada lado
+        self._below_since: Dict[str, Optional[float]] = {}
+        self._above_since: Dict[str, Optional[float]] = {}
+        self._last_below: Dict[str, Optional[float]] = {}
+        self._last_above: Dict[str, Optional[float]] = {}
+
+    def update(self, t: float, value: Optional[float]):
+        """
+        Añade una muestra
+
+        Args:
+            t: Instante monotónico de la muestra
+            value: Valor leído (None o NaN se ignoran)
+        """
+        if value is None or math.isnan(value):
+            return
+        if self.last_time is not None and t < self.last_time:
+            return  # Muestra fuera de orden
+
+        # Media exponencial
+        if self.ewma is None:
+            self.ewma = value
+        else:
+            alpha = 1.0 - math.exp(-(t - self.last_time) / self.ewma_tau)
+            self.ewma += alpha * (value - self.ewma)
+
+        # Ventana
+        if not self._window:
+            self._origin = t
+        elif t - self._origin > REBASE_AFTER * self.window:
+            self._rebase()
+        rel = t - self._origin
+        self._window.append((t, value))
+        self._sum_t += rel
+        self._sum_v += value
+        self._sum_tt += rel * rel
+        self._sum_tv += rel * value
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((t, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((t, value))
+
+        self._evict(t)
+
+        # Niveles
+        for name, level in self.levels.items():
+            if value < level:
+                if self._below_since.get(name) is None:
+                    self._below_since[name] = t
+                self._above_since[name] = None
+                self._last_below[name] = t
+            else:
+                if self._above_since.get(name) is None:
+                    self._above_since[name] = t
+                self._below_since[name] = None
+                self._last_above[name] = t
+
+        self.last_value = value
+        self.last_time = t
+        self.samples += 1
+
+    def window_min(self) -> Optional[float]:
+        """Mínimo de la ventana (None sin muestras)"""
+        return self._min[0][1] if self._min else None
+
+    def window_max(self) -> Optional[float]:
+        """Máximo de la ventana (None sin muestras)"""
+        return self._max[0][1] if self._max else None
+
+    def rate(self) -> Optional[float]:
+        """
+        Ritmo de cambio en unidades por segundo sobre la ventana
+
+        Returns:
+            Pendiente de mínimos cuadrados (negativa si baja), o None con
+            menos de dos muestras o todas en el mismo instante
+        """
+        n = len(self._window)
+        if n < 2:
+            return None
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 1e-12:
+            return None
+        return (n * self._sum_tv - self._sum_t * self._sum_v) / denominator
+
+    def time_below(self, level: str, now: Optional[float] = None) -> float:
+        """Segundos seguidos por debajo del nivel (0 si ahora está por encima)"""
+        since = self._below_since.get(level)
+        if since is None:
+            return 0.0
+        return max(0.0, (self.last_time if now is None else now) - since)
+
+    def time_above(self, level: str, now: Optional[float] = None) -> float:
+        """Segundos seguidos por encima del nivel (0 si ahora está por debajo)"""
+        since = self._above_since.get(level)
+        if since is None:
+            return 0.0
+        return max(0.0, (self.last_time if now is None else now) - since)
+
+    def time_since_above(self, level: str, now: Optional[float] = None) -> Optional[float]:
+        """Segundos desde la última muestra por encima del nivel (None si nunca)"""
+        last = self._last_above.get(level)
+        if last is None:
+            return None
+        return max(0.0, (self.last_time if now is None else now) - last)
+
+    def time_since_below(self, level: str, now: Optional[float] = None) -> Optional[float]:
+        """Segundos desde la última muestra por debajo del nivel (None si nunca)"""
+        last = self._last_below.get(level)
+        if last is None:
+            return None
+        return max(0.0, (self.last_time if now is None else now) - last)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte a diccionario"""
+        return {
+            'last': self.last_value,
+            'ewma': self.ewma,
+            'min': self.window_min(),
+            'max': self.window_max(),
+            'rate': self.rate(),
+            'samples': self.samples,
+            'time_below': {name: self.time_below(name) for name in self.levels}
+        }
+
+    def _rebase(self):
+        """Recalcula las sumas con el origen en la muestra más antigua (acota el error)"""
+        self._origin = self._window[0][0]
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        for t, value in self._window:
+            rel = t - self._origin
+            self._sum_t += rel
+            self._sum_v += value
+            self._sum_tt += rel * rel
+            self._sum_tv += rel * value
+
+    def _evict(self, now: float):
+        """Saca de la ventana las muestras más antiguas que window"""
+        start = now - self.window
+        while self._window and self._window[0][0] < start:
+            t, value = self._window.popleft()
+            rel = t - self._origin
+            self._sum_t -= rel
+            self._sum_v -= value
+            self._sum_tt -= rel * rel
+            self._sum_tv -= rel * value
+        while self._min and self._min[0][0] < start:
+            self._min.popleft()
+        while self._max and self._max[0][0] < start:
+            self._max.popleft()
@@ -0,0 +1,185 @@
+"""
+Clase StatusHistory - Historial del personaje en un búfer circular de numpy
+"""
+from typing import Optional
+
+import numpy as np
+
+# Bits de la columna 'flags'
+FLAG_TARGET_EXISTS = 1 << 0
+FLAG_IN_COMBAT = 1 << 1
+FLAG_IN_SAFE_ZONE = 1 << 2
+FLAG_POISONED = 1 << 3
+FLAG_BURNING = 1 << 4
+FLAG_PARALYZED = 1 << 5
+FLAG_PZ_LOCKED = 1 << 6
+FLAG_HUNGRY = 1 << 7
+FLAG_INVENTORY_KNOWN = 1 << 8   # inventory_open no es None
+FLAG_INVENTORY_OPEN = 1 << 9
+FLAG_HAS_POSITION = 1 << 10
+
+# Campo booleano de CharacterStatus -> bit
+STATUS_FLAGS = {
+    'target_exists': FLAG_TARGET_EXISTS,
+    'in_combat': FLAG_IN_COMBAT,
+    'in_safe_zone': FLAG_IN_SAFE_ZONE,
+    'poisoned': FLAG_POISONED,
+    'burning': FLAG_BURNING,
+    'paralyzed': FLAG_PARALYZED,
+    'pz_locked': FLAG_PZ_LOCKED,
+    'hungry': FLAG_HUNGRY
+}
+
+# Una fila por actualización; los valores desconocidos (None) se guardan como NaN
+STATUS_DTYPE = np.dtype([
+    ('timestamp', 'f8'),     # time.time() de la actualización
+    ('captured_at', 'f8'),   # Instante monotónico de la captura (NaN si no se conoce)
+    ('hp', 'f4'),
+    ('mp', 'f4'),
+    ('flags', 'u2'),
+    ('x', 'i4'),
+    ('y', 'i4'),
+    ('z', 'i2')
+])
+
+
+def encode_status(status, out: np.ndarray):
+    """
+    Escribe un CharacterStatus en una fila de STATUS_DTYPE, sin crear objetos
+
+    Args:
+        status: CharacterStatus a guardar
+        out: Fila (np.void) o array de una fila donde escribir
+    """
+    flags = 0
+    for name, bit in STATUS_FLAGS.items():
+        if getattr(status, name):
+            flags |= bit
+    if status.inventory_open is not None:
+        flags |= FLAG_INVENTORY_KNOWN
+        if status.inventory_open:
+            flags |= FLAG_INVENTORY_OPEN
+
+    position = status.position
+    if position:
+        flags |= FLAG_HAS_POSITION
+        x, y, z = position.get('x', 0), position.get('y', 0), position.get('z', 0)
+    else:
+        x = y = z = 0
+
+    out['timestamp'] = status.timestamp
+    out['captured_at'] = np.nan if status.captured_at is None else status.captured_at
+    out['hp'] = np.nan if status.hp_percentage is None else status.hp_percentage
+    out['mp'] = np.nan if status.mp_percentage is None else status.mp_percentage
+    out['flags'] = flags
+    out['x'] = x
+    out['y'] = y
+    out['z'] = z
+
+
+def decode_status(record, status_class):
+    """
+    Reconstruye un CharacterStatus a partir de una fila
+
+    El dict 'conditions' no se guarda en el historial: solo vuelven las
+    condiciones con campo propio.
+
+    Args:
+        record: Fila de STATUS_DTYPE
+        status_class: Clase CharacterStatus a instanciar
+
+    Returns:
+        Nuevo CharacterStatus
+    """
+    flags = int(record['flags'])
+    hp, mp, captured_at = float(record['hp']), float(record['mp']), float(record['captured_at'])
+    position = None
+    if flags & FLAG_HAS_POSITION:
+        position = {'x': int(record['x']), 'y': int(record['y']), 'z': int(record['z'])}
+
+    return status_class(
+        timestamp=float(record['timestamp']),
+        hp_percentage=None if np.isnan(hp) else hp,
+        mp_percentage=None if np.isnan(mp) else mp,
+        inventory_open=bool(flags & FLAG_INVENTORY_OPEN) if flags & FLAG_INVENTORY_KNOWN else None,
+        position=position,
+        captured_at=None if np.isnan(captured_at) else captured_at,
+        **{name: bool(flags & bit) for name, bit in STATUS_FLAGS.items()}
+    )
+
+
+class StatusHistory:
+    """
+    Búfer circular preasignado con el historial del personaje
+
+    Cada fila se escribe dos veces (en i y en i + capacity), así las últimas
+    n filas siempre son un tramo contiguo y last(n) devuelve una vista sin
+    copiar. Añadir es O(1) y no reserva memoria.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Inicializa el historial
+
+        Args:
+            capacity: Número máximo de filas guardadas
+        """
+        if capacity <= 0:
+            raise ValueError("capacity debe ser positiva")
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=STATUS_DTYPE)
+        self._head = 0   # Siguiente posición a escribir en [0, capacity)
+        self._count = 0
+        self.total_appended = 0
+
+    def append(self, status):
+        """Añade el estado actual (sobrescribe el más antiguo si está lleno)"""
+        head = self._head
+        row = self._data[head]
+        encode_status(status, row)
+        self._data[head + self.capacity] = row
+
+        self._head = head + 1 if head + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+        self.total_appended += 1
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Últimas n filas, de la más antigua a la más reciente
+
+        Args:
+            n: Número de filas (None = todas)
+
+        Returns:
+            Vista de solo lectura sobre el búfer (se sobrescribe al añadir)
+        """
+        n = self._count if n is None else max(0, min(n, self._count))
+        end = self._head + self.capacity
+        view = self._data[end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """Vista de una columna de las últimas n filas"""
+        return self.last(n)[name]
+
+    def latest(self) -> Optional[np.void]:
+        """Fila más reciente (None si está vacío)"""
+        if self._count == 0:
+            return None
+        return self._data[self._head + self.capacity - 1]
+
+    def clear(self):
+        """Vacía el historial sin liberar el búfer"""
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+
+__all__ = ['StatusHistory', 'STATUS_DTYPE', 'STATUS_FLAGS', 'encode_status', 'decode_status']
@@ -3,14 +3,42 @@ Clase principal TibiaBot - Versión simplificada y funcional
 """
 import time
 import logging
-from typing import Dict, Optional, Any
+import threading
+from concurrent.futures import Future
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from core.screen_capturer import ScreenCapturer
 from core.ui_detector import UIDetector
 from core.bot_actions import BotActions
 from core.bot_state import BotState
+from core.hp_predictor import AlphaBetaFilter
+from core.layout_sentinel import LayoutSentinel
+from core.tick_scheduler import TickScheduler
+from core.timer_service import TimerService
+from core.lane_scheduler import LaneScheduler, CRITICAL_LANE, NORMAL_LANE, BACKGROUND_LANE
 from config.settings import Settings
 from config.ui_config import UIConfig
+from utils.startup import lazy_import, startup_report
+
+# El pipeline asyncio solo se carga si se usa ese modo de monitoreo
+async_pipeline = lazy_import('core.async_pipeline')
+if TYPE_CHECKING:
+    from core.async_pipeline import AsyncPipeline
+
+# Método de UIDetector que detecta cada elemento de la UI
+ELEMENT_DETECTORS = {
+    'hp_bar': 'detect_health_bar',
+    'mp_bar': 'detect_mana_bar',
+    'inventory': 'detect_inventory',
+    'minimap': 'detect_minimap',
+    'equipment': 'detect_equipment_window',
+    'skills': 'detect_skills_window',
+    'chat': 'detect_chat_window',
+    'battle_list': 'detect_battle_list',
+    'viewport': 'detect_viewport',
+    'action_bar': 'detect_action_bar'
+}
 
 class TibiaBot:
     """Bot principal para automatizar tareas en Tibia"""
@@ -29,18 +57,138 @@ class TibiaBot:
         self.logger = logger or self._setup_logger(debug_mode)
         
         # Cargar configuración
-        self.settings = Settings(config_path)
-        self.ui_config = UIConfig()
+        with startup_report.timed('Settings/UIConfig'):
+            self.settings = Settings(config_path)
+            self.ui_config = UIConfig()
         
-        # Inicializar componentes
-        self.capturer = ScreenCapturer(self.settings.monitor_index)
-        self.detector = UIDetector(self.settings, self.ui_config)
-        self.actions = BotActions(self.settings, self.ui_config)
+        # Inicializar componentes (los backends de entrada se cargan al usarse)
+        with startup_report.timed('ScreenCapturer'):
+            self.capturer = ScreenCapturer(self.settings.monitor_index)
+        with startup_report.timed('UIDetector'):
+            self.detector = UIDetector(self.settings, self.ui_config)
+        with startup_report.timed('BotActions'):
+            self.actions = BotActions(self.capturer, self.settings)
+            self.actions.action_bar = self.detector.action_bar
         self.state = BotState()
+        self._configure_hp_prediction()
+        self.sentinel = LayoutSentinel(self.ui_config)
+        
+        # Disposición de la UI: el centinela encola los cambios y la re-detección
+        # se hace fuera del tick crítico. El cerrojo protege ui_config y el
+        # estado de los detectores (lista de batalla, vista, barra de acciones)
+        # frente a las lecturas de los otros carriles o etapas
+        self.layout_lock = threading.RLock()
+        self._layout_pending: Set[str] = set()
+        self._layout_frame = None
+        self._layout_failed: Set[str] = set()
+        # Hilo que re-detecta lo encolado (activo mientras dura el monitoreo)
+        self._layout_wakeup = threading.Event()
+        self._layout_stop = threading.Event()
+        self._layout_worker: Optional[threading.Thread] = None
+        
+        # Bucle de monitoreo: captura → detección → estado → decisión → acción
+        self.scheduler = TickScheduler(max(1, self.settings.capture_fps), self.run_cycle)
+        self.pipeline: Optional['AsyncPipeline'] = None
+        self.lanes: Optional[LaneScheduler] = None
+        
+        # Último frame capturado (lo leen las tareas periódicas, como las habilidades)
+        self.last_frame = None
+        
+        # Última acción enviada de cada tipo (para no repetir las pendientes)
+        self.pending_actions: Dict[str, Future] = {}
+        
+        # Criatura de la lista de batalla a la que se hizo click para atacar
+        self._attacking: Optional[Tuple[bytes, int]] = None
+        
+        # Cadáveres vistos en combate, pendientes de lootear (posición -> instante)
+        self._corpses: Dict[Tuple[int, int], float] = {}
+        
+        # El bucle secuencial lee la lista de batalla y las criaturas cada
+        # pocos ticks, a la frecuencia del carril normal
+        normal_rate = self.settings.lane_rates.get(NORMAL_LANE, 4.0)
+        self._scan_every = max(1, round(self.settings.capture_fps / normal_rate))
+        
+        # Tareas periódicas de mantenimiento, disparadas desde el bucle
+        self.timers = TimerService()
+        self._register_maintenance()
+        self.timers.add('heal_latency', 5.0, self.update_expected_latency)
         
         self.logger.info("[INFO] 🤖 TibiaBot inicializado correctamente")
         self.is_running = False
     
+    def _register_maintenance(self):
+        """Registra las tareas periódicas configuradas en Settings.maintenance_tasks"""
+        tasks = {
+            'eat_food': lambda: self.act('food'),
+            'read_skills': self.read_skills,
+            'save_state': self.save_state
+        }
+        for name, config in getattr(self.settings, 'maintenance_tasks', {}).items():
+            if name not in tasks:
+                self.logger.warning(f"⚠️ Tarea de mantenimiento desconocida: {name}")
+                continue
+            self.timers.add(name, config['interval'], tasks[name], jitter=config.get('jitter', 0.0))
+    
+    def _configure_hp_prediction(self):
+        """Aplica la configuración de curación predictiva al estado"""
+        self.state.predictive_healing = getattr(self.settings, 'predictive_healing', True)
+        self.state.expected_latency = getattr(self.settings, 'expected_action_latency', 0.15)
+        self.state.hp_fast_path_drop = getattr(self.settings, 'hp_fast_path_drop', 25.0)
+        self.state.hp_filter = AlphaBetaFilter(getattr(self.settings, 'hp_filter_alpha', 0.3),
+                                               getattr(self.settings, 'hp_filter_beta', 0.03))
+    
+    def update_expected_latency(self):
+        """
+        Ajusta el horizonte de predicción del HP a la latencia medida de las curas
+        
+        Usa el p95 de captura → envío: vale más curar un poco antes que tarde.
+        """
+        summary = self.actions.get_latency_report().get('heal.capture_to_dispatch')
+        if summary and summary['count'] >= 10:
+            self.state.expected_latency = summary['p95_ms'] / 1000.0
+    
+    def read_skills(self, screenshot=None) -> Dict[str, int]:
+        """
+        Lee la ventana de habilidades (solo las filas que cambiaron)
+        
+        Args:
+            screenshot: Captura a leer (None = último frame capturado)
+        
+        Returns:
+            Habilidades cuyo valor cambió
+        """
+        if screenshot is None:
+            if self.last_frame is None:
+                return {}
+            screenshot = self.last_frame.image
+        
+        # Con una re-detección en curso no se espera: se lee en la próxima vuelta
+        if not self.layout_lock.acquire(blocking=False):
+            return {}
+        try:
+            changed = self.detector.read_skills(screenshot)
+        finally:
+            self.layout_lock.release()
+        if 'experience' in changed:
+            rate = self.detector.skills_reader.get_rate('experience')
+            self.logger.debug(f"[DEBUG] Experiencia: {changed['experience']}"
+                              + (f" ({rate:.0f}/h)" if rate is not None else ""))
+        return changed
+    
+    def get_skill_telemetry(self) -> Dict[str, Any]:
+        """Últimos valores de habilidades y ritmo de experiencia por hora"""
+        reader = self.detector.skills_reader
+        rates = {name: reader.get_rate(name) for name in reader.values}
+        return {
+            'values': dict(reader.values),
+            'experience_per_hour': rates.get('experience'),
+            'rates_per_hour': {name: rate for name, rate in rates.items() if rate is not None}
+        }
+    
+    def save_state(self):
+        """Guarda el estado del bot en el archivo de autoguardado"""
+        self.state.save_state_to_file(self.settings.state_autosave_file)
+    
     def _setup_logger(self, debug_mode: bool) -> logging.Logger:
         """Configura el sistema de logging"""
         logger = logging.getLogger('TibiaBot')
@@ -60,10 +208,16 @@ class TibiaBot:
         
         return logger
     
-    def auto_detect_ui(self) -> bool:
+    def auto_detect_ui(self, force: bool = False) -> bool:
         """
         Detecta automáticamente los elementos de la UI
         
+        Si hay una disposición guardada cuya huella coincide con la pantalla
+        actual se reutiliza sin ejecutar los detectores.
+        
+        Args:
+            force: Ignorar la disposición guardada y detectar todo
+        
         Returns:
             True si la detección fue exitosa
         """
@@ -73,49 +227,24 @@ class TibiaBot:
             # Capturar pantalla
             screenshot = self.capturer.capture_full_screen()
             
+            if not force and self.warm_start(screenshot):
+                return True
+            
             # Diccionario para almacenar posiciones detectadas
             detected_positions = {}
             
-            # Lista de elementos a detectar
-            elements_to_detect = {
-                'hp_bar': 'detect_health_bar',
-                'mp_bar': 'detect_mana_bar',
-                'inventory': 'detect_inventory',
-                'minimap': 'detect_minimap',
-                'equipment': 'detect_equipment_window',
-                'skills': 'detect_skills_window',
-                'chat': 'detect_chat_window'
-            }
-            
             # Detectar cada elemento
-            for element_name, method_name in elements_to_detect.items():
-                try:
-                    # Obtener método de detección
-                    if hasattr(self.detector, method_name):
-                        method = getattr(self.detector, method_name)
-                        position = method(screenshot)
-                        
-                        if position:
-                            detected_positions[element_name] = {
-                                'x': position[0],
-                                'y': position[1],
-                                'width': position[2],
-                                'height': position[3],
-                                'confidence': 0.8,
-                                'method': 'auto_detect'
-                            }
-                            self.logger.info(f"✅ {element_name} detectado: {position}")
-                        else:
-                            self.logger.warning(f"⚠️ {element_name} no detectado")
-                    else:
-                        self.logger.warning(f"⚠️ Método {method_name} no disponible")
-                        
-                except Exception as e:
-                    self.logger.error(f"❌ Error detectando {element_name}: {e}")
+            for element_name in ELEMENT_DETECTORS:
+                position = self._detect_element(element_name, screenshot)
+                if position:
+                    detected_positions[element_name] = position
             
             # Actualizar configuración
             if detected_positions:
                 self.ui_config.update_positions(detected_positions)
+                self.ui_config.screen_height, self.ui_config.screen_width = screenshot.shape[:2]
+                self.sentinel.arm(screenshot)
+                self.ui_config.fingerprint = self.sentinel.export()
                 self.ui_config.save_to_file()
                 
                 self.logger.info(f"[INFO] ✅ Detección completada: {len(detected_positions)} elementos")
@@ -128,27 +257,639 @@ class TibiaBot:
             self.logger.error(f"[ERROR] ❌ Error en detección automática: {e}")
             return False
     
-    def start_monitoring(self):
-        """Inicia el monitoreo automático"""
-        self.logger.info("[INFO] 👁️ Iniciando monitoreo...")
-        self.is_running = True
+    def warm_start(self, screenshot) -> bool:
+        """
+        Reutiliza la disposición guardada si su huella coincide
+        
+        Con la misma resolución se comparan los píxeles de marco guardados;
+        los elementos que no coinciden se re-detectan de forma individual.
+        
+        Args:
+            screenshot: Captura de pantalla actual
+        
+        Returns:
+            True si la disposición guardada es válida
+        """
+        if not self.ui_config.elements or not self.ui_config.fingerprint:
+            return False
+        
+        height, width = screenshot.shape[:2]
+        if (width, height) != (self.ui_config.screen_width, self.ui_config.screen_height):
+            self.logger.info("[INFO] Resolución distinta a la guardada, detectando de nuevo")
+            return False
+        
+        self.sentinel.restore(self.ui_config.fingerprint)
+        mismatched = self.sentinel.verify(screenshot)
+        if len(mismatched) * 2 > len(self.sentinel.references):
+            self.logger.info(f"[INFO] Disposición cambiada ({len(mismatched)} elementos), detectando de nuevo")
+            return False
+        
+        if mismatched:
+            self._redetect_elements(mismatched, screenshot)
         
+        self.logger.info(f"[INFO] ⚡ Disposición guardada reutilizada: {len(self.ui_config.elements)} elementos")
+        return True
+    
+    def _detect_element(self, element_name: str, screenshot) -> Optional[Dict[str, Any]]:
+        """
+        Ejecuta el detector de un único elemento
+        
+        Args:
+            element_name: Nombre del elemento (clave de ELEMENT_DETECTORS)
+            screenshot: Captura de pantalla actual
+        
+        Returns:
+            Posición en el formato de UIConfig.update_positions o None
+        """
+        method_name = ELEMENT_DETECTORS[element_name]
         try:
-            while self.is_running:
-                # Aquí iría la lógica de monitoreo
-                time.sleep(1)
+            if not hasattr(self.detector, method_name):
+                self.logger.warning(f"⚠️ Método {method_name} no disponible")
+                return None
+            
+            position = getattr(self.detector, method_name)(screenshot)
+            if not position:
+                self.logger.warning(f"⚠️ {element_name} no detectado")
+                return None
+            
+            self.logger.info(f"✅ {element_name} detectado: {position}")
+            return {
+                'x': position[0],
+                'y': position[1],
+                'width': position[2],
+                'height': position[3],
+                'confidence': 0.8,
+                'method': 'auto_detect'
+            }
+        except Exception as e:
+            self.logger.error(f"❌ Error detectando {element_name}: {e}")
+            return None
+    
+    def check_layout(self, screenshot) -> List[str]:
+        """
+        Comprueba el centinela y encola los elementos que cambiaron
+        
+        Es barato y puede ir en el tick crítico: la re-detección y el guardado
+        los hace process_layout en el hilo de disposición y hasta entonces se
+        siguen usando las últimas posiciones conocidas.
+        
+        Args:
+            screenshot: Captura de pantalla actual
+        
+        Returns:
+            Elementos encolados para re-detectar
+        """
+        # Con una re-detección en curso no se espera: se comprueba en otro frame
+        if not self.layout_lock.acquire(blocking=False):
+            return []
+        try:
+            # Con posiciones cargadas de archivo, el primer frame sirve de referencia
+            if not self.sentinel.references and self.ui_config.elements:
+                self.sentinel.arm(screenshot)
+                return []
+            
+            changed = self.sentinel.check(screenshot)
+            if changed:
+                self._layout_pending.update(changed)
+                self._layout_frame = screenshot
+                self._layout_wakeup.set()
+            return changed
+        finally:
+            self.layout_lock.release()
+    
+    def process_layout(self) -> List[str]:
+        """
+        Re-detecta los elementos encolados por check_layout
+        
+        Returns:
+            Elementos re-detectados con éxito
+        """
+        with self.layout_lock:
+            if not self._layout_pending:
+                return []
+            element_names = sorted(self._layout_pending)
+            screenshot = self._layout_frame
+            self._layout_pending.clear()
+            self._layout_frame = None
+            return self._redetect_elements(element_names, screenshot)
+    
+    def start_layout_worker(self):
+        """Arranca el hilo que re-detecta la disposición fuera de los ticks"""
+        if self._layout_worker is not None and self._layout_worker.is_alive():
+            return
+        self._layout_stop = threading.Event()
+        self._layout_worker = threading.Thread(target=self._layout_loop, args=(self._layout_stop,),
+                                               name='LayoutWorker', daemon=True)
+        self._layout_worker.start()
+    
+    def stop_layout_worker(self, timeout: float = 2.0):
+        """Detiene el hilo de disposición (lo encolado queda para process_layout)"""
+        worker, self._layout_worker = self._layout_worker, None
+        if worker is None:
+            return
+        self._layout_stop.set()
+        self._layout_wakeup.set()
+        worker.join(timeout)
+    
+    def _layout_loop(self, stop_event: threading.Event):
+        """Bucle del hilo de disposición: espera a check_layout y re-detecta"""
+        while not stop_event.is_set():
+            self._layout_wakeup.wait()
+            self._layout_wakeup.clear()
+            if stop_event.is_set():
+                break
+            try:
+                self.process_layout()
+            except Exception:
+                self.logger.exception("[ERROR] ❌ Error re-detectando la disposición")
+    
+    def _layout_read(self, read, screenshot):
+        """Lectura que depende de la disposición: no se solapa con una re-detección"""
+        with self.layout_lock:
+            return read(screenshot)
+    
+    def _try_layout(self, task, *args) -> bool:
+        """
+        Ejecuta una tarea con el cerrojo de disposición solo si está libre
+        
+        Para el bucle secuencial: con una re-detección en curso la tarea se
+        salta y se repite en otro tick en lugar de retrasar las curas.
+        """
+        if not self.layout_lock.acquire(blocking=False):
+            return False
+        try:
+            task(*args)
+            return True
+        finally:
+            self.layout_lock.release()
+    
+    def _redetect_elements(self, element_names: List[str], screenshot) -> List[str]:
+        """
+        Re-detecta elementos concretos y actualiza configuración y huella
+        
+        Un elemento que no se encuentra (p. ej. tapado en ese frame) conserva
+        su posición anterior y sigue vigilado por el centinela, así que se
+        vuelve a intentar en la siguiente comprobación.
+        
+        Args:
+            element_names: Elementos a re-detectar
+            screenshot: Captura de pantalla actual
+        
+        Returns:
+            Elementos re-detectados con éxito
+        """
+        redetected = []
+        with self.layout_lock:
+            for element_name in element_names:
+                retrying = element_name in self._layout_failed
+                if not retrying:
+                    self.logger.info(f"[INFO] 🔄 {element_name} cambió de posición, re-detectando...")
                 
+                position = None
+                if element_name in ELEMENT_DETECTORS:
+                    self.detector.redetecting.add(element_name)
+                    try:
+                        position = self._detect_element(element_name, screenshot)
+                    finally:
+                        self.detector.redetecting.discard(element_name)
+                
+                if not position:
+                    if not retrying:
+                        self.logger.warning(f"[WARNING] ⚠️ {element_name} no re-detectado, "
+                                            "se mantiene la posición anterior")
+                        self._layout_failed.add(element_name)
+                    continue
+                
+                # Cada elemento se sustituye entero: las lecturas sin cerrojo
+                # ven la posición anterior o la nueva, nunca un hueco
+                self._layout_failed.discard(element_name)
+                self.detector.forget_element(element_name)
+                self.ui_config.update_positions({element_name: position})
+                self.sentinel.arm(screenshot, [element_name])
+                redetected.append(element_name)
+            
+            if redetected:
+                self.ui_config.fingerprint = self.sentinel.export()
+                self.ui_config.save_to_file()
+        return redetected
+    
+    def attack_best_target(self, screenshot, captured_at: Optional[float] = None) -> Optional[Future]:
+        """
+        Lee la lista de batalla y ataca al mejor objetivo si hace falta
+        
+        El click se encola en el hilo de entrada como acción 'attack': una
+        cura pendiente pasa antes y el click no se intercala con otras teclas.
+        
+        Args:
+            screenshot: Captura de pantalla actual
+            captured_at: Instante monotónico de la captura
+        
+        Returns:
+            Future con el ActionResult (None si no hay objetivo nuevo)
+        """
+        self._layout_read(self.detector.read_battle_list, screenshot)
+        if not self.needs_target():
+            return None
+        return self.act('attack', captured_at, time.monotonic())
+    
+    def needs_target(self) -> bool:
+        """
+        Hay un objetivo en la lista de batalla y no se ataca a ninguno de ella
+        
+        Repetir el click sobre la criatura atacada la soltaría, así que solo
+        se ataca de nuevo cuando la anterior ya no está en la lista.
+        """
+        battle_list = self.detector.battle_list
+        return bool(battle_list.entries) and self._attacking not in battle_list.entries
+    
+    def _target_handler(self):
+        """Click en el mejor objetivo de la última lectura (None si no hace falta)"""
+        target = self.detector.battle_list.best_target()
+        if target is None or not self.needs_target():
+            return None
+        self._attacking = target.key
+        return partial(self.actions.attack_target, target_position=target.click_position)
+    
+    def loot_corpses(self, screenshot, captured_at: Optional[float] = None) -> List[Future]:
+        """
+        Lootea los cadáveres de las criaturas que acaban de morir
+        
+        Cada cadáver se encola en el hilo de entrada como acción 'loot' con su
+        propia clave, así que el ctrl+click derecho no se mezcla con una tecla
+        de cura y las curas le adelantan en la cola.
+        
+        Las criaturas se siguen en cada llamada; en combate los cadáveres
+        solo se apuntan y se lootean al terminar, si no son más antiguos que
+        loot_corpse_max_age.
+        
+        Args:
+            screenshot: Captura de pantalla actual
+            captured_at: Instante monotónico de la captura
+        
+        Returns:
+            Futures con el ActionResult de cada cadáver
+        """
+        with self.layout_lock:
+            self.detector.track_creatures(screenshot)
+            positions = self.detector.find_corpses(screenshot)
+        
+        now = time.monotonic()
+        for position in positions:
+            self._corpses.setdefault(position, now)
+        max_age = self.settings.loot_corpse_max_age
+        self._corpses = {position: seen for position, seen in self._corpses.items()
+                         if now - seen <= max_age}
+        
+        if (not self.settings.auto_loot_enabled or self.state.character_status.in_combat
+                or not self._corpses):
+            return []
+        
+        corpses, self._corpses = self._corpses, {}
+        return [self.actions.submit('loot', partial(self.actions.loot_corpse, (x, y)),
+                                    captured_at, now, key=f"loot:{x},{y}")
+                for x, y in corpses]
+    
+    def scan_world(self, screenshot, captured_at: Optional[float] = None):
+        """
+        Trabajo del carril normal: lista de batalla, ataque, criaturas y loot
+        
+        Corre en el carril normal, en una etapa lenta del pipeline o cada
+        pocos ticks del bucle secuencial.
+        
+        Args:
+            screenshot: Captura de pantalla actual
+            captured_at: Instante monotónico de la captura
+        """
+        if self.settings.auto_attack_enabled:
+            self.attack_best_target(screenshot, captured_at)
+        else:
+            self._layout_read(self.detector.read_battle_list, screenshot)
+        self.loot_corpses(screenshot, captured_at)
+    
+    def start_monitoring(self, max_ticks: Optional[int] = None):
+        """
+        Inicia el monitoreo automático a capture_fps ticks por segundo
+        
+        Args:
+            max_ticks: Número máximo de ciclos (None = hasta detenerlo)
+        """
+        self.logger.info(f"[INFO] 👁️ Iniciando monitoreo a {self.settings.capture_fps} ticks/s...")
+        self.is_running = True
+        self.state.update_bot_status(is_running=True, is_monitoring=True)
+        self.start_layout_worker()
+        
+        try:
+            self.scheduler.run(max_ticks)
         except KeyboardInterrupt:
             self.logger.info("[INFO] 🛑 Monitoreo detenido por usuario")
         except Exception as e:
             self.logger.error(f"[ERROR] ❌ Error en monitoreo: {e}")
         finally:
             self.is_running = False
+            self.stop_layout_worker()
+            self.state.update_bot_status(is_running=False, is_monitoring=False)
+            stats = self.scheduler.stats
+            self.logger.info(f"[INFO] Ticks: {stats.ticks}, plazos perdidos: {stats.missed_deadlines}, "
+                             f"saltados: {stats.skipped_ticks}, "
+                             f"duración media: {stats.average_duration * 1000:.1f} ms")
+            self.log_latency_report()
+    
+    def log_latency_report(self):
+        """Registra en el log los percentiles de latencia de cada acción"""
+        for name, summary in self.actions.get_latency_report().items():
+            self.logger.info(f"[INFO] Latencia {name}: p50 {summary['p50_ms']:.1f} ms, "
+                             f"p95 {summary['p95_ms']:.1f} ms, p99 {summary['p99_ms']:.1f} ms "
+                             f"(n={summary['count']})")
     
     def stop_monitoring(self):
         """Detiene el monitoreo"""
         self.logger.info("[INFO] ⏹️ Deteniendo monitoreo...")
         self.is_running = False
+        self.scheduler.stop()
+        if self.pipeline is not None:
+            self.pipeline.stop()
+        self.actions.dispatcher.cancel_pending()
+    
+    def start_async_monitoring(self, duration: Optional[float] = None) -> 'AsyncPipeline':
+        """
+        Monitoreo alternativo con etapas asyncio independientes
+        
+        La captura, la detección, el estado y las acciones se comunican por
+        colas acotadas; la lista de batalla (con criaturas y loot) y el chat
+        van en etapas lentas que no frenan la lectura de HP/MP.
+        
+        Args:
+            duration: Duración máxima en segundos (None = hasta detenerlo)
+        
+        Returns:
+            El pipeline ejecutado (para consultar sus métricas)
+        """
+        self.logger.info(f"[INFO] 👁️ Iniciando pipeline asíncrono a {self.settings.capture_fps} fps...")
+        self.pipeline = async_pipeline.AsyncPipeline(
+            capture=self.capturer.capture_full_screen,
+            detect=self._detect_frame,
+            update=lambda status: self.state.update_character_status(**status),
+            decide=self.decide,
+            act=self.act,
+            rate_hz=max(1, self.settings.capture_fps)
+        )
+        self.pipeline.add_slow_stage('world', self.scan_world, self.settings.lane_rates.get(NORMAL_LANE, 4.0))
+        self.pipeline.add_slow_stage(
+            'chat', lambda image: self._layout_read(self.detector.read_chat, image), 1)
+        self.pipeline.add_slow_stage('timers', lambda image: self.timers.run_due(), 2)
+        
+        self.is_running = True
+        self.start_layout_worker()
+        try:
+            self.pipeline.run(duration)
+        except KeyboardInterrupt:
+            self.logger.info("[INFO] 🛑 Monitoreo detenido por usuario")
+        finally:
+            self.is_running = False
+            self.stop_layout_worker()
+            for name, metrics in self.pipeline.get_metrics().items():
+                self.logger.info(f"[INFO] Etapa {name}: {metrics}")
+            self.log_latency_report()
+        return self.pipeline
+    
+    def start_lane_monitoring(self, duration: Optional[float] = None) -> LaneScheduler:
+        """
+        Monitoreo por carriles: cada nivel de trabajo tiene su hilo y frecuencia
+        
+        El carril crítico captura y decide curas; el normal lee la lista de
+        batalla, sigue las criaturas y lootea; el de fondo analiza minimapa y
+        chat y comprueba la disposición de la UI, que se re-detecta en su
+        propio hilo. Un análisis lento de fondo no retrasa las curas.
+        
+        Args:
+            duration: Duración en segundos (None = hasta Ctrl+C o stop_monitoring)
+        
+        Returns:
+            El planificador (para consultar sus estadísticas)
+        """
+        rates = self.settings.lane_rates
+        lanes = LaneScheduler(self.capturer.capture_frame)
+        lanes.add_lane(CRITICAL_LANE, rates.get(CRITICAL_LANE, 10.0), capture=True)
+        lanes.add_lane(NORMAL_LANE, rates.get(NORMAL_LANE, 4.0))
+        lanes.add_lane(BACKGROUND_LANE, rates.get(BACKGROUND_LANE, 1.0))
+        
+        lanes.add_task(CRITICAL_LANE, self._critical_task)
+        lanes.add_task(NORMAL_LANE, lambda frame: self.scan_world(frame.image, frame.captured_at))
+        lanes.add_task(BACKGROUND_LANE, lambda frame: self.check_layout(frame.image))
+        lanes.add_task(BACKGROUND_LANE,
+                       lambda frame: self._layout_read(self.detector.read_chat, frame.image))
+        lanes.add_task(BACKGROUND_LANE, lambda frame: self.timers.run_due())
+        
+        self.lanes = lanes
+        self.logger.info("[INFO] 👁️ Iniciando monitoreo por carriles "
+                         f"({', '.join(f'{n}={l.rate_hz}Hz' for n, l in lanes.lanes.items())})")
+        self.is_running = True
+        self.start_layout_worker()
+        lanes.start()
+        try:
+            end = None if duration is None else time.monotonic() + duration
+            while self.is_running and (end is None or time.monotonic() < end):
+                time.sleep(0.1)
+        except KeyboardInterrupt:
+            self.logger.info("[INFO] 🛑 Monitoreo detenido por usuario")
+        finally:
+            self.is_running = False
+            lanes.stop()
+            self.stop_layout_worker()
+            for name, stats in lanes.get_stats().items():
+                self.logger.info(f"[INFO] Carril {name}: {stats}")
+            self.log_latency_report()
+        return lanes
+    
+    def _critical_task(self, frame):
+        """Tarea del carril crítico: estado del personaje y curas"""
+        self.last_frame = frame
+        self.update_state(frame.image, frame.captured_at)
+        actions = self.decide()
+        decided_at = time.monotonic()
+        for action in actions:
+            self.act(action, frame.captured_at, decided_at)
+    
+    def read_action_bar(self, screenshot, captured_at: Optional[float] = None):
+        """Lee la barra de acciones y corrige con ella el modelo de cooldowns"""
+        # Desde el tick solo se lee: la barra se localiza al detectar la UI
+        if self.detector.action_bar.region is None:
+            return
+        if self._layout_read(self.detector.read_action_bar, screenshot):
+            self.actions.cooldowns.observe_action_bar(self.detector.action_bar, captured_at)
+    
+    def _detect_frame(self, frame) -> Dict[str, Any]:
+        """Etapa de detección del pipeline: centinela de UI (solo comprobación) y estado"""
+        self.last_frame = frame
+        self.check_layout(frame.image)
+        self._try_layout(self.read_action_bar, frame.image, frame.captured_at)
+        status = self.read_status(frame.image)
+        status['captured_at'] = frame.captured_at
+        return status
+    
+    def run_cycle(self, tick: int, deadline: float):
+        """
+        Un ciclo completo del bot (llamado por el planificador)
+        
+        Args:
+            tick: Número de ciclo
+            deadline: Instante programado del ciclo (monotónico)
+        """
+        try:
+            frame = self.capturer.capture_frame(tick)
+            self.last_frame = frame
+            self.check_layout(frame.image)
+            self.update_state(frame.image, frame.captured_at)
+            
+            actions = self.decide()
+            decided_at = time.monotonic()
+            for action in actions:
+                self.act(action, frame.captured_at, decided_at)
+            
+            if tick % self._scan_every == 0:
+                self._try_layout(self.scan_world, frame.image, frame.captured_at)
+            
+            self.timers.run_due()
+            self.state.update_bot_status(cycle_count=self.state.bot_status.cycle_count + 1)
+        except Exception as e:
+            self.logger.error(f"[ERROR] ❌ Error en el ciclo {tick}: {e}")
+            self.state.update_bot_status(error_count=self.state.bot_status.error_count + 1)
+    
+    def update_state(self, screenshot, captured_at: Optional[float] = None):
+        """
+        Lee barras y condiciones y actualiza el estado del personaje
+        
+        También lee la barra de acciones para que el modelo de cooldowns esté
+        al día antes de decidir (se salta durante una re-detección).
+        
+        Args:
+            screenshot: Captura de pantalla actual
+            captured_at: Instante monotónico de la captura
+        """
+        self._try_layout(self.read_action_bar, screenshot, captured_at)
+        self.state.update_character_status(captured_at=captured_at, **self.read_status(screenshot))
+    
+    def read_status(self, screenshot) -> Dict[str, Any]:
+        """
+        Detección pura del estado del personaje (sin modificar BotState)
+        
+        Args:
+            screenshot: Captura de pantalla actual
+        
+        Returns:
+            Campos para BotState.update_character_status
+        """
+        return {
+            'hp_percentage': self._read_stat('hp', screenshot, self.detector.analyze_health_bar),
+            'mp_percentage': self._read_stat('mp', screenshot, self.detector.analyze_mana_bar),
+            'conditions': self.detector.detect_conditions(screenshot),
+            # Con criaturas en la lista de batalla (última lectura) se está en combate
+            'in_combat': bool(self.detector.battle_list.entries)
+        }
+    
+    def decide(self) -> List[str]:
+        """
+        Decide las acciones del ciclo a partir del estado
+        
+        Returns:
+            Nombres de las acciones a ejecutar, por prioridad
+        """
+        actions = []
+        status = self.state.character_status
+        if self.settings.auto_heal_enabled and self.state.should_heal():
+            actions.append('heal')
+        if self.settings.auto_mana_enabled and self.state.should_use_mana_potion():
+            actions.append('mana_potion')
+        if self.settings.auto_cure_enabled:
+            if status.paralyzed:
+                actions.append('cure_paralysis')
+            # La cura del veneno comparte grupo con la de HP: nunca en su lugar
+            if status.poisoned and 'heal' not in actions:
+                actions.append('cure_poison')
+        if self.settings.auto_attack_enabled and self.needs_target():
+            actions.append('attack')
+        return actions
+    
+    def act(self, action: str, captured_at: Optional[float] = None,
+            decided_at: Optional[float] = None) -> Optional[Future]:
+        """
+        Envía una acción decidida al hilo de entrada sin esperarla
+        
+        Si la misma acción sigue pendiente de una decisión anterior no se
+        vuelve a encolar.
+        
+        Args:
+            action: Nombre de la acción
+            captured_at: Instante de la captura que la motivó (None = la del estado)
+            decided_at: Instante de la decisión (monotónico)
+        
+        Returns:
+            Future con el ActionResult (None si la acción es desconocida)
+        """
+        handlers = {
+            'heal': (self.actions.heal_character, 'heals_performed'),
+            'mana_potion': (self.actions.use_mana_potion, 'mana_potions_used'),
+            'food': (self.actions.eat_food, 'food_eaten'),
+            'cure_poison': (partial(self.actions.use_hotkey, 'cure_poison'), 'conditions_cured'),
+            'cure_paralysis': (partial(self.actions.use_hotkey, 'cure_paralysis'), 'conditions_cured'),
+            'attack': (self._target_handler, 'attacks_performed'),
+        }
+        if action not in handlers:
+            self.logger.warning(f"⚠️ Acción desconocida: {action}")
+            return None
+        
+        pending = self.pending_actions.get(action)
+        if pending is not None and not pending.done():
+            return pending
+        
+        handler, stat = handlers[action]
+        if action == 'attack':
+            # El objetivo se elige al encolar, con la última lectura de la lista
+            handler = handler()
+            if handler is None:
+                return None
+        if captured_at is None:
+            captured_at = self.state.character_status.captured_at
+        future = self.actions.submit(action, handler, captured_at, decided_at)
+        future.add_done_callback(lambda done: self._on_action_done(done, stat))
+        self.pending_actions[action] = future
+        return future
+    
+    def _on_action_done(self, future: Future, stat: str):
+        """Contabiliza una acción enviada por el hilo de entrada"""
+        if not future.cancelled() and future.exception() is None and future.result().success:
+            self.state.stats[stat] += 1
+    
+    def _read_stat(self, stat: str, screenshot, analyze) -> Optional[float]:
+        """
+        Porcentaje de HP o MP
+        
+        Si hay un cuadro numérico '<stat>_value' configurado se lee el valor
+        exacto 'actual/máximo' con los glifos; si no, se analiza la barra.
+        """
+        box = self._crop(f'{stat}_value', screenshot)
+        if box is not None:
+            percentage = self.detector.read_status_percentage(box)
+            if percentage is not None:
+                return percentage
+        return self._read_bar(f'{stat}_bar', screenshot, analyze)
+    
+    def _read_bar(self, element_name: str, screenshot, analyze) -> Optional[float]:
+        """Recorta una barra según la configuración de UI y la analiza"""
+        bar = self._crop(element_name, screenshot)
+        if bar is None:
+            return None
+        return analyze(bar)
+    
+    def _crop(self, element_name: str, screenshot):
+        """Recorte de un elemento de la configuración de UI (None si no está)"""
+        position = self.ui_config.get_position(element_name)
+        if not position:
+            return None
+        
+        x, y = position['x'], position['y']
+        crop = screenshot[y:y + position['height'], x:x + position['width']]
+        return crop if crop.size else None
     
     def emergency_stop(self):
         """Detención de emergencia"""
@@ -177,4 +918,11 @@ class TibiaBot:
             for name, element in self.ui_config.elements.items():
                 print(f"   • {name}: {element.width}x{element.height} en ({element.x}, {element.y})")
         
+        telemetry = self.get_skill_telemetry()
+        if telemetry['values']:
+            rate = telemetry['experience_per_hour']
+            print(f"\n📈 Nivel: {telemetry['values'].get('level', '?')}, "
+                  f"experiencia: {telemetry['values'].get('experience', '?')}"
+                  + (f" ({rate:.0f}/h)" if rate is not None else ""))
+        
         print("="*50)
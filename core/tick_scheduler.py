@@ -0,0 +1,118 @@
+"""
+Clase TickScheduler - Bucle a frecuencia fija con plazos absolutos
+"""
+import time
+from typing import Any, Callable, Dict, Optional
+from dataclasses import dataclass
+
+
+@dataclass
+class TickStats:
+    """Estadísticas de puntualidad del bucle"""
+    ticks: int = 0
+    missed_deadlines: int = 0
+    skipped_ticks: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    max_lateness: float = 0.0  # Retraso máximo del inicio de un tick
+
+    @property
+    def average_duration(self) -> float:
+        """Duración media de un tick en segundos"""
+        return self.total_duration / self.ticks if self.ticks else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte a diccionario"""
+        return {
+            'ticks': self.ticks,
+            'missed_deadlines': self.missed_deadlines,
+            'skipped_ticks': self.skipped_ticks,
+            'last_duration': self.last_duration,
+            'max_duration': self.max_duration,
+            'average_duration': self.average_duration,
+            'max_lateness': self.max_lateness
+        }
+
+
+class TickScheduler:
+    """Ejecuta una función a frecuencia fija durmiendo hasta plazos absolutos"""
+
+    def __init__(self, rate_hz: float, on_tick: Callable[[int, float], None],
+                 frame_skip: bool = True,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Inicializa el planificador
+
+        Args:
+            rate_hz: Ticks por segundo
+            on_tick: Función llamada con (número de tick, plazo programado)
+            frame_skip: Si un tick se pasa de su periodo, saltar los plazos
+                        vencidos en lugar de encadenar ticks para recuperarlos
+            clock: Reloj monotónico (inyectable para tests)
+            sleep: Función de espera (inyectable para tests)
+        """
+        if rate_hz <= 0:
+            raise ValueError("rate_hz debe ser positivo")
+
+        self.period = 1.0 / rate_hz
+        self.on_tick = on_tick
+        self.frame_skip = frame_skip
+        self.clock = clock
+        self.sleep = sleep
+
+        self.is_running = False
+        self.stats = TickStats()
+
+    def run(self, max_ticks: Optional[int] = None):
+        """
+        Ejecuta el bucle hasta stop() o hasta completar max_ticks
+
+        Args:
+            max_ticks: Número máximo de ticks (None = sin límite)
+        """
+        self.is_running = True
+        deadline = self.clock()
+        tick = 0
+
+        try:
+            while self.is_running and (max_ticks is None or tick < max_ticks):
+                now = self.clock()
+                if now < deadline:
+                    self.sleep(deadline - now)
+                    now = self.clock()
+
+                self.stats.max_lateness = max(self.stats.max_lateness, now - deadline)
+                self.on_tick(tick, deadline)
+                end = self.clock()
+                self._record(end - now)
+
+                tick += 1
+                deadline += self.period
+                if end > deadline:
+                    self.stats.missed_deadlines += 1
+                    if self.frame_skip:
+                        # Siguiente plazo de la rejilla que aún no ha vencido
+                        skipped = int((end - deadline) // self.period) + 1
+                        deadline += skipped * self.period
+                        self.stats.skipped_ticks += skipped
+        finally:
+            self.is_running = False
+
+    def stop(self):
+        """Detiene el bucle al terminar el tick en curso"""
+        self.is_running = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estadísticas del bucle"""
+        stats = self.stats.to_dict()
+        stats['period'] = self.period
+        return stats
+
+    def _record(self, duration: float):
+        """Acumula la duración de un tick"""
+        self.stats.ticks += 1
+        self.stats.last_duration = duration
+        self.stats.total_duration += duration
+        self.stats.max_duration = max(self.stats.max_duration, duration)
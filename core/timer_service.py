@@ -0,0 +1,162 @@
+"""
+Clase TimerService - Tareas periódicas con montículo de vencimientos
+"""
+import heapq
+import itertools
+import random
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Timer:
+    """Tarea periódica registrada"""
+    name: str
+    interval: float
+    callback: Callable[[], Any]
+    jitter: float = 0.0
+    due: float = 0.0
+    fires: int = 0
+    errors: int = 0
+    last_fired: Optional[float] = None
+    generation: int = 0  # Cambia al reprogramar o quitar: invalida entradas viejas del montículo
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte a diccionario"""
+        return {
+            'interval': self.interval,
+            'jitter': self.jitter,
+            'due': self.due,
+            'fires': self.fires,
+            'errors': self.errors,
+            'last_fired': self.last_fired
+        }
+
+
+class TimerService:
+    """
+    Dispara tareas periódicas (comer, guardar estado, runas...) desde el bucle
+
+    run_due() solo mira la cima del montículo: si nada ha vencido el coste
+    por tick es O(1) con independencia del número de tareas, y cada disparo
+    cuesta O(log n).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic,
+                 rng: Optional[random.Random] = None):
+        """
+        Inicializa el servicio
+
+        Args:
+            clock: Reloj monotónico (inyectable para tests)
+            rng: Generador para el jitter (inyectable para tests)
+        """
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.timers: Dict[str, Timer] = {}
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+
+    def add(self, name: str, interval: float, callback: Callable[[], Any],
+            jitter: float = 0.0, start_delay: Optional[float] = None) -> Timer:
+        """
+        Registra (o sustituye) una tarea periódica
+
+        Args:
+            name: Nombre único de la tarea
+            interval: Segundos entre disparos
+            callback: Función sin argumentos a ejecutar
+            jitter: Variación aleatoria ± en segundos de cada intervalo
+            start_delay: Retraso del primer disparo (None = un intervalo)
+
+        Returns:
+            El temporizador registrado
+        """
+        if interval <= 0:
+            raise ValueError("interval debe ser positivo")
+
+        previous = self.timers.get(name)
+        timer = Timer(name, interval, callback, jitter,
+                      generation=previous.generation + 1 if previous else 0)
+        self.timers[name] = timer
+        delay = self._next_interval(timer) if start_delay is None else start_delay
+        self._schedule(timer, self.clock() + delay)
+        return timer
+
+    def remove(self, name: str) -> bool:
+        """Quita una tarea; True si existía"""
+        timer = self.timers.pop(name, None)
+        if timer is None:
+            return False
+        timer.generation += 1
+        return True
+
+    def fire_now(self, name: str) -> bool:
+        """Adelanta el siguiente disparo de una tarea al próximo run_due()"""
+        timer = self.timers.get(name)
+        if timer is None:
+            return False
+        timer.generation += 1
+        self._schedule(timer, self.clock())
+        return True
+
+    def run_due(self, now: Optional[float] = None) -> int:
+        """
+        Ejecuta las tareas vencidas (llamar una vez por tick)
+
+        Args:
+            now: Instante actual (None = reloj)
+
+        Returns:
+            Número de tareas disparadas
+        """
+        now = self.clock() if now is None else now
+        fired = 0
+        while self._heap and self._heap[0][0] <= now:
+            due, _, generation, timer = heapq.heappop(self._heap)
+            if generation != timer.generation or self.timers.get(timer.name) is not timer:
+                continue
+
+            try:
+                timer.callback()
+            except Exception:
+                timer.errors += 1
+                logger.exception(f"Error en la tarea periódica {timer.name}")
+            timer.fires += 1
+            timer.last_fired = now
+            fired += 1
+
+            # Siguiente vencimiento en la rejilla; si se perdieron varios, contar desde ahora
+            next_due = due + self._next_interval(timer)
+            if next_due <= now:
+                next_due = now + self._next_interval(timer)
+            self._schedule(timer, next_due)
+        return fired
+
+    def next_due(self) -> Optional[float]:
+        """Instante del próximo vencimiento (None si no hay tareas)"""
+        while self._heap:
+            due, _, generation, timer = self._heap[0]
+            if generation == timer.generation and self.timers.get(timer.name) is timer:
+                return due
+            heapq.heappop(self._heap)
+        return None
+
+    def get_timers(self) -> Dict[str, Dict[str, Any]]:
+        """Estado de cada tarea"""
+        return {name: timer.to_dict() for name, timer in self.timers.items()}
+
+    def _next_interval(self, timer: Timer) -> float:
+        """Intervalo con jitter (nunca menor que la mitad del nominal)"""
+        if timer.jitter <= 0:
+            return timer.interval
+        return max(timer.interval / 2, timer.interval + self.rng.uniform(-timer.jitter, timer.jitter))
+
+    def _schedule(self, timer: Timer, due: float):
+        """Programa el siguiente vencimiento"""
+        timer.due = due
+        heapq.heappush(self._heap, (due, next(self._seq), timer.generation, timer))
@@ -5,7 +5,17 @@ Clase UIDetector - Detección de elementos de la interfaz de usuario
 import cv2
 import numpy as np
 import logging
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+from processors.glyph_reader import GlyphReader
+from detectors.chat_reader import ChatReader, ChatMessage
+from detectors.skills_detector import SkillsReader
+from detectors.battle_list_detector import BattleListDetector, BattleListChanges
+from detectors.viewport_detector import ViewportDetector
+from detectors.creature_tracker import CreatureTracker, CreatureTrack
+from detectors.loot_detector import CorpseFinder
+from detectors.condition_detector import ConditionDetector
+from detectors.action_bar_detector import ActionBarDetector, SlotState
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +25,40 @@ class UIDetector:
     def __init__(self, settings, ui_config):
         self.settings = settings
         self.ui_config = ui_config
+        
+        # Elementos en re-detección: sus detectores ignoran la posición guardada
+        self.redetecting: Set[str] = set()
+        
+        # Lector de la fuente bitmap para valores numéricos exactos
+        self.glyph_reader = GlyphReader(
+            glyphs_dir=getattr(settings, 'glyphs_dir', 'templates/glyphs'),
+            threshold=getattr(settings, 'glyph_threshold', 150)
+        )
+        if not self.glyph_reader.glyphs:
+            logger.warning("Sin glifos cargados: los valores exactos no se leerán y las barras "
+                           "se estimarán por relleno (crear con scripts/capture_glyphs.py)")
+        self.chat_reader = ChatReader(self.glyph_reader)
+        
+        # Ventana de habilidades: plantilla, ancla cacheada y lector incremental
+        self.skills_template_path = "templates/skills_icon.png"
+        self._skills_template = None
+        self._skills_anchor: Optional[Tuple[int, int]] = None
+        self.skills_reader = SkillsReader(self.glyph_reader)
+        
+        # Lista de batalla: se localiza una vez y luego se lee por filas
+        self.battle_list = BattleListDetector(settings, self.glyph_reader)
+        
+        # Vista de juego modelada como rejilla de tiles
+        self.viewport = ViewportDetector(settings)
+        self.creature_tracker = CreatureTracker(settings, self.viewport,
+                                               health_detector=self.battle_list.health_detector)
+        self.corpse_finder = CorpseFinder(settings, self.viewport)
+        
+        # Iconos de condición: sondas de píxel declaradas en la configuración
+        self.condition_detector = ConditionDetector(settings)
+        
+        # Barra de acciones: cooldowns y contadores de todos los slots a la vez
+        self.action_bar = ActionBarDetector(settings, self.glyph_reader)
         logger.info("UIDetector inicializado")
     
     # Métodos principales de detección
@@ -69,10 +113,32 @@ class UIDetector:
             return None
     
     def detect_skills_window(self, screenshot: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
-        """Detecta la ventana de habilidades"""
+        """Detecta la ventana de habilidades anclada en su icono"""
         try:
-            logger.warning("Detección de ventana de habilidades no implementada")
-            return None
+            template = self._load_skills_template()
+            if template is None:
+                logger.warning(f"Plantilla no encontrada: {self.skills_template_path}")
+                return None
+            
+            # Primero buscar alrededor del ancla cacheada, luego en toda la pantalla
+            anchor = None
+            if self._skills_anchor is not None:
+                anchor = self._match_skills_icon(screenshot, template, self._skills_anchor)
+            if anchor is None:
+                anchor = self._match_skills_icon(screenshot, template)
+            
+            if anchor is None:
+                self._skills_anchor = None
+                return None
+            
+            if anchor != self._skills_anchor:
+                self.skills_reader.reset()
+            self._skills_anchor = anchor
+            
+            width, height = self._skills_window_size()
+            screen_h, screen_w = screenshot.shape[:2]
+            x, y = anchor
+            return (x, y, min(width, screen_w - x), min(height, screen_h - y))
         except Exception as e:
             logger.error(f"Error detectando ventana de habilidades: {e}")
             return None
@@ -87,12 +153,51 @@ class UIDetector:
             logger.error(f"Error detectando chat: {e}")
             return None
     
+    def detect_battle_list(self, screenshot: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """Detecta el panel de la lista de batalla"""
+        try:
+            position = self._saved_position('battle_list')
+            if position:
+                self.battle_list.region = (position['x'], position['y'],
+                                           position['width'], position['height'])
+                return self.battle_list.region
+            return self.battle_list.locate(screenshot)
+        except Exception as e:
+            logger.error(f"Error detectando lista de batalla: {e}")
+            return None
+    
+    def detect_action_bar(self, screenshot: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """Detecta la barra de acciones"""
+        try:
+            position = self._saved_position('action_bar')
+            if position:
+                self.action_bar.region = (position['x'], position['y'],
+                                          position['width'], position['height'])
+                return self.action_bar.region
+            return self.action_bar.locate(screenshot)
+        except Exception as e:
+            logger.error(f"Error detectando barra de acciones: {e}")
+            return None
+    
+    def detect_viewport(self, screenshot: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """Detecta la vista de juego y deriva la rejilla de tiles"""
+        try:
+            position = self._saved_position('viewport')
+            if position:
+                grid = self.viewport.set_region(position['x'], position['y'],
+                                                position['width'], position['height'])
+            else:
+                grid = self.viewport.locate(screenshot)
+            return grid.region if grid else None
+        except Exception as e:
+            logger.error(f"Error detectando vista de juego: {e}")
+            return None
+    
     # Métodos de análisis
     def analyze_health_bar(self, bar_image: np.ndarray) -> float:
         """Analiza una imagen de barra de HP y devuelve el porcentaje"""
         try:
-            # Implementación simple: asume 100% por ahora
-            return 100.0
+            return self._analyze_bar(bar_image)
         except Exception as e:
             logger.error(f"Error analizando barra de HP: {e}")
             return 0.0
@@ -100,12 +205,201 @@ class UIDetector:
     def analyze_mana_bar(self, bar_image: np.ndarray) -> float:
         """Analiza una imagen de barra de MP y devuelve el porcentaje"""
         try:
-            # Implementación simple: asume 100% por ahora
-            return 100.0
+            return self._analyze_bar(bar_image)
         except Exception as e:
             logger.error(f"Error analizando barra de MP: {e}")
             return 0.0
     
+    def read_status_value(self, box_image: np.ndarray) -> Optional[Tuple[int, int]]:
+        """Lee un valor exacto 'actual/máximo' (HP, MP, capacidad)"""
+        try:
+            return self.glyph_reader.read_fraction(box_image)
+        except Exception as e:
+            logger.error(f"Error leyendo valor de estado: {e}")
+            return None
+    
+    def read_status_percentage(self, box_image: np.ndarray) -> Optional[float]:
+        """Porcentaje exacto de un cuadro 'actual/máximo' (None si no se pudo leer)"""
+        value = self.read_status_value(box_image)
+        if not value or value[1] <= 0:
+            return None
+        return max(0.0, min(100.0, value[0] * 100.0 / value[1]))
+    
+    def read_stack_count(self, slot_image: np.ndarray) -> Optional[int]:
+        """Lee el contador de stack de un slot (esquina inferior derecha)"""
+        try:
+            return self.glyph_reader.read_stack_count(slot_image)
+        except Exception as e:
+            logger.error(f"Error leyendo contador de stack: {e}")
+            return None
+    
+    def read_action_bar(self, screenshot: np.ndarray) -> List[SlotState]:
+        """Lee cooldown y contador de todos los slots de la barra de acciones"""
+        try:
+            if self.action_bar.region is None and self.detect_action_bar(screenshot) is None:
+                return []
+            return self.action_bar.read(screenshot)
+        except Exception as e:
+            logger.error(f"Error leyendo barra de acciones: {e}")
+            return []
+    
+    def read_chat(self, screenshot: np.ndarray) -> List[ChatMessage]:
+        """Lee solo los mensajes de chat nuevos desde el frame anterior"""
+        try:
+            position = self.ui_config.get_position('chat') if self.ui_config else None
+            if position:
+                region = (position['x'], position['y'], position['width'], position['height'])
+            else:
+                region = self.detect_chat_window(screenshot)
+            if not region:
+                return []
+            
+            x, y, w, h = region
+            return self.chat_reader.read(screenshot[y:y+h, x:x+w])
+        except Exception as e:
+            logger.error(f"Error leyendo chat: {e}")
+            return []
+    
+    def read_skills(self, screenshot: np.ndarray) -> Dict[str, int]:
+        """Lee las habilidades que cambiaron desde el frame anterior"""
+        try:
+            region = self.detect_skills_window(screenshot)
+            if not region:
+                return {}
+            
+            x, y, w, h = region
+            return self.skills_reader.read(screenshot[y:y+h, x:x+w])
+        except Exception as e:
+            logger.error(f"Error leyendo habilidades: {e}")
+            return {}
+    
+    def read_battle_list(self, screenshot: np.ndarray) -> BattleListChanges:
+        """Lee la lista de batalla y devuelve las filas añadidas/eliminadas/cambiadas"""
+        try:
+            if self.battle_list.region is None:
+                self.detect_battle_list(screenshot)
+            return self.battle_list.read(screenshot)
+        except Exception as e:
+            logger.error(f"Error leyendo lista de batalla: {e}")
+            return BattleListChanges()
+    
+    def track_creatures(self, screenshot: np.ndarray) -> List[CreatureTrack]:
+        """Actualiza el seguimiento de criaturas usando solo los tiles cambiados"""
+        try:
+            if self.viewport.grid is None and self.detect_viewport(screenshot) is None:
+                return []
+            changed = self.viewport.update(screenshot)
+            return self.creature_tracker.update(screenshot, changed)
+        except Exception as e:
+            logger.error(f"Error siguiendo criaturas: {e}")
+            return []
+    
+    def detect_conditions(self, screenshot: np.ndarray) -> Dict[str, bool]:
+        """Estado de los iconos de condición (envenenado, quemado, PZ...)"""
+        try:
+            anchors = {}
+            if self.ui_config:
+                anchors = {element.name: (element.x, element.y)
+                           for element in self.ui_config.get_all_elements()}
+            return self.condition_detector.detect(screenshot, anchors)
+        except Exception as e:
+            logger.error(f"Error detectando condiciones: {e}")
+            return {}
+    
+    def find_corpses(self, screenshot: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Posiciones de cadáveres de las criaturas muertas recientemente
+        
+        Debe llamarse después de track_creatures en el mismo frame: solo se
+        buscan sprites en los tiles de los tracks perdidos con HP bajo.
+        """
+        try:
+            self.corpse_finder.watch(self.creature_tracker.lost_tracks)
+            return self.corpse_finder.find(screenshot)
+        except Exception as e:
+            logger.error(f"Error buscando cadáveres: {e}")
+            return []
+    
+    def _saved_position(self, name: str) -> Optional[Dict[str, int]]:
+        """Posición guardada de un elemento (None si no hay o se está re-detectando)"""
+        if not self.ui_config or name in self.redetecting:
+            return None
+        return self.ui_config.get_position(name)
+    
+    def forget_element(self, name: str):
+        """
+        Descarta el estado cacheado de un elemento tras re-detectarlo
+        
+        Args:
+            name: Nombre del elemento en la configuración de UI
+        """
+        if name == 'battle_list':
+            self.battle_list.reset()
+        elif name == 'action_bar':
+            self.action_bar.reset()
+        elif name == 'skills':
+            self._skills_anchor = None
+            self.skills_reader.reset()
+        elif name == 'chat':
+            self.chat_reader.reset()
+        elif name == 'viewport':
+            self.viewport.grid = None
+            self.viewport.tile_hashes = None
+            self.creature_tracker.reset()
+    
+    def _load_skills_template(self) -> Optional[np.ndarray]:
+        """Carga la plantilla del icono de habilidades con cache"""
+        if self._skills_template is None:
+            self._skills_template = cv2.imread(self.skills_template_path)
+            if self._skills_template is not None:
+                self.skills_reader.header_height = self._skills_template.shape[0]
+        return self._skills_template
+    
+    def _match_skills_icon(self, screenshot: np.ndarray, template: np.ndarray,
+                           near: Optional[Tuple[int, int]] = None,
+                           margin: int = 8, max_rms: float = 20.0) -> Optional[Tuple[int, int]]:
+        """Busca el icono de habilidades (opcionalmente solo cerca de un ancla)"""
+        t_h, t_w = template.shape[:2]
+        offset_x, offset_y = 0, 0
+        search = screenshot
+        
+        if near is not None:
+            offset_x = max(0, near[0] - margin)
+            offset_y = max(0, near[1] - margin)
+            search = screenshot[offset_y:near[1] + t_h + margin,
+                                offset_x:near[0] + t_w + margin]
+        
+        if search.shape[0] < t_h or search.shape[1] < t_w:
+            return None
+        
+        # Diferencia cuadrática: las zonas planas no dan falsos positivos
+        result = cv2.matchTemplate(search, template, cv2.TM_SQDIFF)
+        min_val, _, min_loc, _ = cv2.minMaxLoc(result)
+        if np.sqrt(min_val / template.size) > max_rms:
+            return None
+        return (offset_x + min_loc[0], offset_y + min_loc[1])
+    
+    def _skills_window_size(self) -> Tuple[int, int]:
+        """Tamaño de la ventana de habilidades (configurado o por defecto)"""
+        element = self.ui_config.get_element('skills') if self.ui_config else None
+        if element and element.width > 0 and element.height > 0:
+            return (element.width, element.height)
+        return (200, 300)
+    
+    def _analyze_bar(self, bar_image: np.ndarray) -> float:
+        """Porcentaje exacto desde el texto de la barra, o estimado por relleno"""
+        if bar_image is None or bar_image.size == 0:
+            return 0.0
+        
+        percentage = self.read_status_percentage(bar_image)
+        if percentage is not None:
+            return percentage
+        
+        # Sin texto legible: fracción de columnas con relleno no oscuro
+        gray = bar_image.max(axis=2) if bar_image.ndim == 3 else bar_image
+        filled_columns = (gray > 60).mean(axis=0) > 0.5
+        return float(filled_columns.mean() * 100.0)
+    
     # Métodos adicionales para compatibilidad
     def detect_hp_bar(self, screenshot: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
         """Alias para detect_health_bar"""
@@ -0,0 +1,269 @@
+"""
+Clase ActionBarDetector - Lectura de cooldowns y contadores de la barra de acciones
+"""
+import hashlib
+import time
+import cv2
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+
+from config.settings import Settings
+from processors.glyph_reader import GlyphReader
+
+DEFAULT_SLOT_KEYS = [f"f{i}" for i in range(1, 13)]
+
+# Bloques por lado de la firma de color con la que se reconoce cada icono
+SIGNATURE_BLOCKS = 5
+
+
+@dataclass
+class SlotState:
+    """Estado de un slot de la barra de acciones"""
+    index: int
+    key: Optional[str]
+    cooldown: float          # Fracción cubierta por el overlay (0 = listo)
+    count: Optional[int]     # Contador de stack (None si no hay)
+    empty: bool
+    timestamp: float
+
+    @property
+    def ready(self) -> bool:
+        """True si el slot tiene algo y no está en cooldown"""
+        return not self.empty and self.cooldown < 0.05
+
+
+class ActionBarDetector:
+    """Lee todos los slots de la barra de acciones en una operación por frame"""
+
+    def __init__(self, settings: Settings, glyph_reader: GlyphReader,
+                 slot_size: int = 34, slot_gap: int = 2, slots: int = 12,
+                 border: int = 2, frame_color: Tuple[int, int, int] = (80, 80, 80),
+                 frame_tolerance: int = 12, dark_ratio: float = 0.6,
+                 empty_threshold: int = 35, chroma_tolerance: float = 0.08,
+                 swap_ratio: float = 0.3):
+        """
+        Inicializa el detector
+
+        Args:
+            settings: Configuración del bot
+            glyph_reader: Lector de glifos para los contadores
+            slot_size: Lado de cada slot (incluido el marco)
+            slot_gap: Separación entre slots
+            slots: Número máximo de slots de la barra
+            border: Grosor del marco del slot
+            frame_color: Color BGR del marco de los slots
+            frame_tolerance: Tolerancia por canal del color del marco
+            dark_ratio: Brillo relativo por debajo del cual un píxel está cubierto
+            empty_threshold: Brillo máximo de un slot vacío
+            chroma_tolerance: Diferencia de cromaticidad a partir de la cual un bloque cambió
+            swap_ratio: Fracción de bloques cambiados que indica otro icono en el slot
+        """
+        self.settings = settings
+        self.glyph_reader = glyph_reader
+        self.slot_size = slot_size
+        self.slot_gap = slot_gap
+        self.slots = slots
+        self.border = border
+        self.frame_color = np.array(frame_color, dtype=np.int16)
+        self.frame_tolerance = frame_tolerance
+        self.dark_ratio = dark_ratio
+        self.empty_threshold = empty_threshold
+        self.chroma_tolerance = chroma_tolerance
+        self.swap_ratio = swap_ratio
+
+        # Tecla de cada slot y slot de cada acción con nombre
+        self.slot_keys = [k.lower() for k in getattr(settings, 'action_bar_keys', DEFAULT_SLOT_KEYS)]
+        self.action_slots: Dict[str, int] = dict(getattr(settings, 'action_bar_slots', {}))
+        self.action_keys: Dict[str, str] = dict(getattr(settings, 'action_keys', {}))
+
+        self.region: Optional[Tuple[int, int, int, int]] = None
+        self.states: List[SlotState] = []
+
+        # Brillo de referencia (icono sin overlay) por slot, firma del icono
+        # del último frame y contadores cacheados
+        self._reference: Optional[np.ndarray] = None
+        self._signature: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._count_cache: Dict[bytes, Optional[int]] = {}
+
+    @property
+    def pitch(self) -> int:
+        """Distancia horizontal entre el inicio de dos slots consecutivos"""
+        return self.slot_size + self.slot_gap
+
+    def locate(self, screenshot: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Localiza la barra buscando marcos de slot alineados a intervalos fijos
+
+        Args:
+            screenshot: Captura de pantalla completa
+
+        Returns:
+            Región (x, y, w, h) de la barra o None
+        """
+        diff = np.abs(screenshot.astype(np.int16) - self.frame_color)
+        mask = (diff <= self.frame_tolerance).all(axis=2).astype(np.uint8)
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+
+        # Marcos candidatos agrupados por fila
+        rows: Dict[int, List[int]] = {}
+        for x, y, w, h, _ in stats[1:count]:
+            if abs(w - self.slot_size) <= 1 and abs(h - self.slot_size) <= 1:
+                rows.setdefault(int(y), []).append(int(x))
+
+        best = None
+        for y, xs in rows.items():
+            xs.sort()
+            aligned = [x for x in xs if (x - xs[0]) % self.pitch == 0]
+            if len(aligned) >= 2 and (best is None or len(aligned) > len(best[1])):
+                best = (y, aligned)
+
+        if best is None:
+            return None
+
+        y, xs = best
+        slots = min(self.slots, (xs[-1] - xs[0]) // self.pitch + 1)
+        self.region = (xs[0], y, slots * self.pitch - self.slot_gap, self.slot_size)
+        self._reference = None
+        self._signature = None
+        return self.region
+
+    def read(self, screenshot: np.ndarray) -> List[SlotState]:
+        """
+        Lee cooldown y contador de todos los slots
+
+        El cooldown se mide contra el brillo máximo visto en cada píxel del
+        slot, así que un slot que ya está en cooldown al arrancar se lee como
+        listo hasta que su icono se ve completo una vez. La referencia de un
+        slot se descarta cuando cambia su icono, reconocido por su firma de
+        cromaticidad (el overlay oscurece el icono pero no cambia su color).
+
+        Args:
+            screenshot: Captura de pantalla completa
+
+        Returns:
+            Estado de cada slot
+        """
+        if self.region is None and self.locate(screenshot) is None:
+            return []
+
+        x, y, w, h = self.region
+        slots = min(self.slots, (w + self.slot_gap) // self.pitch,
+                    (screenshot.shape[1] - x + self.slot_gap) // self.pitch)
+        bar = screenshot[y:y + self.slot_size, x:x + slots * self.pitch]
+        if slots <= 0 or bar.shape[0] < self.slot_size:
+            return []
+        if bar.shape[1] < slots * self.pitch:
+            bar = np.pad(bar, ((0, 0), (0, slots * self.pitch - bar.shape[1]), (0, 0)))
+
+        # Todos los slots como una pila (slots, lado, pitch, 3) en una sola vista
+        stack = bar.reshape(self.slot_size, slots, self.pitch, 3).swapaxes(0, 1)
+        b = self.border
+        inner = stack[:, b:self.slot_size - b, b:self.slot_size - b]
+
+        brightness = np.maximum(np.maximum(inner[..., 0], inner[..., 1]), inner[..., 2])
+        empty = brightness.reshape(slots, -1).max(axis=1) < self.empty_threshold
+
+        signature = self._icon_signature(inner)
+        if self._reference is None or self._reference.shape != brightness.shape:
+            self._reference = brightness.copy()
+        else:
+            # Otro objeto o hechizo en el slot: su referencia empieza de nuevo
+            swapped = self._icon_swapped(signature)
+            self._reference[swapped] = brightness[swapped]
+            np.maximum(self._reference, brightness, out=self._reference)
+        self._reference[empty] = 0
+        self._signature = signature
+
+        # Fracción del icono oscurecida respecto a su brillo de referencia
+        lit = self._reference >= self.empty_threshold
+        covered = lit & (brightness < self._reference * self.dark_ratio)
+        lit_count = lit.reshape(slots, -1).sum(axis=1)
+        cooldown = covered.reshape(slots, -1).sum(axis=1) / np.maximum(lit_count, 1)
+
+        now = time.monotonic()
+        self.states = [
+            SlotState(
+                index=i,
+                key=self.slot_keys[i] if i < len(self.slot_keys) else None,
+                cooldown=float(cooldown[i]) if not empty[i] else 0.0,
+                count=None if empty[i] else self._read_count(inner[i]),
+                empty=bool(empty[i]),
+                timestamp=now
+            )
+            for i in range(slots)
+        ]
+        return self.states
+
+    def get_slot(self, action: str) -> Optional[SlotState]:
+        """
+        Estado del slot de una acción
+
+        Args:
+            action: Nombre de la acción (ver action_bar_slots) o tecla del slot
+
+        Returns:
+            Estado del slot o None si no está en la barra
+        """
+        index = self.action_slots.get(action)
+        if index is None:
+            # Sin slot explícito: el de la tecla de la acción, o la propia tecla
+            key = self.action_keys.get(action, action).lower()
+            if key in self.slot_keys:
+                index = self.slot_keys.index(key)
+        if index is None or index >= len(self.states):
+            return None
+        return self.states[index]
+
+    def is_ready(self, action: str) -> bool:
+        """True salvo que el slot de la acción esté vacío o en cooldown"""
+        slot = self.get_slot(action)
+        return slot is None or slot.ready
+
+    def reset(self):
+        """Olvida la posición de la barra y las referencias de brillo"""
+        self.region = None
+        self.states = []
+        self._reference = None
+        self._signature = None
+
+    def _icon_signature(self, inner: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cromaticidad media por bloques de cada slot
+
+        Args:
+            inner: Pila (slots, alto, ancho, 3) del interior de los slots
+
+        Returns:
+            Cromaticidad (slots, n, n, 3) y máscara de bloques con brillo suficiente
+        """
+        n = SIGNATURE_BLOCKS
+        block = inner.shape[1] // n
+        blocks = inner[:, :n * block, :n * block].reshape(
+            inner.shape[0], n, block, n, block, 3).mean(axis=(2, 4))
+        total = blocks.sum(axis=3)
+        chroma = blocks / np.maximum(total, 1.0)[..., None]
+        return chroma, total >= self.empty_threshold
+
+    def _icon_swapped(self, signature: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        """Slots cuyo icono cambió respecto al frame anterior"""
+        chroma, valid = signature
+        if self._signature is None or self._signature[0].shape != chroma.shape:
+            return np.zeros(chroma.shape[0], dtype=bool)
+
+        previous, previous_valid = self._signature
+        both = valid & previous_valid
+        changed = both & (np.abs(chroma - previous).max(axis=3) > self.chroma_tolerance)
+        slots = chroma.shape[0]
+        changed_count = changed.reshape(slots, -1).sum(axis=1)
+        return changed_count > self.swap_ratio * np.maximum(both.reshape(slots, -1).sum(axis=1), 1)
+
+    def _read_count(self, slot: np.ndarray) -> Optional[int]:
+        """Contador de stack del slot (cacheado por el contenido de su esquina)"""
+        corner = self.glyph_reader.stack_count_region(slot)
+        key = hashlib.blake2b(self.glyph_reader.binarize(corner).tobytes(), digest_size=8).digest()
+        if key not in self._count_cache:
+            if len(self._count_cache) >= 1024:
+                self._count_cache.clear()
+            self._count_cache[key] = self.glyph_reader.read_stack_count(slot)
+        return self._count_cache[key]
@@ -0,0 +1,243 @@
+"""
+Clase BattleListDetector - Lectura de la lista de batalla por filas
+"""
+import hashlib
+import cv2
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+from config.settings import Settings
+from processors.glyph_reader import GlyphReader
+from detectors.health_detector import HealthDetector
+
+
+@dataclass
+class BattleEntry:
+    """Criatura visible en una fila de la lista de batalla"""
+    index: int
+    name: str
+    hp_percentage: float
+    key: Tuple[bytes, int]
+    region: Tuple[int, int, int, int]  # (x, y, w, h) en pantalla
+
+    @property
+    def click_position(self) -> Tuple[int, int]:
+        """Punto de la fila donde hacer click para atacar"""
+        x, y, w, h = self.region
+        return (x + w // 2, y + h // 2)
+
+
+@dataclass
+class BattleListChanges:
+    """Diferencias de la lista de batalla respecto al frame anterior"""
+    added: List[BattleEntry] = field(default_factory=list)
+    removed: List[BattleEntry] = field(default_factory=list)
+    changed: List[BattleEntry] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """True si hubo cualquier cambio"""
+        return bool(self.added or self.removed or self.changed)
+
+
+class BattleListDetector:
+    """Detector de la lista de batalla con diff por filas y ranking de objetivos"""
+
+    def __init__(self, settings: Settings, glyph_reader: GlyphReader,
+                 row_height: int = 22, icon_width: int = 22, name_height: int = 12,
+                 bar_offset: int = 15, bar_height: int = 4, max_rows: int = 16,
+                 name_cache_size: int = 256):
+        """
+        Inicializa el detector
+
+        Args:
+            settings: Configuración del bot
+            glyph_reader: Lector de glifos para los nombres
+            row_height: Alto de cada fila de la lista
+            icon_width: Ancho del icono de la criatura (a la izquierda)
+            name_height: Alto de la zona del nombre
+            bar_offset: Desplazamiento vertical de la barra de HP dentro de la fila
+            bar_height: Alto de la barra de HP
+            max_rows: Máximo de filas a leer
+            name_cache_size: Máximo de nombres en el cache LRU forma -> texto
+        """
+        self.settings = settings
+        self.glyph_reader = glyph_reader
+        self.health_detector = HealthDetector(settings)
+        self.row_height = row_height
+        self.icon_width = icon_width
+        self.name_height = name_height
+        self.bar_offset = bar_offset
+        self.bar_height = bar_height
+        self.max_rows = max_rows
+
+        self.region: Optional[Tuple[int, int, int, int]] = None
+        self.entries: Dict[Tuple[bytes, int], BattleEntry] = {}
+        self.ranked_targets: List[BattleEntry] = []
+        self.name_cache_size = name_cache_size
+        self._name_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+    def locate(self, screenshot: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Localiza el panel buscando barras de HP apiladas a intervalos de fila
+
+        Args:
+            screenshot: Captura de pantalla completa
+
+        Returns:
+            Región (x, y, w, h) del panel o None
+        """
+        mask = HealthDetector.fill_mask(screenshot).astype(np.uint8)
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+
+        # Barras candidatas agrupadas por columna de inicio
+        columns: Dict[int, List[Tuple[int, int, int]]] = {}
+        for x, y, w, h, _ in stats[1:count]:
+            if 10 <= w <= 200 and 2 <= h <= self.bar_height + 2:
+                columns.setdefault(int(x) - self.icon_width, []).append((int(y), int(w), int(h)))
+
+        best = None
+        for x, bars in columns.items():
+            bars.sort()
+            stacked = [bars[0]]
+            for bar in bars[1:]:
+                offset = (bar[0] - stacked[0][0]) % self.row_height
+                if min(offset, self.row_height - offset) <= 1:
+                    stacked.append(bar)
+            if len(stacked) >= 2 and (best is None or len(stacked) > len(best[1])):
+                best = (x, stacked)
+
+        if best is None:
+            return None
+
+        x, bars = best
+        top = bars[0][0] - self.bar_offset
+        width = self.icon_width + max(w for _, w, _ in bars)
+        height = min(self.max_rows * self.row_height, screenshot.shape[0] - top)
+        self.region = (max(0, x), max(0, top), width, height)
+        return self.region
+
+    def read(self, screenshot: np.ndarray) -> BattleListChanges:
+        """
+        Lee la lista de batalla y devuelve solo lo que cambió
+
+        Args:
+            screenshot: Captura de pantalla completa
+
+        Returns:
+            Filas añadidas, eliminadas y con HP cambiado
+        """
+        if self.region is None and self.locate(screenshot) is None:
+            return BattleListChanges()
+
+        x, y, w, h = self.region
+        rows = min(self.max_rows, h // self.row_height)
+        panel = screenshot[y:y + rows * self.row_height, x:x + w]
+        if panel.shape[0] < self.row_height:
+            return BattleListChanges()
+
+        rows = panel.shape[0] // self.row_height
+        row_view = panel[:rows * self.row_height].reshape(rows, self.row_height, panel.shape[1], 3)
+
+        # Todas las barras de HP en una sola operación
+        bar_regions = [(x + self.icon_width, y + row * self.row_height + self.bar_offset,
+                        panel.shape[1] - self.icon_width, self.bar_height)
+                       for row in range(rows)]
+        hp_values = self.health_detector.analyze_batch(screenshot, bar_regions)
+
+        names = row_view[:, :self.name_height, self.icon_width:]
+        # Misma binarización que GlyphReader (canal más brillante) para toda la pila
+        name_masks = names.max(axis=3) > self.glyph_reader.threshold
+        occupied = name_masks.reshape(rows, -1).any(axis=1)
+
+        current: Dict[Tuple[bytes, int], BattleEntry] = {}
+        occurrences: Dict[bytes, int] = {}
+        for index in np.flatnonzero(occupied):
+            name_hash = self._name_key(name_masks[index])
+            occurrence = occurrences.get(name_hash, 0)
+            occurrences[name_hash] = occurrence + 1
+
+            key = (name_hash, occurrence)
+            row_y = y + int(index) * self.row_height
+            current[key] = BattleEntry(
+                index=int(index),
+                name=self._read_name(name_hash, names[index, 1:-1, 1:-1]),
+                hp_percentage=float(hp_values[index]),
+                key=key,
+                region=(x, row_y, w, self.row_height)
+            )
+
+        changes = BattleListChanges()
+        for key, entry in current.items():
+            previous = self.entries.get(key)
+            if previous is None:
+                changes.added.append(entry)
+            elif abs(previous.hp_percentage - entry.hp_percentage) >= 1.0:
+                changes.changed.append(entry)
+        changes.removed = [entry for key, entry in self.entries.items() if key not in current]
+
+        self.entries = current
+        if changes.has_changes:
+            self._rank_targets()
+        else:
+            self._update_positions()
+
+        return changes
+
+    def best_target(self) -> Optional[BattleEntry]:
+        """Mejor objetivo según el ranking actual"""
+        return self.ranked_targets[0] if self.ranked_targets else None
+
+    def get_ranked_targets(self) -> List[BattleEntry]:
+        """Objetivos ordenados por prioridad (menos HP primero)"""
+        return list(self.ranked_targets)
+
+    def reset(self):
+        """Olvida la posición del panel y las filas conocidas"""
+        self.region = None
+        self.entries.clear()
+        self.ranked_targets = []
+
+    def _rank_targets(self):
+        """Ordena objetivos: menor HP primero y, a igualdad, el más arriba"""
+        self.ranked_targets = sorted(
+            self.entries.values(), key=lambda e: (e.hp_percentage, e.index)
+        )
+
+    def _update_positions(self):
+        """Mantiene el ranking apuntando a las entradas actuales"""
+        self.ranked_targets = [self.entries[e.key] for e in self.ranked_targets
+                               if e.key in self.entries]
+
+    @staticmethod
+    def _name_key(name_mask: np.ndarray) -> bytes:
+        """
+        Clave de un nombre a partir de su forma binarizada
+        
+        Sin el borde de 1 píxel (marco de objetivo) y recortada a la tinta, la
+        clave no cambia al resaltar, seleccionar o recolorear la fila.
+        """
+        inner = name_mask[1:-1, 1:-1]
+        rows = np.flatnonzero(inner.any(axis=1))
+        cols = np.flatnonzero(inner.any(axis=0))
+        if rows.size == 0:
+            return b''
+        glyphs = inner[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+        digest = hashlib.blake2b(np.packbits(glyphs).tobytes(), digest_size=8)
+        digest.update(np.array(glyphs.shape, dtype=np.int32).tobytes())
+        return digest.digest()
+
+    def _read_name(self, name_hash: bytes, name_image: np.ndarray) -> str:
+        """Nombre de la criatura (solo se reconoce la primera vez; cache LRU)"""
+        name = self._name_cache.get(name_hash)
+        if name is not None:
+            self._name_cache.move_to_end(name_hash)
+            return name
+
+        name = self.glyph_reader.read(name_image).strip()
+        self._name_cache[name_hash] = name
+        if len(self._name_cache) > self.name_cache_size:
+            self._name_cache.popitem(last=False)
+        return name
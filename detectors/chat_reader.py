@@ -0,0 +1,142 @@
+"""
+Clase ChatReader - Lectura incremental de la ventana de chat
+"""
+import time
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+from dataclasses import dataclass
+
+from processors.glyph_reader import GlyphReader
+
+
+@dataclass
+class ChatMessage:
+    """Mensaje nuevo leído del chat"""
+    text: str
+    row_hash: bytes
+    timestamp: float
+
+
+class ChatReader:
+    """Lector de chat que solo reconoce las filas que no ha visto antes"""
+
+    def __init__(self, glyph_reader: GlyphReader, cache_size: int = 512):
+        """
+        Inicializa el lector de chat
+
+        Args:
+            glyph_reader: Lector de glifos usado para reconocer filas nuevas
+            cache_size: Máximo de filas en el cache LRU hash -> texto
+        """
+        self.glyph_reader = glyph_reader
+        self.cache_size = cache_size
+        self.row_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self.previous_hashes: List[bytes] = []
+
+        self.stats = {
+            'frames': 0,
+            'rows_seen': 0,
+            'cache_hits': 0,
+            'rows_recognized': 0,
+            'messages_emitted': 0
+        }
+
+    def split_rows(self, chat_image: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Divide la región de chat en filas de texto
+
+        Args:
+            chat_image: Región de la ventana de chat
+
+        Returns:
+            Lista de (y_inicio, y_fin) de cada fila
+        """
+        return self._row_bounds(self.glyph_reader.binarize(chat_image))
+
+    def _row_bounds(self, mask: np.ndarray) -> List[Tuple[int, int]]:
+        """Tramos de filas con tinta en una máscara binarizada"""
+        rows = mask.any(axis=1)
+        edges = np.diff(np.concatenate(([0], rows.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return [(int(y0), int(y1)) for y0, y1 in zip(starts, ends)]
+
+    def read(self, chat_image: np.ndarray) -> List[ChatMessage]:
+        """
+        Lee los mensajes nuevos desde el frame anterior
+
+        En la primera llamada todas las filas visibles se consideran nuevas.
+
+        Args:
+            chat_image: Región de la ventana de chat
+
+        Returns:
+            Lista de mensajes nuevos, en orden de aparición
+        """
+        if chat_image is None or chat_image.size == 0:
+            return []
+
+        self.stats['frames'] += 1
+        mask = self.glyph_reader.binarize(chat_image)
+        row_bounds = self._row_bounds(mask)
+        hashes = [self._row_hash(mask[y0:y1]) for y0, y1 in row_bounds]
+        self.stats['rows_seen'] += len(hashes)
+
+        # Las filas antiguas suben al hacer scroll: solo las del final son nuevas
+        overlap = self._overlap(self.previous_hashes, hashes)
+        self.previous_hashes = hashes
+
+        now = time.time()
+        messages = []
+        for (y0, y1), row_hash in zip(row_bounds[overlap:], hashes[overlap:]):
+            text = self._recognize(row_hash, chat_image[y0:y1])
+            if text:
+                messages.append(ChatMessage(text, row_hash, now))
+
+        self.stats['messages_emitted'] += len(messages)
+        return messages
+
+    def reset(self):
+        """Olvida el frame anterior (ej. al cambiar de canal)"""
+        self.previous_hashes = []
+
+    def get_stats(self) -> Dict[str, int]:
+        """Obtiene estadísticas de uso del cache"""
+        stats = self.stats.copy()
+        stats['cache_size'] = len(self.row_cache)
+        return stats
+
+    def _recognize(self, row_hash: bytes, row_image: np.ndarray) -> str:
+        """Texto de una fila, usando el cache LRU antes de reconocer"""
+        text = self.row_cache.get(row_hash)
+        if text is not None:
+            self.row_cache.move_to_end(row_hash)
+            self.stats['cache_hits'] += 1
+            return text
+
+        text = self.glyph_reader.read(row_image)
+        self.stats['rows_recognized'] += 1
+
+        self.row_cache[row_hash] = text
+        if len(self.row_cache) > self.cache_size:
+            self.row_cache.popitem(last=False)
+
+        return text
+
+    @staticmethod
+    def _row_hash(row_mask: np.ndarray) -> bytes:
+        """Hash de los píxeles binarizados de una fila"""
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(np.array(row_mask.shape, dtype=np.int32).tobytes())
+        digest.update(np.packbits(row_mask, axis=None).tobytes())
+        return digest.digest()
+
+    @staticmethod
+    def _overlap(previous: List[bytes], current: List[bytes]) -> int:
+        """Mayor sufijo del frame anterior que es prefijo del frame actual"""
+        for size in range(min(len(previous), len(current)), 0, -1):
+            if previous[-size:] == current[:size]:
+                return size
+        return 0
@@ -0,0 +1,95 @@
+"""
+Clase ConditionDetector - Iconos de condición leídos con sondas de píxel
+"""
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+
+from config.settings import Settings
+
+
+class ConditionDetector:
+    """Evalúa todas las sondas de condición con una única indexación"""
+
+    def __init__(self, settings: Settings, probes: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Inicializa el detector
+
+        Cada sonda define 'points' (lista de (x, y)), 'color' (BGR),
+        'tolerance' por canal, 'anchor' opcional (elemento de UI al que son
+        relativos los puntos) y 'min_matches' (por defecto, todos los puntos).
+
+        Args:
+            settings: Configuración del bot
+            probes: Tabla de sondas (None = settings.condition_probes)
+        """
+        self.settings = settings
+        self.probes = probes if probes is not None else getattr(settings, 'condition_probes', {})
+        self.names = list(self.probes.keys())
+
+        # Tabla compilada (se rehace cuando cambian las anclas)
+        self._anchors: Optional[Dict[str, Tuple[int, int]]] = None
+        self._xs = self._ys = self._owner = None
+        self._colors = self._tolerances = self._required = None
+
+    def compile(self, anchors: Optional[Dict[str, Tuple[int, int]]] = None):
+        """
+        Aplana todas las sondas en arrays de coordenadas y colores
+
+        Args:
+            anchors: Posición (x, y) de los elementos de UI usados como ancla
+        """
+        anchors = anchors or {}
+        xs, ys, owner, colors, tolerances = [], [], [], [], []
+        required = np.zeros(len(self.names), dtype=np.int32)
+
+        for index, name in enumerate(self.names):
+            probe = self.probes[name]
+            anchor = probe.get('anchor')
+            if anchor and anchor not in anchors:
+                required[index] = -1  # Sin ancla: la condición no se evalúa
+                continue
+
+            ox, oy = anchors.get(anchor, (0, 0)) if anchor else (0, 0)
+            points = probe.get('points', [])
+            for px, py in points:
+                xs.append(ox + px)
+                ys.append(oy + py)
+                owner.append(index)
+                colors.append(probe.get('color', (0, 0, 0)))
+                tolerances.append(probe.get('tolerance', 30))
+            required[index] = probe.get('min_matches', len(points)) if points else -1
+
+        self._xs = np.array(xs, dtype=np.intp)
+        self._ys = np.array(ys, dtype=np.intp)
+        self._owner = np.array(owner, dtype=np.intp)
+        self._colors = np.array(colors, dtype=np.int16).reshape(-1, 3)
+        self._tolerances = np.array(tolerances, dtype=np.int16)
+        self._required = required
+        self._anchors = dict(anchors)
+
+    def detect(self, screenshot: np.ndarray,
+               anchors: Optional[Dict[str, Tuple[int, int]]] = None) -> Dict[str, bool]:
+        """
+        Evalúa todas las condiciones
+
+        Args:
+            screenshot: Captura de pantalla completa
+            anchors: Posición de los elementos ancla (None = las últimas usadas)
+
+        Returns:
+            Diccionario condición -> activa
+        """
+        if self._xs is None or (anchors is not None and anchors != self._anchors):
+            self.compile(anchors if anchors is not None else self._anchors)
+
+        height, width = screenshot.shape[:2]
+        inside = (self._xs >= 0) & (self._xs < width) & (self._ys >= 0) & (self._ys < height)
+
+        # Todas las sondas en una sola lectura de píxeles
+        samples = screenshot[self._ys.clip(0, height - 1), self._xs.clip(0, width - 1)]
+        diff = np.abs(samples.astype(np.int16) - self._colors)
+        hits = (diff <= self._tolerances[:, None]).all(axis=1) & inside
+
+        counts = np.bincount(self._owner, weights=hits, minlength=len(self.names))
+        active = (self._required > 0) & (counts >= self._required)
+        return dict(zip(self.names, active.tolist()))
@@ -0,0 +1,263 @@
+"""
+Clase CreatureTracker - Detección y seguimiento de criaturas en la vista de juego
+"""
+import time
+import cv2
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+from config.settings import Settings
+from detectors.health_detector import HealthDetector
+from detectors.viewport_detector import ViewportDetector, TILE_SIZE
+
+# Ancho nativo del relleno de la barra de HP sobre las criaturas
+CREATURE_BAR_WIDTH = 25
+
+
+@dataclass
+class CreatureDetection:
+    """Barra de HP detectada en un frame (coordenadas de la vista alineada)"""
+    bar: Tuple[int, int, int, int]   # (x, y, w, h) del relleno
+    body: Tuple[float, float, float, float]  # caja del tile estimado de la criatura
+    hp_percentage: float
+
+
+@dataclass
+class CreatureTrack:
+    """Criatura seguida entre frames"""
+    track_id: int
+    body: Tuple[float, float, float, float]
+    hp_percentage: float
+    velocity: Tuple[float, float] = (0.0, 0.0)  # píxeles de vista por segundo
+    last_seen: float = field(default_factory=time.monotonic)
+    hits: int = 1
+    misses: int = 0
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """Centro de la criatura en coordenadas de la vista"""
+        x, y, w, h = self.body
+        return (x + w / 2, y + h / 2)
+
+
+class CreatureTracker:
+    """Seguimiento de criaturas por sus barras de HP con asociación IoU voraz"""
+
+    def __init__(self, settings: Settings, viewport: ViewportDetector,
+                 iou_threshold: float = 0.3, max_misses: int = 3,
+                 velocity_smoothing: float = 0.5,
+                 health_detector: Optional[HealthDetector] = None):
+        """
+        Inicializa el tracker
+
+        Args:
+            settings: Configuración del bot
+            viewport: Detector de la vista de juego (rejilla y tiles cambiados)
+            iou_threshold: IoU mínimo para asociar detección y track
+            max_misses: Frames sin detección antes de dar un track por perdido
+            velocity_smoothing: Peso de la nueva medida en la velocidad (0-1)
+            health_detector: Detector con el que leer el HP de las barras
+        """
+        self.settings = settings
+        self.viewport = viewport
+        self.health_detector = health_detector or HealthDetector(settings)
+        self.iou_threshold = iou_threshold
+        self.max_misses = max_misses
+        self.velocity_smoothing = velocity_smoothing
+
+        self.tracks: Dict[int, CreatureTrack] = {}
+        self.lost_tracks: List[CreatureTrack] = []
+        self._next_id = 1
+        self._last_update: Optional[float] = None
+
+        # Máscara de relleno de barras, cacheada para los tiles sin cambios
+        self._bar_mask: Optional[np.ndarray] = None
+
+    def update(self, screenshot: np.ndarray,
+               changed: Optional[np.ndarray] = None) -> List[CreatureTrack]:
+        """
+        Detecta barras en los tiles cambiados y actualiza los tracks
+
+        Args:
+            screenshot: Captura de pantalla completa
+            changed: Máscara de tiles cambiados (None = calcularla con el viewport)
+
+        Returns:
+            Tracks activos
+        """
+        if changed is None:
+            changed = self.viewport.update(screenshot)
+
+        self.lost_tracks = []
+        view = self.viewport.view(screenshot)
+        if view is None:
+            return []
+
+        now = time.monotonic()
+        detections = self.detect(view, changed)
+        self._associate(detections, now)
+        self._last_update = now
+
+        return self.get_tracks()
+
+    def detect(self, view: np.ndarray, changed: np.ndarray) -> List[CreatureDetection]:
+        """
+        Detecta barras de HP clasificando solo los tiles cambiados
+
+        Args:
+            view: Imagen de la vista alineada a la rejilla
+            changed: Máscara (filas, columnas) de tiles cambiados
+
+        Returns:
+            Detecciones del frame
+        """
+        grid = self.viewport.grid
+        rows, columns = changed.shape
+        tile = grid.tile_pixels
+
+        if self._bar_mask is None or self._bar_mask.shape != view.shape[:2]:
+            self._bar_mask = np.zeros(view.shape[:2], dtype=np.uint8)
+            changed = np.ones_like(changed)
+
+        # Clasificación de color vectorizada sobre la pila de tiles cambiados
+        row_idx, col_idx = np.nonzero(changed)
+        if row_idx.size:
+            tiles = view.reshape(rows, tile, columns, tile, 3)
+            mask_tiles = self._bar_mask.reshape(rows, tile, columns, tile)
+            mask_tiles[row_idx, :, col_idx] = HealthDetector.fill_mask(tiles[row_idx, :, col_idx])
+
+        count, _, stats, _ = cv2.connectedComponentsWithStats(self._bar_mask, connectivity=4)
+        if count <= 1:
+            return []
+
+        x, y, w, h = (stats[1:, i] for i in range(4))
+        factor = tile / TILE_SIZE
+        bar_width = CREATURE_BAR_WIDTH * factor
+        candidates = np.flatnonzero(
+            (w <= bar_width + 1) & (h >= 2 * factor) & (h <= 5 * factor) &
+            (y >= 1) & (y + h < view.shape[0] - 1)
+        )
+
+        # Las barras de criatura tienen borde oscuro arriba y abajo
+        bars = []
+        for i in candidates:
+            above = view[y[i] - 1, x[i]:x[i] + w[i]]
+            below = view[y[i] + h[i], x[i]:x[i] + w[i]]
+            if above.max() <= 60 and below.max() <= 60:
+                bars.append(i)
+
+        # HP de todas las barras en una pasada, sobre el ancho completo de cada una
+        full_width = int(round(bar_width))
+        regions = [(int(x[i]), int(y[i]), min(full_width, view.shape[1] - int(x[i])), int(h[i]))
+                   for i in bars]
+        hp_values = self.health_detector.analyze_batch(view, regions)
+
+        detections = []
+        for i, hp in zip(bars, hp_values):
+            # La criatura ocupa un tile centrado bajo la barra completa
+            body = (float(x[i]) + bar_width / 2 - tile / 2,
+                    float(y[i] + h[i]) + 2 * factor,
+                    float(tile), float(tile))
+            detections.append(CreatureDetection(
+                bar=(int(x[i]), int(y[i]), int(w[i]), int(h[i])),
+                body=body,
+                hp_percentage=float(hp)
+            ))
+
+        return detections
+
+    def get_tracks(self) -> List[CreatureTrack]:
+        """Tracks activos (vistos en el último frame o recientemente)"""
+        return list(self.tracks.values())
+
+    def screen_position(self, track: CreatureTrack) -> Tuple[int, int]:
+        """Posición en pantalla del centro de una criatura"""
+        return self.viewport.grid.to_screen(*track.center)
+
+    def reset(self):
+        """Elimina todos los tracks y la máscara cacheada"""
+        self.tracks.clear()
+        self.lost_tracks = []
+        self._bar_mask = None
+        self._last_update = None
+
+    def _associate(self, detections: List[CreatureDetection], now: float):
+        """Asociación voraz por IoU usando la posición predicha de cada track"""
+        dt = now - self._last_update if self._last_update is not None else 0.0
+        track_ids = list(self.tracks.keys())
+
+        matches: List[Tuple[int, int]] = []
+        if track_ids and detections:
+            predicted = np.array([self._predict(self.tracks[t], dt) for t in track_ids])
+            boxes = np.array([d.body for d in detections])
+            iou = self._iou_matrix(predicted, boxes)
+
+            while True:
+                t, d = np.unravel_index(np.argmax(iou), iou.shape)
+                if iou[t, d] < self.iou_threshold:
+                    break
+                matches.append((track_ids[t], int(d)))
+                iou[t, :] = -1.0
+                iou[:, d] = -1.0
+
+        matched_tracks = set()
+        matched_detections = set()
+        for track_id, index in matches:
+            self._update_track(self.tracks[track_id], detections[index], dt, now)
+            matched_tracks.add(track_id)
+            matched_detections.add(index)
+
+        for track_id in track_ids:
+            if track_id in matched_tracks:
+                continue
+            track = self.tracks[track_id]
+            track.misses += 1
+            if track.misses > self.max_misses:
+                self.lost_tracks.append(self.tracks.pop(track_id))
+
+        for index, detection in enumerate(detections):
+            if index not in matched_detections:
+                self.tracks[self._next_id] = CreatureTrack(
+                    track_id=self._next_id,
+                    body=detection.body,
+                    hp_percentage=detection.hp_percentage,
+                    last_seen=now
+                )
+                self._next_id += 1
+
+    def _update_track(self, track: CreatureTrack, detection: CreatureDetection,
+                      dt: float, now: float):
+        """Actualiza posición, velocidad y HP de un track asociado"""
+        if dt > 0:
+            vx = (detection.body[0] - track.body[0]) / dt
+            vy = (detection.body[1] - track.body[1]) / dt
+            alpha = self.velocity_smoothing
+            track.velocity = (alpha * vx + (1 - alpha) * track.velocity[0],
+                              alpha * vy + (1 - alpha) * track.velocity[1])
+
+        track.body = detection.body
+        track.hp_percentage = detection.hp_percentage
+        track.last_seen = now
+        track.hits += 1
+        track.misses = 0
+
+    @staticmethod
+    def _predict(track: CreatureTrack, dt: float) -> Tuple[float, float, float, float]:
+        """Caja predicha del track tras dt segundos"""
+        x, y, w, h = track.body
+        return (x + track.velocity[0] * dt, y + track.velocity[1] * dt, w, h)
+
+    @staticmethod
+    def _iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """IoU entre todas las cajas (x, y, w, h) de a y b"""
+        ax1, ay1 = a[:, 0, None], a[:, 1, None]
+        ax2, ay2 = ax1 + a[:, 2, None], ay1 + a[:, 3, None]
+        bx1, by1 = b[None, :, 0], b[None, :, 1]
+        bx2, by2 = bx1 + b[None, :, 2], by1 + b[None, :, 3]
+
+        inter_w = np.clip(np.minimum(ax2, bx2) - np.maximum(ax1, bx1), 0, None)
+        inter_h = np.clip(np.minimum(ay2, by2) - np.maximum(ay1, by1), 0, None)
+        inter = inter_w * inter_h
+        union = a[:, 2, None] * a[:, 3, None] + b[None, :, 2] * b[None, :, 3] - inter
+        return inter / np.maximum(union, 1e-6)
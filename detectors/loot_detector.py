@@ -0,0 +1,166 @@
+"""
+Clase CorpseFinder - Localización de cadáveres en tiles de muertes recientes
+"""
+import time
+import cv2
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import Settings
+from detectors.viewport_detector import ViewportDetector
+from detectors.creature_tracker import CreatureTrack
+
+
+class CorpseFinder:
+    """Busca cadáveres solo en los tiles donde acaba de morir una criatura"""
+
+    def __init__(self, settings: Settings, viewport: ViewportDetector,
+                 corpses_dir: Optional[str] = None, death_hp_threshold: float = 30.0,
+                 watch_seconds: float = 3.0, match_threshold: float = 0.8):
+        """
+        Inicializa el buscador de cadáveres
+
+        Args:
+            settings: Configuración del bot
+            viewport: Detector de la vista de juego
+            corpses_dir: Directorio con sprites de cadáveres (None = configuración)
+            death_hp_threshold: HP máximo del último frame para considerar muerte
+            watch_seconds: Tiempo que se vigila un tile tras la muerte
+            match_threshold: Correlación mínima para aceptar un cadáver
+        """
+        self.settings = settings
+        self.viewport = viewport
+        self.corpses_dir = corpses_dir or getattr(settings, 'corpses_dir', 'templates/corpses')
+        self.death_hp_threshold = death_hp_threshold
+        self.watch_seconds = watch_seconds
+        self.match_threshold = match_threshold
+
+        # Sprites originales y su índice precalculado al tamaño de tile
+        self.sprites: Dict[str, np.ndarray] = self._load_sprites(self.corpses_dir)
+        self._index: Optional[np.ndarray] = None
+        self._index_names: List[str] = []
+        self._index_tile = 0
+
+        # Tiles vigilados: (columna, fila) -> instante de expiración
+        self.pending: Dict[Tuple[int, int], float] = {}
+
+    def add_sprite(self, name: str, sprite: np.ndarray):
+        """Añade un sprite de cadáver al índice"""
+        self.sprites[name] = sprite
+        self._index = None
+
+    def watch(self, lost_tracks: List[CreatureTrack], now: Optional[float] = None):
+        """
+        Registra los tiles de criaturas que murieron
+
+        Una criatura perdida cuenta como muerta si su último HP era bajo y no
+        estaba en el borde de la vista (donde pudo simplemente salir).
+
+        Args:
+            lost_tracks: Tracks perdidos en el último frame
+            now: Instante actual (monotónico)
+        """
+        grid = self.viewport.grid
+        if grid is None:
+            return
+
+        now = time.monotonic() if now is None else now
+        tile = grid.tile_pixels
+        for track in lost_tracks:
+            if track.hp_percentage > self.death_hp_threshold:
+                continue
+            cx, cy = track.center
+            column, row = int(cx // tile), int(cy // tile)
+            if 0 < column < grid.columns - 1 and 0 < row < grid.rows - 1:
+                self.pending[(column, row)] = now + self.watch_seconds
+
+    def find(self, screenshot: np.ndarray, now: Optional[float] = None) -> List[Tuple[int, int]]:
+        """
+        Busca cadáveres en los tiles vigilados
+
+        Args:
+            screenshot: Captura de pantalla completa
+            now: Instante actual (monotónico)
+
+        Returns:
+            Posiciones de pantalla donde hacer click para lootear
+        """
+        now = time.monotonic() if now is None else now
+        self.pending = {t: expiry for t, expiry in self.pending.items() if expiry > now}
+        if not self.pending or not self.sprites or self.viewport.grid is None:
+            return []
+
+        view = self.viewport.view(screenshot)
+        grid = self.viewport.grid
+        tile = grid.tile_pixels
+        index = self._get_index(tile)
+        if index is None:
+            return []
+
+        # Tile de la muerte y sus vecinos (la posición estimada es aproximada)
+        candidates = sorted({
+            (column + dc, row + dr)
+            for column, row in self.pending
+            for dc in (-1, 0, 1) for dr in (-1, 0, 1)
+            if 0 <= column + dc < grid.columns and 0 <= row + dr < grid.rows
+        })
+        columns = np.array([c for c, _ in candidates])
+        rows = np.array([r for _, r in candidates])
+
+        tiles = view.reshape(grid.rows, tile, grid.columns, tile, 3)[rows, :, columns]
+        scores = self._normalize(tiles) @ index.T
+        best = scores.max(axis=1)
+
+        positions = []
+        found = set()
+        for i in np.argsort(-best):
+            if best[i] < self.match_threshold:
+                break
+            column, row = candidates[i]
+            death = next(((c, r) for c, r in self.pending
+                          if abs(c - column) <= 1 and abs(r - row) <= 1 and (c, r) not in found), None)
+            if death is None:
+                continue
+            found.add(death)
+            positions.append(grid.tile_center(column, row))
+
+        for death in found:
+            del self.pending[death]
+
+        return positions
+
+    def _get_index(self, tile: int) -> Optional[np.ndarray]:
+        """Índice de sprites normalizados al tamaño de tile (cacheado)"""
+        if self._index is None or self._index_tile != tile:
+            names, vectors = [], []
+            for name, sprite in self.sprites.items():
+                resized = cv2.resize(sprite, (tile, tile), interpolation=cv2.INTER_NEAREST)
+                vector = self._normalize(resized[None])[0]
+                if vector.any():
+                    names.append(name)
+                    vectors.append(vector)
+            self._index = np.array(vectors, dtype=np.float32) if vectors else None
+            self._index_names = names
+            self._index_tile = tile
+        return self._index
+
+    @staticmethod
+    def _normalize(tiles: np.ndarray) -> np.ndarray:
+        """Vectores de media cero y norma uno (correlación por producto escalar)"""
+        vectors = tiles.reshape(tiles.shape[0], -1).astype(np.float32)
+        vectors -= vectors.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    @staticmethod
+    def _load_sprites(corpses_dir: str) -> Dict[str, np.ndarray]:
+        """Carga los sprites de cadáveres de un directorio"""
+        sprites = {}
+        directory = Path(corpses_dir)
+        if directory.exists():
+            for path in sorted(directory.glob('*.png')):
+                sprite = cv2.imread(str(path))
+                if sprite is not None:
+                    sprites[path.stem] = sprite
+        return sprites
@@ -0,0 +1,133 @@
+"""
+Clase SkillsReader - Lectura incremental de la ventana de habilidades
+"""
+import time
+import hashlib
+import numpy as np
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from processors.glyph_reader import GlyphReader
+
+# Filas de la ventana de habilidades, en orden de aparición
+DEFAULT_SKILL_ROWS = [
+    'level', 'experience', 'xp_gain_rate', 'hit_points', 'mana',
+    'soul_points', 'capacity', 'speed', 'food', 'stamina',
+    'offline_training', 'magic_level', 'fist', 'club', 'sword',
+    'axe', 'distance', 'shielding', 'fishing'
+]
+
+
+class SkillsReader:
+    """Lee los valores de habilidades releyendo solo las filas que cambian"""
+
+    def __init__(self, glyph_reader: GlyphReader, row_height: int = 14,
+                 header_height: int = 30, value_column: float = 0.55,
+                 skill_rows: Optional[List[str]] = None, history_size: int = 500):
+        """
+        Inicializa el lector de habilidades
+
+        Args:
+            glyph_reader: Lector de glifos para los valores numéricos
+            row_height: Alto de cada fila en píxeles
+            header_height: Alto de la cabecera de la ventana (icono)
+            value_column: Fracción del ancho donde empieza la columna de valores
+            skill_rows: Nombres de las filas en orden (None = por defecto)
+            history_size: Cambios guardados por habilidad para telemetría
+        """
+        self.glyph_reader = glyph_reader
+        self.row_height = row_height
+        self.header_height = header_height
+        self.value_column = value_column
+        self.skill_rows = skill_rows or list(DEFAULT_SKILL_ROWS)
+
+        self.values: Dict[str, int] = {}
+        self.row_hashes: Dict[str, bytes] = {}
+        self.history: Dict[str, Deque[Tuple[float, int]]] = {
+            name: deque(maxlen=history_size) for name in self.skill_rows
+        }
+
+        self.stats = {'frames': 0, 'rows_read': 0, 'rows_skipped': 0}
+
+    def read(self, window_image: np.ndarray) -> Dict[str, int]:
+        """
+        Lee la ventana de habilidades de forma incremental
+
+        Args:
+            window_image: Región de la ventana (incluida la cabecera)
+
+        Returns:
+            Diccionario con las habilidades cuyo valor cambió
+        """
+        if window_image is None or window_image.size == 0:
+            return {}
+
+        self.stats['frames'] += 1
+        height, width = window_image.shape[:2]
+        x0 = int(width * self.value_column)
+        now = time.time()
+        changed = {}
+
+        for index, name in enumerate(self.skill_rows):
+            y0 = self.header_height + index * self.row_height
+            y1 = y0 + self.row_height
+            if y1 > height:
+                break
+
+            row = window_image[y0:y1, x0:]
+            row_hash = hashlib.blake2b(row.tobytes(), digest_size=8).digest()
+            if self.row_hashes.get(name) == row_hash:
+                self.stats['rows_skipped'] += 1
+                continue
+
+            self.stats['rows_read'] += 1
+            value = self.glyph_reader.read_number(row)
+            if value is None and self.glyph_reader.binarize(row).any():
+                # Hay texto pero no se pudo leer (render parcial o sin glifos):
+                # sin guardar el hash se vuelve a intentar en el próximo frame
+                continue
+
+            self.row_hashes[name] = row_hash
+            if value is None or self.values.get(name) == value:
+                continue
+
+            self.values[name] = value
+            self.history[name].append((now, value))
+            changed[name] = value
+
+        return changed
+
+    def get_value(self, name: str) -> Optional[int]:
+        """Obtiene el último valor leído de una habilidad"""
+        return self.values.get(name)
+
+    def get_rate(self, name: str, window_seconds: float = 3600.0) -> Optional[float]:
+        """
+        Calcula el ritmo de ganancia de una habilidad
+
+        Args:
+            name: Nombre de la habilidad (ej. 'experience')
+            window_seconds: Ventana de tiempo a considerar
+
+        Returns:
+            Ganancia por hora o None si no hay datos suficientes
+        """
+        history = self.history.get(name)
+        if not history or len(history) < 2:
+            return None
+
+        last_time, last_value = history[-1]
+        first_time, first_value = history[-1]
+        for timestamp, value in reversed(history):
+            if last_time - timestamp > window_seconds:
+                break
+            first_time, first_value = timestamp, value
+
+        elapsed = last_time - first_time
+        if elapsed <= 0:
+            return None
+        return (last_value - first_value) * 3600.0 / elapsed
+
+    def reset(self):
+        """Fuerza la relectura completa en el próximo frame"""
+        self.row_hashes.clear()
@@ -0,0 +1,216 @@
+"""
+Clase ViewportDetector - Modelo de la vista de juego como rejilla de tiles
+"""
+import cv2
+import numpy as np
+from typing import List, Optional, Tuple
+from dataclasses import dataclass
+
+from config.settings import Settings
+
+# Tamaño nativo de un tile y tiles visibles en la vista de juego
+TILE_SIZE = 32
+VISIBLE_COLUMNS = 15
+VISIBLE_ROWS = 11
+
+
+@dataclass
+class TileGrid:
+    """Rejilla de tiles de la vista de juego en coordenadas de pantalla"""
+    x: int
+    y: int
+    tile_size: float  # Tamaño en pantalla de un tile (depende del zoom)
+    columns: int = VISIBLE_COLUMNS
+    rows: int = VISIBLE_ROWS
+
+    @property
+    def scale(self) -> float:
+        """Zoom de la vista respecto al tamaño nativo"""
+        return self.tile_size / TILE_SIZE
+
+    @property
+    def region(self) -> Tuple[int, int, int, int]:
+        """Región (x, y, w, h) de la vista en pantalla"""
+        return (self.x, self.y,
+                int(round(self.columns * self.tile_size)),
+                int(round(self.rows * self.tile_size)))
+
+    @property
+    def tile_pixels(self) -> int:
+        """Tamaño de tile en la imagen alineada a la rejilla"""
+        size = int(round(self.tile_size))
+        return size if abs(size - self.tile_size) < 1e-6 else TILE_SIZE
+
+    def tile_rect(self, column: int, row: int) -> Tuple[int, int, int, int]:
+        """Región en pantalla de un tile"""
+        return (int(round(self.x + column * self.tile_size)),
+                int(round(self.y + row * self.tile_size)),
+                int(round(self.tile_size)), int(round(self.tile_size)))
+
+    def tile_center(self, column: int, row: int) -> Tuple[int, int]:
+        """Centro en pantalla de un tile (para hacer click)"""
+        return (int(self.x + (column + 0.5) * self.tile_size),
+                int(self.y + (row + 0.5) * self.tile_size))
+
+    def tile_at(self, screen_x: float, screen_y: float) -> Optional[Tuple[int, int]]:
+        """Tile (columna, fila) que contiene un punto de pantalla"""
+        column = int((screen_x - self.x) // self.tile_size)
+        row = int((screen_y - self.y) // self.tile_size)
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return (column, row)
+        return None
+
+    def to_screen(self, view_x: float, view_y: float) -> Tuple[int, int]:
+        """Convierte coordenadas de la imagen alineada a coordenadas de pantalla"""
+        factor = self.tile_size / self.tile_pixels
+        return (int(self.x + view_x * factor), int(self.y + view_y * factor))
+
+
+class ViewportDetector:
+    """Detector de la vista de juego con hash de cambios por tile"""
+
+    def __init__(self, settings: Settings, columns: int = VISIBLE_COLUMNS,
+                 rows: int = VISIBLE_ROWS):
+        """
+        Inicializa el detector
+
+        Args:
+            settings: Configuración del bot
+            columns: Tiles visibles en horizontal
+            rows: Tiles visibles en vertical
+        """
+        self.settings = settings
+        self.columns = columns
+        self.rows = rows
+
+        self.grid: Optional[TileGrid] = None
+        self.tile_hashes: Optional[np.ndarray] = None
+        self.changed: Optional[np.ndarray] = None
+        self._weights: Optional[np.ndarray] = None
+
+        self.stats = {'frames': 0, 'tiles_changed': 0}
+
+    def locate(self, screenshot: np.ndarray) -> Optional[TileGrid]:
+        """
+        Localiza la vista de juego por su proporción de tiles
+
+        Args:
+            screenshot: Captura de pantalla completa
+
+        Returns:
+            Rejilla de tiles o None
+        """
+        gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+        edges = cv2.Canny(gray, 50, 150)
+        contours, _ = cv2.findContours(edges, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+
+        expected_ratio = self.columns / self.rows
+        min_area = screenshot.shape[0] * screenshot.shape[1] * 0.1
+        best = None
+
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            if w * h < min_area:
+                continue
+            if abs(w / h - expected_ratio) > expected_ratio * 0.03:
+                continue
+            if best is None or w * h > best[2] * best[3]:
+                best = (x, y, w, h)
+
+        if best is None:
+            return None
+
+        x, y, w, h = best
+        return self.set_region(x, y, w, h)
+
+    def set_region(self, x: int, y: int, width: int, height: int) -> TileGrid:
+        """
+        Fija la región de la vista (ej. desde la configuración de UI)
+
+        Returns:
+            Rejilla de tiles derivada de la región
+        """
+        tile_size = min(width / self.columns, height / self.rows)
+        self.grid = TileGrid(x, y, tile_size, self.columns, self.rows)
+        self.tile_hashes = None
+        self.changed = None
+        self._weights = None
+        return self.grid
+
+    def view(self, screenshot: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Imagen de la vista alineada a la rejilla
+
+        Con zoom entero es un recorte sin copia; con zoom fraccional se
+        reescala al tamaño nativo de tile.
+        """
+        if self.grid is None:
+            return None
+
+        x, y, w, h = self.grid.region
+        crop = screenshot[y:y + h, x:x + w]
+        tile_pixels = self.grid.tile_pixels
+        size = (self.columns * tile_pixels, self.rows * tile_pixels)
+
+        if crop.shape[1] == size[0] and crop.shape[0] == size[1]:
+            return crop
+        return cv2.resize(crop, size, interpolation=cv2.INTER_NEAREST)
+
+    def update(self, screenshot: np.ndarray) -> np.ndarray:
+        """
+        Calcula el hash de cada tile y marca los que cambiaron
+
+        Args:
+            screenshot: Captura de pantalla completa
+
+        Returns:
+            Máscara booleana (filas, columnas) de tiles cambiados
+        """
+        if self.grid is None and self.locate(screenshot) is None:
+            return np.zeros((self.rows, self.columns), dtype=bool)
+
+        hashes = self.compute_tile_hashes(self.view(screenshot))
+
+        if self.tile_hashes is None:
+            changed = np.ones_like(hashes, dtype=bool)
+        else:
+            changed = hashes != self.tile_hashes
+
+        self.tile_hashes = hashes
+        self.changed = changed
+
+        self.stats['frames'] += 1
+        self.stats['tiles_changed'] += int(changed.sum())
+        return changed
+
+    def compute_tile_hashes(self, view: np.ndarray) -> np.ndarray:
+        """
+        Hash de cada tile con un único reshape y una reducción
+
+        Args:
+            view: Imagen alineada a la rejilla (filas*t, columnas*t, 3)
+
+        Returns:
+            Array uint32 (filas, columnas)
+        """
+        tile = self.grid.tile_pixels
+        if self._weights is None or self._weights.shape[0] != tile:
+            rng = np.random.default_rng(TILE_SIZE)
+            self._weights = rng.integers(1, 2 ** 32, size=(tile, tile, 3), dtype=np.uint32)
+
+        tiles = view.reshape(self.rows, tile, self.columns, tile, 3)
+        return np.einsum('ayczk,yzk->ac', tiles, self._weights)
+
+    def changed_tiles(self) -> List[Tuple[int, int]]:
+        """Lista de tiles (columna, fila) que cambiaron en el último frame"""
+        if self.changed is None:
+            return []
+        rows, columns = np.nonzero(self.changed)
+        return [(int(c), int(r)) for r, c in zip(rows, columns)]
+
+    def get_stats(self) -> dict:
+        """Estadísticas de tiles cambiados"""
+        stats = self.stats.copy()
+        total = self.stats['frames'] * self.rows * self.columns
+        stats['changed_ratio'] = self.stats['tiles_changed'] / total if total else 0.0
+        return stats
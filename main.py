@@ -10,7 +10,9 @@ print("="*50)
 
 def main():
     try:
-        from core.tibia_bot import TibiaBot
+        from utils.startup import startup_report
+        with startup_report.timed('core.tibia_bot', 'import'):
+            from core.tibia_bot import TibiaBot
         
         print("\n⚙️  Inicializando bot...")
         bot = TibiaBot(
@@ -20,6 +22,7 @@ def main():
         )
         
         print("✅ Bot inicializado")
+        startup_report.print_report()
         print("\n🔍 Ejecutando detección automática...")
         
         # Ejecutar detección
@@ -45,22 +48,13 @@ def main():
                     print("\n👁️  Iniciando monitoreo básico...")
                     print("⚠️  Presiona Ctrl+C para detener")
                     
-                    try:
-                        # Monitoreo simple sin OBS
-                        import time
-                        bot.is_running = True
-                        
-                        print("\n📊 Monitoreo iniciado:")
-                        print("   • Comprobando HP/MP cada 2 segundos")
-                        print("   • No hay integración con OBS")
-                        
-                        while bot.is_running:
-                            # Aquí iría la lógica de monitoreo
-                            time.sleep(2)
-                            
-                    except KeyboardInterrupt:
-                        print("\n🛑 Monitoreo detenido")
-                        bot.is_running = False
+                    print("\n📊 Monitoreo iniciado:")
+                    print(f"   • Comprobando HP/MP a {bot.settings.capture_fps} ticks por segundo")
+                    print("   • No hay integración con OBS")
+                    
+                    # Bloquea hasta Ctrl+C (el bot captura la interrupción)
+                    bot.start_monitoring()
+                    print("\n🛑 Monitoreo detenido")
                         
                 elif opcion == "2":
                     print("\n📊 Estado del bot:")
@@ -0,0 +1,251 @@
+"""
+Clase GlyphReader - Lectura de texto con la fuente bitmap fija del cliente
+"""
+import re
+import cv2
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Nombres de archivo para caracteres que no pueden usarse en rutas
+GLYPH_FILE_NAMES = {
+    'slash': '/',
+    'colon': ':',
+    'dot': '.',
+    'comma': ',',
+    'percent': '%',
+    'dash': '-',
+    'plus': '+',
+    'lparen': '(',
+    'rparen': ')',
+    'question': '?',
+}
+
+_FRACTION_PATTERN = re.compile(r'(\d+)\s*/\s*(\d+)')
+
+
+class GlyphReader:
+    """Lector de texto por coincidencia exacta de glifos (sin OCR)"""
+
+    def __init__(self, glyphs_dir: Optional[str] = None, threshold: int = 150,
+                 space_width: int = 3, unknown_char: str = '?'):
+        """
+        Inicializa el lector de glifos
+
+        Args:
+            glyphs_dir: Directorio con un PNG por glifo (None = diccionario vacío)
+            threshold: Brillo mínimo para considerar un píxel como texto
+            space_width: Separación mínima entre columnas para insertar un espacio
+            unknown_char: Carácter devuelto para glifos desconocidos
+        """
+        self.threshold = threshold
+        self.space_width = space_width
+        self.unknown_char = unknown_char
+
+        # Diccionario precalculado: (alto, ancho, bits) -> carácter
+        self.glyphs: Dict[Tuple[int, int, bytes], str] = {}
+
+        if glyphs_dir:
+            self.load_glyphs(glyphs_dir)
+
+    def load_glyphs(self, glyphs_dir: str) -> int:
+        """
+        Carga los glifos de un directorio
+
+        Args:
+            glyphs_dir: Directorio con imágenes '<carácter>.png'
+
+        Returns:
+            Número de glifos cargados
+        """
+        directory = Path(glyphs_dir)
+        if not directory.exists():
+            return 0
+
+        loaded = 0
+        for path in sorted(directory.glob('*.png')):
+            char = GLYPH_FILE_NAMES.get(path.stem, path.stem)
+            if len(char) != 1:
+                continue
+
+            image = cv2.imread(str(path))
+            if image is None:
+                continue
+
+            mask = self._trim(self.binarize(image))
+            if mask is not None:
+                self.register_glyph(char, mask)
+                loaded += 1
+
+        return loaded
+
+    def save_glyphs(self, glyphs_dir: str) -> int:
+        """
+        Guarda el diccionario de glifos como imágenes
+
+        Args:
+            glyphs_dir: Directorio destino
+
+        Returns:
+            Número de glifos guardados
+        """
+        directory = Path(glyphs_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        file_names = {char: name for name, char in GLYPH_FILE_NAMES.items()}
+        saved = 0
+
+        for (height, width, bits), char in self.glyphs.items():
+            mask = np.unpackbits(np.frombuffer(bits, dtype=np.uint8))[:height * width]
+            image = (mask.reshape(height, width) * 255).astype(np.uint8)
+            name = file_names.get(char, char)
+            cv2.imwrite(str(directory / f"{name}.png"), image)
+            saved += 1
+
+        return saved
+
+    def register_glyph(self, char: str, mask: np.ndarray):
+        """
+        Registra un glifo binarizado en el diccionario
+
+        Args:
+            char: Carácter que representa
+            mask: Máscara booleana recortada al contenido del glifo
+        """
+        self.glyphs[self._glyph_key(mask)] = char
+
+    def learn(self, image: np.ndarray, text: str) -> bool:
+        """
+        Aprende glifos a partir de una muestra con texto conocido
+
+        Args:
+            image: Región con el texto renderizado por el cliente
+            text: Texto que aparece en la imagen
+
+        Returns:
+            True si el número de glifos coincide con el texto
+        """
+        mask = self.binarize(image)
+        chars = [c for c in text if not c.isspace()]
+        glyph_masks = [glyph for glyph, _ in self._segment(mask)]
+
+        if len(glyph_masks) != len(chars):
+            return False
+
+        for char, glyph in zip(chars, glyph_masks):
+            self.register_glyph(char, glyph)
+
+        return True
+
+    def binarize(self, image: np.ndarray) -> np.ndarray:
+        """
+        Binariza una región de texto
+
+        Args:
+            image: Imagen BGR o en escala de grises
+
+        Returns:
+            Máscara booleana (True = píxel de texto)
+        """
+        if image.ndim == 3:
+            # El texto del cliente es claro sobre fondo oscuro en cualquier color
+            image = image.max(axis=2)
+        return image > self.threshold
+
+    def read(self, image: np.ndarray) -> str:
+        """
+        Lee el texto de una región
+
+        Args:
+            image: Región de texto (BGR o escala de grises)
+
+        Returns:
+            Texto leído ('' si no hay texto)
+        """
+        if image is None or image.size == 0:
+            return ''
+
+        chars = []
+        previous_end = None
+
+        for glyph, (x0, x1) in self._segment(self.binarize(image)):
+            if previous_end is not None and x0 - previous_end >= self.space_width:
+                chars.append(' ')
+            chars.append(self.glyphs.get(self._glyph_key(glyph), self.unknown_char))
+            previous_end = x1
+
+        return ''.join(chars)
+
+    def read_number(self, image: np.ndarray) -> Optional[int]:
+        """
+        Lee un número entero de una región (ej. contador de stack)
+
+        Returns:
+            Valor leído o None si no hay dígitos
+        """
+        digits = ''.join(c for c in self.read(image) if c.isdigit())
+        return int(digits) if digits else None
+
+    def read_fraction(self, image: np.ndarray) -> Optional[Tuple[int, int]]:
+        """
+        Lee un valor 'actual/máximo' (ej. "412/1050")
+
+        Returns:
+            Tupla (actual, máximo) o None si no se pudo leer
+        """
+        match = _FRACTION_PATTERN.search(self.read(image))
+        if not match:
+            return None
+        return int(match.group(1)), int(match.group(2))
+
+    @staticmethod
+    def stack_count_region(slot_image: np.ndarray) -> np.ndarray:
+        """Esquina inferior derecha de un slot, donde el cliente dibuja el contador"""
+        height, width = slot_image.shape[:2]
+        return slot_image[height // 2:, width // 3:]
+
+    def read_stack_count(self, slot_image: np.ndarray) -> Optional[int]:
+        """
+        Lee el contador de stack de un slot (inventario o barra de acciones)
+
+        Args:
+            slot_image: Interior del slot, sin el marco
+
+        Returns:
+            Cantidad leída o None si el slot no muestra contador
+        """
+        return self.read_number(self.stack_count_region(slot_image))
+
+    def _segment(self, mask: np.ndarray) -> List[Tuple[np.ndarray, Tuple[int, int]]]:
+        """Separa la máscara en glifos por columnas vacías"""
+        columns = mask.any(axis=0)
+        if not columns.any():
+            return []
+
+        # Inicio y fin de cada tramo de columnas con tinta
+        edges = np.diff(np.concatenate(([0], columns.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        glyphs = []
+        for x0, x1 in zip(starts, ends):
+            glyph = self._trim(mask[:, x0:x1])
+            if glyph is not None:
+                glyphs.append((glyph, (int(x0), int(x1))))
+
+        return glyphs
+
+    @staticmethod
+    def _trim(mask: np.ndarray) -> Optional[np.ndarray]:
+        """Recorta la máscara a su contenido"""
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        if rows.size == 0 or cols.size == 0:
+            return None
+        return mask[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+
+    @staticmethod
+    def _glyph_key(mask: np.ndarray) -> Tuple[int, int, bytes]:
+        """Clave del diccionario para una máscara de glifo"""
+        height, width = mask.shape
+        return (height, width, np.packbits(mask, axis=None).tobytes())
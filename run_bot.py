@@ -74,6 +74,9 @@ def run_bot():
         
         print("\n✅ Bot inicializado")
         
+        from utils.startup import startup_report
+        startup_report.print_report()
+        
         # Ejecutar detección
         print("\n🔍 Ejecutando detección automática...")
         success = bot.auto_detect_ui()
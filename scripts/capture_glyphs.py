@@ -0,0 +1,85 @@
+"""
+Captura los glifos de la fuente bitmap del cliente para GlyphReader
+
+Uso:
+    python scripts/capture_glyphs.py --region X,Y,W,H --text "412/1050"
+    python scripts/capture_glyphs.py --image captura.png --region X,Y,W,H --text "0123456789"
+
+La región debe contener exactamente el texto indicado (sin contar espacios),
+por ejemplo el cuadro de HP del cliente. Cada ejecución añade los glifos
+aprendidos a los ya guardados, así que se pueden completar los dígitos y
+símbolos con varias capturas. Deben quedar al menos 0-9 y '/'.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+
+from processors.glyph_reader import GlyphReader
+
+# Caracteres necesarios para los valores de estado y los contadores
+REQUIRED_CHARS = set("0123456789/")
+
+
+def parse_region(text: str):
+    """Convierte 'x,y,w,h' en una tupla de enteros"""
+    values = [int(v) for v in text.split(',')]
+    if len(values) != 4:
+        raise argparse.ArgumentTypeError("la región debe ser X,Y,W,H")
+    return tuple(values)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Captura glifos de la fuente del cliente")
+    parser.add_argument('--region', type=parse_region, required=True,
+                        help="Región X,Y,W,H que contiene el texto")
+    parser.add_argument('--text', required=True, help="Texto exacto que aparece en la región")
+    parser.add_argument('--image', help="Imagen de la que recortar (por defecto, captura de pantalla)")
+    parser.add_argument('--monitor', type=int, default=1, help="Monitor a capturar")
+    parser.add_argument('--out', default='templates/glyphs', help="Directorio de glifos")
+    parser.add_argument('--threshold', type=int, default=150, help="Brillo mínimo del texto")
+    args = parser.parse_args()
+
+    if args.image:
+        screenshot = cv2.imread(args.image)
+        if screenshot is None:
+            print(f"❌ No se pudo leer {args.image}")
+            return 1
+    else:
+        from core.screen_capturer import ScreenCapturer
+        screenshot = ScreenCapturer(args.monitor).capture_full_screen()
+
+    x, y, w, h = args.region
+    region = screenshot[y:y + h, x:x + w]
+    if region.size == 0:
+        print("❌ La región queda fuera de la imagen")
+        return 1
+
+    reader = GlyphReader(args.out, threshold=args.threshold)
+    before = len(reader.glyphs)
+    if not reader.learn(region, args.text):
+        found = len(reader._segment(reader.binarize(region)))
+        expected = len([c for c in args.text if not c.isspace()])
+        print(f"❌ Se encontraron {found} glifos pero el texto tiene {expected} caracteres; "
+              f"ajusta la región o --threshold")
+        return 1
+
+    reader.save_glyphs(args.out)
+    known = set(reader.glyphs.values())
+    print(f"✅ {len(reader.glyphs) - before} glifos nuevos, {len(reader.glyphs)} en {args.out}")
+
+    # Comprobar que la región se lee igual con el diccionario guardado
+    check = GlyphReader(args.out, threshold=args.threshold).read(region)
+    print(f"🔎 Lectura de comprobación: '{check}'")
+
+    missing = sorted(REQUIRED_CHARS - known)
+    if missing:
+        print(f"⚠️ Faltan glifos: {' '.join(missing)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
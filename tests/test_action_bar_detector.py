@@ -0,0 +1,103 @@
+"""
+Tests unitarios para ActionBarDetector
+"""
+import unittest
+import numpy as np
+
+from detectors.action_bar_detector import ActionBarDetector
+from processors.glyph_reader import GlyphReader
+from config.settings import Settings
+from tests.test_glyph_reader import render_text
+
+BAR_X, BAR_Y = 100, 400
+PITCH = 36
+
+
+def render_action_bar(slots) -> np.ndarray:
+    """Dibuja una barra de slots (None = vacío, o (cooldown, contador))"""
+    screenshot = np.zeros((480, 640, 3), dtype=np.uint8)
+    for index, slot in enumerate(slots):
+        x = BAR_X + index * PITCH
+        screenshot[BAR_Y:BAR_Y + 34, x:x + 34] = (80, 80, 80)
+        inner = screenshot[BAR_Y + 2:BAR_Y + 32, x + 2:x + 32]
+        inner[:] = 0
+        if slot is None:
+            continue
+
+        cooldown, count = slot
+        inner[:] = (120, 90, 60)
+        covered = int(30 * cooldown)
+        inner[:, :covered] = (36, 27, 18)
+        if count is not None:
+            text = render_text(str(count))
+            inner[18:27, 30 - text.shape[1]:30] = text
+    return screenshot
+
+
+class TestActionBarDetector(unittest.TestCase):
+    """Tests para la clase ActionBarDetector"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        glyph_reader = GlyphReader()
+        glyph_reader.learn(render_text("0123456789/"), "0123456789/")
+        settings = Settings()
+        settings.action_bar_slots = {'heal': 0, 'mana_potion': 1}
+        self.detector = ActionBarDetector(settings, glyph_reader)
+
+    def test_locate_bar(self):
+        """La barra se localiza por los marcos alineados"""
+        region = self.detector.locate(render_action_bar([(0, None)] * 4))
+        self.assertEqual(region, (BAR_X, BAR_Y, 4 * PITCH - 2, 34))
+
+    def test_read_slots(self):
+        """Lee vacío, contador y listo de cada slot"""
+        states = self.detector.read(render_action_bar([(0, None), (0, 25), None]))
+        self.assertEqual(len(states), 3)
+        self.assertTrue(states[0].ready)
+        self.assertEqual(states[1].count, 25)
+        self.assertTrue(states[2].empty)
+        self.assertFalse(states[2].ready)
+        self.assertEqual(states[0].key, 'f1')
+
+    def test_cooldown_fraction(self):
+        """La fracción cubierta por el overlay se mide contra la referencia"""
+        self.detector.read(render_action_bar([(0, None), (0, None)]))
+        states = self.detector.read(render_action_bar([(0.5, None), (0, None)]))
+        self.assertAlmostEqual(states[0].cooldown, 0.5, places=2)
+        self.assertEqual(states[1].cooldown, 0.0)
+
+        self.assertFalse(self.detector.is_ready('heal'))
+        self.assertTrue(self.detector.is_ready('mana_potion'))
+        self.assertTrue(self.detector.is_ready('F2'))
+        self.assertTrue(self.detector.is_ready('sin_slot'))
+
+    def test_slot_from_action_key(self):
+        """Sin action_bar_slots, el slot sale de la tecla de la acción"""
+        detector = ActionBarDetector(Settings(), self.detector.glyph_reader)
+        detector.read(render_action_bar([(0, None), (0, None)]))
+        detector.read(render_action_bar([(0, None), (0.5, None)]))
+        self.assertEqual(detector.get_slot('mana_potion').index, 1)
+        self.assertFalse(detector.is_ready('mana_potion'))
+        self.assertTrue(detector.is_ready('heal'))
+
+    def test_swapped_icon_resets_reference(self):
+        """Un icono nuevo más oscuro no se lee como cubierto por el anterior"""
+        self.detector.read(render_action_bar([(0, None), (0, None)]))
+
+        screenshot = render_action_bar([(0, None), (0, None)])
+        inner = screenshot[BAR_Y + 2:BAR_Y + 32, BAR_X + 2:BAR_X + 32]
+        inner[:] = (20, 40, 60)
+        states = self.detector.read(screenshot)
+        self.assertEqual(states[0].cooldown, 0.0)
+        self.assertTrue(self.detector.is_ready('heal'))
+
+        # El overlay sobre el icono nuevo se sigue midiendo
+        inner[:, :15] = (6, 12, 18)
+        states = self.detector.read(screenshot)
+        self.assertAlmostEqual(states[0].cooldown, 0.5, places=2)
+        self.assertEqual(states[1].cooldown, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
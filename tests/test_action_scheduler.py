@@ -0,0 +1,121 @@
+"""
+Tests unitarios para ActionScheduler
+"""
+import unittest
+
+from core.action_scheduler import ActionScheduler, PRIORITY_CRITICAL, PRIORITY_LOW
+from core.cooldown_tracker import CooldownTracker
+
+
+class FakeClock:
+    """Reloj simulado controlado por el test"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestActionScheduler(unittest.TestCase):
+    """Tests para la clase ActionScheduler"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.clock = FakeClock()
+        self.scheduler = ActionScheduler(clock=self.clock)
+
+    def pop_names(self):
+        """Vacía la cola devolviendo los tipos en orden de salida"""
+        names = []
+        while True:
+            entry = self.scheduler.pop(timeout=0)
+            if entry is None:
+                return names
+            names.append(entry.name)
+
+    def test_heal_preempts_queued_actions(self):
+        """Las curas salen antes que el loot, el movimiento y el chat encolados antes"""
+        for name in ('chat', 'move', 'loot', 'heal', 'mana_potion'):
+            self.scheduler.push(name, lambda: None)
+
+        self.assertEqual(self.pop_names(), ['heal', 'mana_potion', 'loot', 'move', 'chat'])
+
+    def test_same_priority_by_deadline(self):
+        """A igual prioridad sale antes la de plazo más cercano"""
+        self.scheduler.push('loot', lambda: None, ttl=5.0)
+        self.scheduler.push('food', lambda: None, ttl=1.0)
+
+        self.assertEqual(self.pop_names(), ['food', 'loot'])
+
+    def test_expired_actions_are_dropped(self):
+        """Una acción caducada en cola se cancela en lugar de enviarse tarde"""
+        stale = self.scheduler.push('heal', lambda: None, since=self.clock.now - 0.1)
+        fresh = self.scheduler.push('loot', lambda: None)
+        self.clock.now += 0.45
+
+        self.assertEqual(self.pop_names(), ['loot'])
+        self.assertTrue(stale.cancelled())
+        self.assertFalse(fresh.cancelled())
+        self.assertEqual(self.scheduler.stats['expired'], 1)
+
+    def test_duplicates_collapse(self):
+        """Repetir una acción pendiente devuelve el mismo Future y no la duplica"""
+        first = self.scheduler.push('heal', lambda: 'old')
+        self.clock.now += 0.3
+        second = self.scheduler.push('heal', lambda: 'new')
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.scheduler), 1)
+
+        # La fusión conserva la validez de la decisión más reciente
+        self.clock.now += 0.3
+        entry = self.scheduler.pop(timeout=0)
+        self.assertEqual(entry.func(), 'new')
+        self.assertEqual(self.scheduler.stats['collapsed'], 1)
+
+    def test_explicit_priority_and_key(self):
+        """La prioridad explícita y las claves distintas se respetan"""
+        self.scheduler.push('hotkey', lambda: None, key='hotkey:f5', priority=PRIORITY_LOW)
+        self.scheduler.push('hotkey', lambda: None, key='hotkey:f6', priority=PRIORITY_CRITICAL)
+
+        entry = self.scheduler.pop(timeout=0)
+        self.assertEqual(entry.key, 'hotkey:f6')
+        self.assertEqual(len(self.scheduler), 1)
+
+    def test_cooldown_holds_action_without_blocking_others(self):
+        """Una cura en cooldown espera en cola y deja pasar al resto"""
+        cooldowns = CooldownTracker(clock=self.clock)
+        scheduler = ActionScheduler(cooldowns=cooldowns, clock=self.clock)
+        cooldowns.record('heal', at=self.clock.now - 0.8)
+
+        scheduler.push('heal', lambda: None)
+        scheduler.push('loot', lambda: None)
+        self.assertEqual(scheduler.pop(timeout=0).name, 'loot')
+        self.assertIsNone(scheduler.pop(timeout=0))
+
+        self.clock.now += 0.2
+        self.assertEqual(scheduler.pop(timeout=0).name, 'heal')
+
+    def test_cooldown_past_deadline_is_dropped(self):
+        """Si el cooldown acaba después del plazo la acción se descarta"""
+        cooldowns = CooldownTracker(clock=self.clock)
+        scheduler = ActionScheduler(cooldowns=cooldowns, clock=self.clock)
+        cooldowns.record('spell', at=self.clock.now)
+
+        future = scheduler.push('spell', lambda: None)
+        self.assertIsNone(scheduler.pop(timeout=0))
+        self.assertTrue(future.cancelled())
+        self.assertEqual(scheduler.stats['gated'], 1)
+
+    def test_clear_cancels_pending(self):
+        """clear() cancela todo lo pendiente"""
+        futures = [self.scheduler.push(name, lambda: None) for name in ('heal', 'loot')]
+
+        self.assertEqual(self.scheduler.clear(), 2)
+        self.assertTrue(all(future.cancelled() for future in futures))
+        self.assertIsNone(self.scheduler.pop(timeout=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
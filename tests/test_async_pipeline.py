@@ -0,0 +1,108 @@
+"""
+Tests unitarios para AsyncPipeline
+"""
+import asyncio
+import time
+import unittest
+import numpy as np
+
+from core.async_pipeline import AsyncPipeline, DropOldestQueue, StageMetrics
+
+
+class TestAsyncPipeline(unittest.TestCase):
+    """Tests para la clase AsyncPipeline"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.hp_values = []
+        self.actions = []
+        self.slow_calls = []
+        self.latencies = []
+
+    def make_pipeline(self, act_delay: float = 0.0) -> AsyncPipeline:
+        """Pipeline con etapas simuladas a 50 Hz"""
+        state = {}
+
+        def act(action, captured_at, decided_at):
+            self.latencies.append(decided_at - captured_at)
+            time.sleep(act_delay)
+            self.actions.append(action)
+
+        return AsyncPipeline(
+            capture=lambda: np.full((4, 4, 3), 10, dtype=np.uint8),
+            detect=lambda frame: {'hp_percentage': float(frame.image[0, 0, 0])},
+            update=lambda status: (state.update(status), self.hp_values.append(status['hp_percentage'])),
+            decide=lambda: ['heal'] if state.get('hp_percentage', 100) < 50 else [],
+            act=act,
+            rate_hz=50
+        )
+
+    def test_stages_flow(self):
+        """Los frames atraviesan todas las etapas hasta la acción"""
+        pipeline = self.make_pipeline()
+        pipeline.run(duration=0.2)
+
+        self.assertGreater(len(self.hp_values), 3)
+        self.assertIn('heal', self.actions)
+        metrics = pipeline.get_metrics()
+        self.assertGreater(metrics['capture']['processed'], 3)
+        self.assertGreater(metrics['detect']['processed'], 3)
+
+    def test_actions_carry_capture_timestamp(self):
+        """Cada acción recibe el instante de su captura y el de la decisión"""
+        pipeline = self.make_pipeline()
+        pipeline.run(duration=0.2)
+
+        self.assertTrue(self.latencies)
+        for latency in self.latencies:
+            self.assertGreaterEqual(latency, 0.0)
+            self.assertLess(latency, 0.2)
+
+    def test_slow_stage_does_not_stall_fast_lane(self):
+        """Una etapa lenta va a su ritmo sin frenar la detección"""
+        pipeline = self.make_pipeline()
+
+        def slow(image):
+            time.sleep(0.1)
+            self.slow_calls.append(time.monotonic())
+
+        pipeline.add_slow_stage('minimap', slow, rate_hz=5)
+        pipeline.run(duration=0.3)
+
+        self.assertLessEqual(len(self.slow_calls), 3)
+        self.assertGreater(len(self.hp_values), 8)
+        self.assertGreater(pipeline.get_metrics()['minimap']['dropped'], 0)
+
+    def test_slow_actions_are_deduplicated(self):
+        """Con la entrada lenta no se acumulan acciones repetidas"""
+        pipeline = self.make_pipeline(act_delay=0.1)
+        pipeline.run(duration=0.3)
+
+        metrics = pipeline.get_metrics()
+        self.assertLessEqual(metrics['act']['max_queue_depth'], 1)
+        self.assertLessEqual(len(self.actions), 4)
+
+
+class TestDropOldestQueue(unittest.TestCase):
+    """Tests para la cola que descarta el elemento más antiguo"""
+
+    def test_items_follow_drops_and_gets(self):
+        """items() y 'in' reflejan los descartes y las lecturas"""
+        async def scenario():
+            metrics = StageMetrics('act')
+            queue = DropOldestQueue(2, metrics)
+            for item in ['a', 'b', 'c']:
+                queue.put(item)
+            self.assertEqual(queue.items(), ['b', 'c'])
+            self.assertNotIn('a', queue)
+            self.assertEqual(metrics.dropped, 1)
+
+            self.assertEqual(await queue.get(), 'b')
+            self.assertEqual(queue.items(), ['c'])
+            self.assertIn('c', queue)
+
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests unitarios para BattleListDetector
+"""
+import unittest
+import numpy as np
+
+from detectors.battle_list_detector import BattleListDetector
+from processors.glyph_reader import GlyphReader
+from config.settings import Settings
+from tests.test_glyph_reader import render_text
+
+PANEL_X, PANEL_Y = 600, 100
+BAR_WIDTH = 100
+
+
+def render_battle_list(creatures) -> np.ndarray:
+    """Dibuja una lista de batalla con (nombre, hp) por fila"""
+    screenshot = np.zeros((480, 800, 3), dtype=np.uint8)
+    for index, (name, hp) in enumerate(creatures):
+        row_y = PANEL_Y + index * 22
+        text = render_text(name)
+        screenshot[row_y:row_y + text.shape[0], PANEL_X + 22:PANEL_X + 22 + text.shape[1]] = text
+        fill = int(BAR_WIDTH * hp / 100)
+        screenshot[row_y + 15:row_y + 19, PANEL_X + 22:PANEL_X + 22 + fill] = (0, 192, 0)
+    return screenshot
+
+
+class TestBattleListDetector(unittest.TestCase):
+    """Tests para la clase BattleListDetector"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        glyph_reader = GlyphReader()
+        glyph_reader.learn(render_text("0123456789/"), "0123456789/")
+        self.detector = BattleListDetector(Settings(), glyph_reader)
+
+    def test_locate_panel(self):
+        """El panel se localiza por las barras apiladas"""
+        region = self.detector.locate(render_battle_list([("11", 100), ("22", 100)]))
+        self.assertEqual(region[:2], (PANEL_X, PANEL_Y))
+
+    def test_read_and_diff(self):
+        """Solo se emiten filas añadidas, eliminadas o cambiadas"""
+        changes = self.detector.read(render_battle_list([("11", 100), ("22", 100), ("33", 100)]))
+        self.assertEqual([e.name for e in changes.added], ["11", "22", "33"])
+        self.assertAlmostEqual(changes.added[0].hp_percentage, 100.0)
+
+        changes = self.detector.read(render_battle_list([("11", 100), ("22", 100), ("33", 100)]))
+        self.assertFalse(changes.has_changes)
+
+        changes = self.detector.read(render_battle_list([("11", 100), ("33", 40)]))
+        self.assertEqual([e.name for e in changes.removed], ["22"])
+        self.assertEqual([e.name for e in changes.changed], ["33"])
+        self.assertAlmostEqual(changes.changed[0].hp_percentage, 40.0)
+
+    def test_ranked_targets(self):
+        """El objetivo con menos HP va primero"""
+        self.detector.read(render_battle_list([("11", 100), ("22", 30), ("33", 60)]))
+        ranked = [e.name for e in self.detector.get_ranked_targets()]
+        self.assertEqual(ranked, ["22", "33", "11"])
+
+        target = self.detector.best_target()
+        x, y = target.click_position
+        self.assertEqual(y, PANEL_Y + 22 + 11)
+
+    def test_duplicate_names(self):
+        """Criaturas con el mismo nombre se distinguen por orden"""
+        changes = self.detector.read(render_battle_list([("11", 100), ("11", 50)]))
+        self.assertEqual(len(changes.added), 2)
+
+    def test_highlighted_row_keeps_identity(self):
+        """Resaltar una fila (marco y color del nombre) no la convierte en otra criatura"""
+        self.detector.read(render_battle_list([("11", 100), ("22", 80)]))
+
+        screenshot = render_battle_list([("11", 100), ("22", 60)])
+        row_y = PANEL_Y + 22
+        name = screenshot[row_y:row_y + 12, PANEL_X + 22:PANEL_X + 22 + BAR_WIDTH]
+        name[name.max(axis=2) > 150] = (90, 90, 255)
+        name[0, :] = name[-1, :] = name[:, 0] = name[:, -1] = (0, 0, 255)
+
+        changes = self.detector.read(screenshot)
+        self.assertEqual(changes.added, [])
+        self.assertEqual(changes.removed, [])
+        self.assertEqual([e.name for e in changes.changed], ["22"])
+
+    def test_name_cache_is_bounded(self):
+        """El cache de nombres no crece sin límite"""
+        self.detector.name_cache_size = 3
+        for first in range(1, 7):
+            self.detector.read(render_battle_list([(f"{first}0", 100), ("99", 100)]))
+        self.assertEqual(len(self.detector._name_cache), 3)
+
+    def test_locate_tolerates_offset_above_row(self):
+        """Una barra un píxel por encima de su fila también cuenta como apilada"""
+        screenshot = render_battle_list([("11", 100), ("22", 100)])
+        bar = screenshot[PANEL_Y + 22 + 15:PANEL_Y + 22 + 19].copy()
+        screenshot[PANEL_Y + 22 + 15:PANEL_Y + 22 + 19] = 0
+        screenshot[PANEL_Y + 22 + 14:PANEL_Y + 22 + 18] = bar
+
+        region = self.detector.locate(screenshot)
+        self.assertIsNotNone(region)
+        self.assertEqual(region[:2], (PANEL_X, PANEL_Y))
+
+    def test_no_panel(self):
+        """Sin panel no hay cambios ni objetivos"""
+        changes = self.detector.read(np.zeros((480, 800, 3), dtype=np.uint8))
+        self.assertFalse(changes.has_changes)
+        self.assertIsNone(self.detector.best_target())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,115 @@
+"""
+Tests unitarios para BotActions (con el backend de grabación, sin pantalla)
+"""
+import time
+import unittest
+from unittest import mock
+
+from core.bot_actions import BotActions
+from core.input_backend import RecordingBackend, PyAutoGUIBackend, create_input_backend
+
+
+class FakeSettings:
+    """Configuración mínima para BotActions"""
+    human_like_variation = 0.0
+    input_backend = 'recording'
+    action_pauses = {}
+
+    def get_action_key(self, action):
+        return {'heal': 'f1', 'mana_potion': 'f2', 'attack': 'space'}.get(action)
+
+
+class TestBotActions(unittest.TestCase):
+    """Tests para la clase BotActions"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.actions = BotActions(None, FakeSettings(), logger=mock.Mock())
+        self.actions._human_delay = lambda *args: None
+        self.backend = self.actions.input
+        self.addCleanup(self.actions.dispatcher.stop)
+
+    def test_backend_from_settings(self):
+        """Settings.input_backend elige el backend"""
+        self.assertIsInstance(self.backend, RecordingBackend)
+        self.assertIsInstance(create_input_backend('pyautogui'), PyAutoGUIBackend)
+        with self.assertRaises(ValueError):
+            create_input_backend('xdotool')
+
+    def test_heal_records_key(self):
+        """heal_character pulsa la tecla configurada"""
+        result = self.actions.heal_character()
+
+        self.assertTrue(result.success)
+        self.assertEqual([event.args for event in self.backend.get_events('press')], [('f1',)])
+
+    def test_missing_key_sends_nothing(self):
+        """Sin tecla configurada no se envía entrada"""
+        result = self.actions.eat_food()
+
+        self.assertFalse(result.success)
+        self.assertEqual(self.backend.get_events(), [])
+
+    def test_loot_sequence(self):
+        """El loot mueve, hace ctrl+click derecho y vuelve a la posición original"""
+        start = self.backend.position()
+        self.assertTrue(self.actions.loot_corpse((100, 200)).success)
+
+        kinds = [event.kind for event in self.backend.get_events()]
+        self.assertEqual(kinds, ['move_to', 'key_down', 'click', 'key_up', 'move_to'])
+        self.assertEqual(self.backend.get_events('click')[0].args, (100, 200))
+        self.assertEqual(self.backend.get_events('click')[0].kwargs, {'button': 'right'})
+        self.assertEqual(self.backend.position(), start)
+
+    def test_chat_message(self):
+        """Los mensajes se escriben entre dos Enter"""
+        self.assertTrue(self.actions.send_chat_message("hola").success)
+
+        events = self.backend.get_events()
+        self.assertEqual(events[0].args, ('enter',))
+        self.assertEqual(events[-1].args, ('enter',))
+        self.assertIn(('hola',), [event.args for event in self.backend.get_events('write')])
+
+    def test_events_are_timestamped_in_order(self):
+        """Cada entrada lleva su instante monotónico"""
+        self.actions.heal_character()
+        self.actions.use_mana_potion()
+
+        stamps = [event.timestamp for event in self.backend.get_events()]
+        self.assertEqual(stamps, sorted(stamps))
+
+    def test_submit_through_dispatcher(self):
+        """Las acciones enviadas con submit llegan al backend desde el hilo de entrada"""
+        future = self.actions.submit('heal', self.actions.heal_character)
+
+        self.assertTrue(future.result(timeout=1).success)
+        self.assertEqual(len(self.backend.get_events('press')), 1)
+
+    def test_submit_key_keeps_separate_actions(self):
+        """Con claves distintas dos loots no se fusionan y registran su latencia"""
+        futures = [self.actions.submit('loot', lambda pos=pos: self.actions.loot_corpse(pos),
+                                       captured_at=time.monotonic(), key=f"loot:{pos}")
+                   for pos in [(100, 200), (150, 250)]]
+
+        for future in futures:
+            self.assertTrue(future.result(timeout=1).success)
+        clicks = [event.args for event in self.backend.get_events('click')]
+        self.assertEqual(clicks, [(100, 200), (150, 250)])
+        self.assertEqual(self.actions.get_latency_report()['loot.capture_to_dispatch']['count'], 2)
+
+    def test_emergency_listener_wiring(self):
+        """Un gatillo de emergencia cancela la cola y pulsa Escape"""
+        self.actions.start_emergency_listeners()
+        self.assertTrue(self.actions.get_status()['emergency_listeners_active'])
+
+        pending = self.actions.action_queue.push('loot', lambda: None)
+        self.assertTrue(self.backend.trigger_emergency())
+
+        self.assertTrue(pending.cancelled())
+        self.assertIn(('esc',), [event.args for event in self.backend.get_events('press')])
+        self.assertFalse(self.actions.get_status()['emergency_listeners_active'])
+        self.assertFalse(self.backend.trigger_emergency())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests unitarios para BotState y su historial circular
+"""
+import unittest
+
+import numpy as np
+
+from core.bot_state import BotState, CharacterStatus
+from core.status_history import StatusHistory, decode_status
+
+
+class TestStatusHistory(unittest.TestCase):
+    """Tests para el búfer circular StatusHistory"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.history = StatusHistory(capacity=4)
+
+    def _append(self, i, **kwargs):
+        self.history.append(CharacterStatus(timestamp=float(i), hp_percentage=float(i), **kwargs))
+
+    def test_wraps_keeping_latest(self):
+        """Lleno, sobrescribe los más antiguos y last() mantiene el orden"""
+        for i in range(10):
+            self._append(i)
+
+        self.assertEqual(len(self.history), 4)
+        self.assertEqual(self.history.total_appended, 10)
+        np.testing.assert_array_equal(self.history.column('hp'), [6, 7, 8, 9])
+        np.testing.assert_array_equal(self.history.last(2)['timestamp'], [8, 9])
+        self.assertEqual(len(self.history.last(100)), 4)
+
+    def test_last_is_a_read_only_view(self):
+        """Las lecturas por ventana no copian el búfer"""
+        for i in range(6):
+            self._append(i)
+
+        window = self.history.last(3)
+        self.assertTrue(np.shares_memory(window, self.history._data))
+        with self.assertRaises(ValueError):
+            window['hp'][0] = 0
+
+    def test_unknown_values_round_trip(self):
+        """None se guarda como NaN / bit apagado y vuelve como None"""
+        self.history.append(CharacterStatus(timestamp=1.0))
+        status = decode_status(self.history.latest(), CharacterStatus)
+
+        self.assertIsNone(status.hp_percentage)
+        self.assertIsNone(status.inventory_open)
+        self.assertIsNone(status.position)
+        self.assertIsNone(status.captured_at)
+
+    def test_flags_and_position_round_trip(self):
+        """Banderas y posición sobreviven al paso por el búfer"""
+        self.history.append(CharacterStatus(timestamp=1.0, inventory_open=False, in_combat=True,
+                                            burning=True, position={'x': 5, 'y': 6, 'z': 7},
+                                            captured_at=12.5))
+        status = decode_status(self.history.latest(), CharacterStatus)
+
+        self.assertIs(status.inventory_open, False)
+        self.assertTrue(status.in_combat and status.burning)
+        self.assertFalse(status.poisoned)
+        self.assertEqual(status.position, {'x': 5, 'y': 6, 'z': 7})
+        self.assertEqual(status.captured_at, 12.5)
+
+    def test_clear(self):
+        """clear() vacía sin perder la capacidad"""
+        self._append(1)
+        self.history.clear()
+        self.assertFalse(self.history)
+        self.assertIsNone(self.history.latest())
+        self.assertEqual(len(self.history.last()), 0)
+
+
+class TestBotStateHistory(unittest.TestCase):
+    """Tests del historial dentro de BotState"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.state = BotState()
+
+    def test_history_is_bounded(self):
+        """El historial no pasa de max_history_size"""
+        for i in range(self.state.max_history_size + 50):
+            self.state.update_character_status(hp_percentage=float(i % 100))
+
+        self.assertEqual(self.state.get_status_summary()['history_size'],
+                         self.state.max_history_size)
+        self.assertEqual(len(self.state.get_status_history(10)), 10)
+
+    def test_previous_status(self):
+        """previous_status refleja el estado antes de la última actualización"""
+        self.assertIsNone(self.state.previous_status)
+
+        self.state.update_character_status(hp_percentage=80.0, inventory_open=True)
+        self.state.update_character_status(hp_percentage=60.0)
+
+        self.assertEqual(self.state.previous_status.hp_percentage, 80.0)
+        self.assertTrue(self.state.previous_status.inventory_open)
+        self.assertEqual(self.state.character_status.hp_percentage, 60.0)
+
+    def test_history_objects(self):
+        """El historial se puede pedir como CharacterStatus fuera del bucle"""
+        self.state.update_character_status(hp_percentage=70.0, position={'x': 1, 'y': 2})
+        self.state.update_character_status(hp_percentage=65.0)
+
+        statuses = self.state.get_status_history_objects()
+        self.assertEqual([s.hp_percentage for s in statuses], [70.0, 65.0])
+        self.assertEqual(statuses[-1].position, {'x': 1, 'y': 2, 'z': 0})
+
+
+class TestBotStateAggregates(unittest.TestCase):
+    """Tests de los agregados expuestos por BotState"""
+
+    def test_hp_rate_and_time_below(self):
+        """Las lecturas con captured_at alimentan ritmo y tiempo bajo umbral"""
+        state = BotState()
+        for i in range(11):
+            state.update_character_status(hp_percentage=70.0 - 5.0 * i, mp_percentage=80.0,
+                                          captured_at=100.0 + i * 0.1)
+
+        self.assertAlmostEqual(state.get_rate('hp'), -50.0, places=4)
+        self.assertEqual(state.get_window_min('hp'), 20.0)
+        self.assertAlmostEqual(state.time_below('hp', 'low_hp'), 0.5)
+        self.assertEqual(state.time_since_above('mp', 'low_mp'), 0.0)
+        self.assertIn('hp', state.get_status_summary()['aggregates'])
+
+
+if __name__ == '__main__':
+    unittest.main()
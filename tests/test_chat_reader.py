@@ -0,0 +1,68 @@
+"""
+Tests unitarios para ChatReader
+"""
+import unittest
+import numpy as np
+
+from detectors.chat_reader import ChatReader
+from processors.glyph_reader import GlyphReader
+from tests.test_glyph_reader import render_text
+
+
+def render_chat(lines, width: int = 60) -> np.ndarray:
+    """Renderiza varias líneas de chat apiladas"""
+    rows = []
+    for line in lines:
+        row = np.zeros((9, width, 3), dtype=np.uint8)
+        text = render_text(line)
+        row[:, :text.shape[1]] = text
+        rows.append(row)
+    return np.vstack(rows)
+
+
+class TestChatReader(unittest.TestCase):
+    """Tests para la clase ChatReader"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        glyph_reader = GlyphReader()
+        glyph_reader.learn(render_text("0123456789/"), "0123456789/")
+        self.reader = ChatReader(glyph_reader, cache_size=4)
+
+    def test_split_rows(self):
+        """Cada línea de texto es una fila"""
+        rows = self.reader.split_rows(render_chat(["1", "22", "333"]))
+        self.assertEqual(len(rows), 3)
+
+    def test_first_frame_emits_all_rows(self):
+        """En el primer frame todas las filas son nuevas"""
+        messages = self.reader.read(render_chat(["1", "22"]))
+        self.assertEqual([m.text for m in messages], ["1", "22"])
+
+    def test_only_new_rows_after_scroll(self):
+        """Tras un scroll solo se emiten las filas nuevas"""
+        self.reader.read(render_chat(["1", "22", "333"]))
+        messages = self.reader.read(render_chat(["22", "333", "4/4"]))
+        self.assertEqual([m.text for m in messages], ["4/4"])
+
+        # Frame idéntico: nada nuevo y nada que reconocer
+        recognized = self.reader.stats['rows_recognized']
+        self.assertEqual(self.reader.read(render_chat(["22", "333", "4/4"])), [])
+        self.assertEqual(self.reader.stats['rows_recognized'], recognized)
+
+    def test_repeated_message_is_emitted(self):
+        """Un mensaje repetido se emite pero sale del cache"""
+        self.reader.read(render_chat(["1", "5"]))
+        messages = self.reader.read(render_chat(["1", "5", "5"]))
+        self.assertEqual([m.text for m in messages], ["5"])
+        self.assertEqual(self.reader.stats['cache_hits'], 1)
+
+    def test_lru_eviction(self):
+        """El cache no supera su tamaño máximo"""
+        for value in range(10):
+            self.reader.read(render_chat([str(value)]))
+        self.assertEqual(len(self.reader.row_cache), 4)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
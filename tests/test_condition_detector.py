@@ -0,0 +1,89 @@
+"""
+Tests unitarios para ConditionDetector
+"""
+import unittest
+import numpy as np
+
+from detectors.condition_detector import ConditionDetector
+from core.bot_state import BotState
+from core.ui_detector import UIDetector
+from config.settings import Settings
+from config.ui_config import UIConfig
+
+
+PROBES = {
+    'poisoned': {'anchor': 'conditions', 'points': [(1, 1), (2, 2)],
+                 'color': (40, 170, 30), 'tolerance': 20},
+    'burning': {'anchor': 'conditions', 'points': [(10, 1), (11, 2), (12, 1)],
+                'color': (20, 120, 240), 'tolerance': 20, 'min_matches': 2},
+    'battle': {'points': [(50, 50)], 'color': (0, 0, 255), 'tolerance': 10},
+}
+
+
+class TestConditionDetector(unittest.TestCase):
+    """Tests para la clase ConditionDetector"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.detector = ConditionDetector(Settings(), PROBES)
+        self.screen = np.zeros((100, 100, 3), dtype=np.uint8)
+        self.anchors = {'conditions': (20, 30)}
+
+    def test_default_probes_from_settings(self):
+        """Por defecto usa la tabla de sondas de la configuración"""
+        detector = ConditionDetector(Settings())
+        self.assertIn('pz_locked', detector.names)
+
+    def test_detects_conditions(self):
+        """Cada condición se activa cuando sus puntos tienen el color"""
+        self.screen[31, 21] = self.screen[32, 22] = (40, 170, 30)
+        self.screen[31, 30] = self.screen[32, 31] = (25, 125, 235)
+        self.screen[50, 50] = (0, 0, 255)
+
+        result = self.detector.detect(self.screen, self.anchors)
+        self.assertEqual(result, {'poisoned': True, 'burning': True, 'battle': True})
+
+    def test_partial_matches(self):
+        """Sin min_matches hacen falta todos los puntos"""
+        self.screen[31, 21] = (40, 170, 30)
+        result = self.detector.detect(self.screen, self.anchors)
+        self.assertFalse(result['poisoned'])
+
+    def test_missing_anchor_and_out_of_bounds(self):
+        """Sin ancla o fuera de la imagen la condición es falsa"""
+        self.screen[1, 1] = self.screen[2, 2] = (40, 170, 30)
+        result = self.detector.detect(self.screen, {})
+        self.assertFalse(result['poisoned'])
+
+        result = self.detector.detect(self.screen, {'conditions': (99, 99)})
+        self.assertFalse(result['poisoned'])
+
+    def test_default_probes_use_detected_element(self):
+        """Las sondas por defecto se anclan en un elemento que el bot detecta"""
+        settings = Settings()
+        screen = np.zeros((600, 800, 3), dtype=np.uint8)
+        ui_config = UIConfig(config_file='configs/__no_existe__.json')
+        detector = UIDetector(settings, ui_config)
+        ui_config.add_element('mp_bar', *detector.detect_mana_bar(screen))
+        mp_x, mp_y = ui_config.get_element('mp_bar').x, ui_config.get_element('mp_bar').y
+
+        for px, py in settings.condition_probes['burning']['points']:
+            screen[mp_y + py, mp_x + px] = (20, 120, 240)
+
+        result = detector.detect_conditions(screen)
+        self.assertTrue(result['burning'])
+        self.assertFalse(result['poisoned'])
+
+    def test_written_into_character_status(self):
+        """Las condiciones se guardan en CharacterStatus"""
+        state = BotState()
+        state.update_character_status(conditions={'poisoned': True, 'battle': False})
+        status = state.get_character_status()
+        self.assertTrue(status.poisoned)
+        self.assertFalse(status.burning)
+        self.assertEqual(status.conditions, {'poisoned': True, 'battle': False})
+        self.assertEqual(state.previous_status.conditions, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
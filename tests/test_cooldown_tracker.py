@@ -0,0 +1,84 @@
+"""
+Tests unitarios para CooldownTracker
+"""
+import unittest
+
+from core.cooldown_tracker import CooldownTracker
+from detectors.action_bar_detector import SlotState
+
+
+class FakeActionBar:
+    """Barra de acciones con estados fijos por acción"""
+
+    def __init__(self, slots):
+        self.slots = slots
+
+    def get_slot(self, action):
+        return self.slots.get(action)
+
+
+class TestCooldownTracker(unittest.TestCase):
+    """Tests para la clase CooldownTracker"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.tracker = CooldownTracker(
+            groups={'healing': 1.0, 'attack': 2.0},
+            actions={'heal': {'group': 'healing', 'cooldown': 1.0},
+                     'strong_heal': {'group': 'healing', 'cooldown': 3.0},
+                     'spell': {'group': 'attack', 'cooldown': 2.0}},
+            clock=lambda: 100.0)
+
+    def test_action_and_group_timers(self):
+        """Un envío bloquea su acción y las demás de su grupo"""
+        self.tracker.record('strong_heal', at=100.0)
+
+        self.assertAlmostEqual(self.tracker.ready_in('strong_heal', now=100.5), 2.5)
+        self.assertAlmostEqual(self.tracker.ready_in('heal', now=100.5), 0.5)
+        self.assertTrue(self.tracker.is_ready('heal', now=101.0))
+        self.assertTrue(self.tracker.is_ready('spell', now=100.5))
+
+    def test_unknown_actions_are_always_ready(self):
+        """Las acciones sin cooldown configurado nunca se bloquean"""
+        self.tracker.record('loot', at=100.0)
+        self.assertTrue(self.tracker.is_ready('loot', now=100.0))
+
+    def test_overlay_corrects_model(self):
+        """El overlay de la barra corrige el modelo en ambos sentidos"""
+        # El servidor no aceptó la pulsación: el slot se sigue viendo listo
+        self.tracker.record('heal', at=100.0)
+        self.tracker.observe('heal', 0.0, at=100.6)
+        self.assertTrue(self.tracker.is_ready('heal', now=100.6))
+
+        # Cooldown que el bot no lanzó (pulsado a mano)
+        self.tracker.observe('spell', 0.5, at=100.0)
+        self.assertAlmostEqual(self.tracker.ready_in('spell', now=100.0), 1.0)
+        self.assertEqual(self.tracker.stats['corrections'], 2)
+
+    def test_overlay_ignored_right_after_dispatch(self):
+        """Una lectura que aún no refleja un envío reciente no lo borra"""
+        self.tracker.record('heal', at=100.0)
+        self.assertFalse(self.tracker.observe('heal', 0.0, at=99.9))
+        self.assertFalse(self.tracker.observe('heal', 0.0, at=100.2))
+        self.assertAlmostEqual(self.tracker.ready_in('heal', now=100.2), 0.8)
+
+        # Tampoco la de otra acción del mismo grupo
+        self.tracker.record('strong_heal', at=101.0)
+        self.assertFalse(self.tracker.observe('heal', 0.0, at=101.1))
+        self.assertAlmostEqual(self.tracker.ready_in('heal', now=101.1), 0.9)
+        self.assertEqual(self.tracker.stats['ignored'], 3)
+        self.assertEqual(self.tracker.stats['corrections'], 0)
+
+    def test_observe_action_bar(self):
+        """Solo se aplican los slots presentes y no vacíos"""
+        bar = FakeActionBar({
+            'heal': SlotState(0, 'f1', cooldown=0.5, count=None, empty=False, timestamp=0.0),
+            'spell': SlotState(1, 'f2', cooldown=0.0, count=None, empty=True, timestamp=0.0),
+        })
+
+        self.assertEqual(self.tracker.observe_action_bar(bar, at=100.0), 1)
+        self.assertAlmostEqual(self.tracker.ready_in('heal', now=100.0), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
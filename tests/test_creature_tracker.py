@@ -0,0 +1,77 @@
+"""
+Tests unitarios para CreatureTracker
+"""
+import unittest
+import numpy as np
+
+from detectors.creature_tracker import CreatureTracker
+from detectors.viewport_detector import ViewportDetector
+from config.settings import Settings
+
+
+def render_view(creatures) -> np.ndarray:
+    """Vista nativa 480x352 con barras de HP (x, y, hp) sobre fondo gris"""
+    frame = np.full((352, 480, 3), 100, dtype=np.uint8)
+    for x, y, hp in creatures:
+        frame[y - 1:y + 5, x - 1:x + 26] = 0              # Borde negro
+        frame[y:y + 4, x:x + int(25 * hp / 100)] = (0, 192, 0)
+    return frame
+
+
+class TestCreatureTracker(unittest.TestCase):
+    """Tests para la clase CreatureTracker"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.viewport = ViewportDetector(Settings())
+        self.viewport.set_region(0, 0, 480, 352)
+        self.tracker = CreatureTracker(Settings(), self.viewport, max_misses=1)
+
+    def test_detects_creature_bars(self):
+        """Detecta cada barra con su porcentaje de HP"""
+        tracks = self.tracker.update(render_view([(40, 40, 100), (200, 150, 40)]))
+        self.assertEqual(len(tracks), 2)
+        hp = sorted(round(t.hp_percentage) for t in tracks)
+        self.assertEqual(hp, [40, 100])
+
+    def test_track_ids_persist_while_moving(self):
+        """Los tracks conservan su ID al moverse unos píxeles"""
+        self.tracker.update(render_view([(40, 40, 100), (200, 150, 100)]))
+        ids = {t.track_id: t.center for t in self.tracker.get_tracks()}
+
+        self.tracker.update(render_view([(44, 40, 100), (200, 146, 100)]))
+        moved = {t.track_id: t.center for t in self.tracker.get_tracks()}
+
+        self.assertEqual(set(ids), set(moved))
+        for track_id in ids:
+            self.assertLessEqual(abs(moved[track_id][0] - ids[track_id][0]) +
+                                 abs(moved[track_id][1] - ids[track_id][1]), 4)
+
+    def test_lost_tracks(self):
+        """Un track desaparece tras max_misses frames sin detección"""
+        self.tracker.update(render_view([(40, 40, 10), (200, 150, 100)]))
+        self.tracker.update(render_view([(200, 150, 100)]))
+        self.assertEqual(len(self.tracker.get_tracks()), 2)
+
+        self.tracker.update(render_view([(200, 150, 100)]))
+        self.assertEqual(len(self.tracker.get_tracks()), 1)
+        self.assertEqual(len(self.tracker.lost_tracks), 1)
+        self.assertAlmostEqual(self.tracker.lost_tracks[0].hp_percentage, 8.0)
+
+    def test_only_changed_tiles_are_classified(self):
+        """Los tiles sin cambios reutilizan la máscara cacheada"""
+        frame = render_view([(40, 40, 100)])
+        self.tracker.update(frame)
+        changed = self.viewport.update(frame)
+        self.assertFalse(changed.any())
+        self.assertEqual(len(self.tracker.update(frame, changed)), 1)
+
+    def test_ignores_large_coloured_areas(self):
+        """Zonas grandes de color (ej. hierba) no son barras"""
+        frame = render_view([])
+        frame[100:200, 100:300] = (0, 160, 0)
+        self.assertEqual(self.tracker.update(frame), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
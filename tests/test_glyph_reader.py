@@ -0,0 +1,96 @@
+"""
+Tests unitarios para GlyphReader
+"""
+import unittest
+import tempfile
+import numpy as np
+
+from processors.glyph_reader import GlyphReader
+
+# Fuente sintética 3x5 para los tests
+FONT = {
+    '0': ["###", "#.#", "#.#", "#.#", "###"],
+    '1': [".#.", "##.", ".#.", ".#.", "###"],
+    '2': ["###", "..#", "###", "#..", "###"],
+    '3': ["###", "..#", "###", "..#", "###"],
+    '4': ["#.#", "#.#", "###", "..#", "..#"],
+    '5': ["###", "#..", "###", "..#", "###"],
+    '6': ["###", "#..", "###", "#.#", "###"],
+    '7': ["###", "..#", ".#.", ".#.", ".#."],
+    '8': ["###", "#.#", "###", "#.#", "###"],
+    '9': ["###", "#.#", "###", "..#", "###"],
+    '/': ["..#", "..#", ".#.", "#..", "#.."],
+}
+
+
+def render_text(text: str, spacing: int = 1, space: int = 4) -> np.ndarray:
+    """Renderiza texto con la fuente sintética (texto blanco sobre negro)"""
+    columns = [np.zeros((9, 2), dtype=np.uint8)]
+    for char in text:
+        if char == ' ':
+            columns.append(np.zeros((9, space), dtype=np.uint8))
+            continue
+        glyph = np.array([[255 if c == '#' else 0 for c in row] for row in FONT[char]],
+                         dtype=np.uint8)
+        padded = np.zeros((9, glyph.shape[1]), dtype=np.uint8)
+        padded[2:7] = glyph
+        columns.append(padded)
+        columns.append(np.zeros((9, spacing), dtype=np.uint8))
+    gray = np.hstack(columns)
+    return np.dstack([gray, gray, gray])
+
+
+class TestGlyphReader(unittest.TestCase):
+    """Tests para la clase GlyphReader"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.reader = GlyphReader()
+        self.assertTrue(self.reader.learn(render_text("0123456789/"), "0123456789/"))
+
+    def test_read_fraction(self):
+        """Lee valores exactos 'actual/máximo'"""
+        self.assertEqual(self.reader.read(render_text("412/1050")), "412/1050")
+        self.assertEqual(self.reader.read_fraction(render_text("412/1050")), (412, 1050))
+
+    def test_read_number_with_spaces(self):
+        """Inserta espacios y extrae números"""
+        image = render_text("12 34")
+        self.assertEqual(self.reader.read(image), "12 34")
+        self.assertEqual(self.reader.read_number(image), 1234)
+
+    def test_unknown_glyph(self):
+        """Los glifos desconocidos se marcan y no rompen la lectura"""
+        image = render_text("7  ")
+        image[2:7, 8:11] = 255  # Bloque sólido: no es un glifo conocido
+        self.assertIn('?', self.reader.read(image))
+
+    def test_empty_image(self):
+        """Sin texto devuelve cadena vacía"""
+        self.assertEqual(self.reader.read(np.zeros((9, 20, 3), dtype=np.uint8)), '')
+        self.assertIsNone(self.reader.read_fraction(np.zeros((9, 20, 3), dtype=np.uint8)))
+        self.assertEqual(self.reader.read(np.array([])), '')
+
+    def test_learn_mismatch(self):
+        """learn falla si el texto no coincide con los glifos"""
+        self.assertFalse(self.reader.learn(render_text("12"), "123"))
+
+    def test_read_stack_count(self):
+        """El contador se lee solo de la esquina inferior derecha del slot"""
+        slot = np.zeros((30, 30, 3), dtype=np.uint8)
+        text = render_text("25")
+        slot[18:27, 30 - text.shape[1]:30] = text
+        slot[0:9, 0:text.shape[1]] = text  # Fuera de la esquina: se ignora
+        self.assertEqual(self.reader.read_stack_count(slot), 25)
+        self.assertIsNone(self.reader.read_stack_count(np.zeros((30, 30, 3), dtype=np.uint8)))
+
+    def test_save_and_load(self):
+        """El diccionario se guarda y recarga desde disco"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertEqual(self.reader.save_glyphs(temp_dir), 11)
+            reloaded = GlyphReader(glyphs_dir=temp_dir)
+            self.assertEqual(reloaded.read_fraction(render_text("99/100")), (99, 100))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
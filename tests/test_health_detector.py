@@ -185,6 +185,32 @@ class TestHealthDetector(unittest.TestCase):
             method = getattr(self.detector, method_name)
             self.assertTrue(callable(method))
     
+    def test_analyze_batch(self):
+        """Test de análisis de N barras de un frame en una pasada"""
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)
+        regions = []
+        for index, fill in enumerate([27, 13, 0, 20]):
+            y = 10 + index * 10
+            frame[y:y+4, 50:50+fill] = (0, 192, 0)
+            regions.append((50, y, 27, 4))
+        # Barra de otro tamaño y región fuera del frame
+        frame[80:84, 10:70] = (0, 0, 200)
+        regions.append((10, 80, 120, 4))
+        regions.append((190, 90, 27, 4))
+        
+        percentages = self.detector.analyze_batch(frame, regions)
+        
+        self.assertEqual(percentages.shape, (6,))
+        self.assertAlmostEqual(percentages[0], 100.0, places=3)
+        self.assertAlmostEqual(percentages[1], 13 / 27 * 100, places=3)
+        self.assertEqual(percentages[2], 0.0)
+        self.assertAlmostEqual(percentages[4], 50.0, places=3)
+        self.assertEqual(percentages[5], 0.0)
+        
+    def test_analyze_batch_empty(self):
+        """Test de análisis por lotes sin regiones"""
+        self.assertEqual(len(self.detector.analyze_batch(self.full_screenshot, [])), 0)
+    
     def tearDown(self):
         """Limpieza"""
         pass
@@ -0,0 +1,123 @@
+"""
+Tests unitarios para AlphaBetaFilter y la curación predictiva
+"""
+import random
+import unittest
+
+from core.bot_state import BotState
+from core.hp_predictor import AlphaBetaFilter
+
+
+class TestAlphaBetaFilter(unittest.TestCase):
+    """Tests para el filtro alfa-beta"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.filter = AlphaBetaFilter()
+
+    def test_tracks_steady_loss(self):
+        """Con pérdida constante converge al ritmo y predice hacia delante"""
+        for i in range(60):
+            self.filter.update(i / 30, 90.0 - 30.0 * i / 30)
+
+        self.assertAlmostEqual(self.filter.rate, -30.0, delta=1.0)
+        self.assertAlmostEqual(self.filter.predict(self.filter.last_time + 0.2),
+                               90.0 - 30.0 * 59 / 30 - 6.0, delta=0.5)
+
+    def test_smooths_noise(self):
+        """Con HP estable y ruido de lectura la estimación varía menos que las lecturas"""
+        rng = random.Random(1)
+        estimates = [self.filter.update(i / 30, 60.0 + rng.uniform(-3, 3)) for i in range(300)]
+
+        spread = max(estimates[30:]) - min(estimates[30:])
+        self.assertLess(spread, 4.0)
+        self.assertLess(abs(self.filter.rate), 5.0)
+
+    def test_gap_resets_rate(self):
+        """Tras un hueco largo no se extrapola el ritmo viejo"""
+        self.filter.update(0.0, 80.0)
+        self.filter.update(0.1, 70.0)
+        self.filter.update(5.0, 70.0)
+
+        self.assertEqual(self.filter.rate, 0.0)
+        self.assertEqual(self.filter.predict(6.0), 70.0)
+
+    def test_prediction_is_clamped(self):
+        """La predicción no sale de [0, 100]"""
+        self.filter.update(0.0, 10.0)
+        self.filter.update(0.1, 0.0)
+
+        self.assertEqual(self.filter.predict(10.0), 0.0)
+        self.assertIsNone(AlphaBetaFilter().predict(1.0))
+
+
+class TestPredictiveHealing(unittest.TestCase):
+    """Tests de BotState.should_heal con predicción"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.state = BotState()
+        self.state.expected_latency = 0.3
+
+    def _read(self, samples):
+        for t, hp in samples:
+            self.state.update_character_status(hp_percentage=hp, captured_at=t)
+
+    def test_heals_before_crossing_threshold(self):
+        """Una caída rápida pide cura antes de cruzar low_hp"""
+        self._read((i / 30, 80.0 - 40.0 * i / 30) for i in range(20))
+
+        self.assertGreater(self.state.character_status.hp_percentage, 50.0)
+        self.assertFalse(self.state.is_hp_low())
+        self.assertTrue(self.state.should_heal())
+
+        self.state.predictive_healing = False
+        self.assertFalse(self.state.should_heal())
+
+    def test_noise_above_threshold_does_not_heal(self):
+        """El ruido de lectura por encima de low_hp no dispara curas"""
+        self._read((i / 30, 60.0 + (3.0 if i % 2 else -3.0)) for i in range(30))
+
+        self.assertFalse(self.state.is_hp_low())
+        self.assertFalse(self.state.should_heal())
+
+    def test_step_drop_heals_immediately(self):
+        """Una caída de golpe bajo low_hp cura en la misma lectura"""
+        self._read([(i / 30, 100.0) for i in range(30)] + [(1.0, 40.0)])
+
+        self.assertGreater(self.state.predict_hp(), 50.0)
+        self.assertTrue(self.state.should_heal())
+
+    def test_critical_reading_always_heals(self):
+        """Un HP crítico leído cura aunque el filtro aún no lo refleje"""
+        self._read([(i / 30, 60.0) for i in range(30)] + [(1.0, 20.0)])
+
+        self.assertTrue(self.state.should_heal())
+
+    def test_one_frame_dip_does_not_heal_again(self):
+        """Tras una cura, una sola lectura baja por ruido no encola otra"""
+        samples = ([(i / 30, 100.0) for i in range(30)]
+                   + [((30 + i) / 30, 40.0) for i in range(5)]      # golpe: primera cura
+                   + [((35 + i) / 30, 65.0) for i in range(30)]     # la cura llega
+                   + [(65 / 30, 45.0)]                              # un frame con ruido
+                   + [((66 + i) / 30, 65.0) for i in range(10)])
+
+        heals, healing = 0, False
+        for t, hp in samples:
+            self._read([(t, hp)])
+            should_heal = self.state.should_heal()
+            heals += should_heal and not healing
+            healing = should_heal
+        self.assertEqual(heals, 1)
+
+    def test_small_drop_waits_for_confirmation(self):
+        """Una caída menor que hp_fast_path_drop cura cuando el filtro la confirma"""
+        self._read([(i / 30, 58.0) for i in range(30)] + [(1.0, 47.0)])
+        self.assertFalse(self.state.should_heal())
+
+        self._read(((30 + i) / 30, 47.0) for i in range(1, 10))
+        self.assertTrue(self.state.should_heal())
+
+
+if __name__ == '__main__':
+    unittest.main()
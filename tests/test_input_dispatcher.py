@@ -0,0 +1,91 @@
+"""
+Tests unitarios para InputDispatcher
+"""
+import threading
+import time
+import unittest
+
+from core.input_dispatcher import InputDispatcher
+
+
+class TestInputDispatcher(unittest.TestCase):
+    """Tests para la clase InputDispatcher"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.dispatcher = InputDispatcher({'heal': 0.0, 'loot': 0.5}, default_pause=0.0)
+        self.addCleanup(self.dispatcher.stop)
+
+    def test_submit_does_not_block(self):
+        """submit() vuelve enseguida y el Future recibe el resultado"""
+        release = threading.Event()
+        start = time.monotonic()
+        future = self.dispatcher.submit('heal', lambda: release.wait(1) and 'ok')
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.assertFalse(future.done())
+
+        release.set()
+        self.assertEqual(future.result(timeout=1), 'ok')
+
+    def test_runs_in_order_on_dispatch_thread(self):
+        """Las acciones se envían en orden desde un único hilo"""
+        calls = []
+        futures = [self.dispatcher.submit(f"hotkey{i}",
+                                          lambda i=i: calls.append((i, threading.current_thread().name)))
+                   for i in range(5)]
+        for future in futures:
+            future.result(timeout=1)
+
+        self.assertEqual([i for i, _ in calls], list(range(5)))
+        self.assertEqual({name for _, name in calls}, {'input-dispatcher'})
+
+    def test_pause_per_action_type(self):
+        """Tras cada acción se aplica la pausa de su tipo"""
+        self.assertEqual(self.dispatcher.get_pause('loot'), 0.5)
+        self.assertEqual(self.dispatcher.get_pause('chat'), 0.0)
+
+        self.dispatcher.submit('loot', lambda: None).result(timeout=1)
+        start = time.monotonic()
+        self.dispatcher.submit('chat', lambda: None).result(timeout=1)
+        self.assertGreater(time.monotonic() - start, 0.3)
+
+    def test_urgent_action_cuts_pause(self):
+        """Una cura no espera la pausa de un loot ya enviado"""
+        self.dispatcher.submit('loot', lambda: None).result(timeout=1)
+        start = time.monotonic()
+        self.dispatcher.submit('heal', lambda: None).result(timeout=1)
+
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertEqual(self.dispatcher.stats['preempted_pauses'], 1)
+
+    def test_exception_goes_to_future(self):
+        """Un error en la acción llega al Future y el hilo sigue vivo"""
+        def fail():
+            raise RuntimeError("sin pantalla")
+
+        with self.assertRaises(RuntimeError):
+            self.dispatcher.submit('heal', fail).result(timeout=1)
+        self.assertEqual(self.dispatcher.submit('heal', lambda: 1).result(timeout=1), 1)
+        self.assertEqual(self.dispatcher.stats['failed'], 1)
+
+    def test_cancel_pending(self):
+        """Las acciones en cola se cancelan; la que se envía termina"""
+        release = threading.Event()
+        running = self.dispatcher.submit('heal', lambda: release.wait(1))
+        queued = [self.dispatcher.submit(name, lambda: None) for name in ('chat', 'move', 'loot')]
+        time.sleep(0.05)
+
+        self.assertEqual(self.dispatcher.cancel_pending(), 3)
+        release.set()
+        self.assertTrue(running.result(timeout=1))
+        self.assertTrue(all(future.cancelled() for future in queued))
+
+    def test_restart_after_stop(self):
+        """Tras stop() el siguiente envío arranca un hilo nuevo"""
+        self.dispatcher.submit('heal', lambda: None).result(timeout=1)
+        self.dispatcher.stop()
+        self.assertEqual(self.dispatcher.submit('heal', lambda: 2).result(timeout=1), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
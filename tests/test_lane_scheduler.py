@@ -0,0 +1,97 @@
+"""
+Tests unitarios para LaneScheduler
+"""
+import threading
+import time
+import unittest
+import numpy as np
+
+from core.lane_scheduler import LaneScheduler, CRITICAL_LANE, BACKGROUND_LANE
+from core.screen_capturer import Frame
+
+# Plazo máximo de espera de cada condición (solo se agota si el test falla)
+WAIT_TIMEOUT = 5.0
+
+
+def fake_capture(tick: int) -> Frame:
+    """Frame sintético con su instante de captura"""
+    return Frame(tick, time.monotonic(), np.zeros((4, 4, 3), dtype=np.uint8))
+
+
+def wait_for(condition, timeout: float = WAIT_TIMEOUT) -> bool:
+    """Espera a que se cumpla una condición (sin medir tiempos)"""
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestLaneScheduler(unittest.TestCase):
+    """Tests para la clase LaneScheduler"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.scheduler = LaneScheduler(fake_capture)
+        self.scheduler.add_lane(CRITICAL_LANE, 50, capture=True)
+        self.scheduler.add_lane(BACKGROUND_LANE, 5)
+        self.critical_ticks = []
+        self.background_frames = []
+
+        # El análisis de fondo queda bloqueado hasta que el test lo libera
+        self.background_started = threading.Event()
+        self.release_background = threading.Event()
+
+        self.scheduler.add_task(CRITICAL_LANE, lambda frame: self.critical_ticks.append(frame.tick))
+        self.scheduler.add_task(BACKGROUND_LANE, self.slow_analysis)
+
+    def tearDown(self):
+        """Libera el fondo y detiene los hilos"""
+        self.release_background.set()
+        self.scheduler.stop()
+
+    def slow_analysis(self, frame: Frame):
+        """Análisis de fondo que no termina hasta que se libera"""
+        self.background_frames.append(frame.tick)
+        self.background_started.set()
+        self.release_background.wait(WAIT_TIMEOUT)
+
+    def test_critical_lane_not_delayed_by_background(self):
+        """El carril crítico sigue avanzando mientras el fondo está ocupado"""
+        self.scheduler.start()
+        self.assertTrue(self.background_started.wait(WAIT_TIMEOUT))
+
+        ticks_before = len(self.critical_ticks)
+        self.assertTrue(wait_for(lambda: len(self.critical_ticks) >= ticks_before + 10))
+        self.assertEqual(len(self.background_frames), 1)
+
+        self.release_background.set()
+        self.scheduler.stop()
+        stats = self.scheduler.get_stats()
+        self.assertGreaterEqual(stats[CRITICAL_LANE]['runs'], ticks_before + 10)
+        self.assertEqual(stats[BACKGROUND_LANE]['runs'], 1)
+
+    def test_background_uses_latest_frame(self):
+        """Los carriles sin captura trabajan sobre el último frame publicado"""
+        self.scheduler.start()
+        self.assertTrue(self.background_started.wait(WAIT_TIMEOUT))
+        self.assertIsNotNone(self.scheduler.latest_frame)
+        self.assertIn(self.background_frames[0], self.critical_ticks + [self.scheduler.latest_frame.tick])
+
+    def test_task_errors_are_counted(self):
+        """Un fallo en una tarea no detiene el carril"""
+        self.scheduler.add_task(CRITICAL_LANE, lambda frame: 1 / 0)
+        self.scheduler.start()
+        lane = self.scheduler.lanes[CRITICAL_LANE]
+        self.assertTrue(wait_for(lambda: lane.stats.runs >= 3))
+        self.release_background.set()
+        self.scheduler.stop()
+
+        stats = self.scheduler.get_stats()[CRITICAL_LANE]
+        self.assertGreater(stats['errors'], 0)
+        self.assertEqual(stats['errors'], stats['runs'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+"""
+Tests unitarios para LayoutSentinel
+"""
+import time
+import threading
+import unittest
+import tempfile
+from unittest import mock
+from pathlib import Path
+import numpy as np
+
+from core.layout_sentinel import LayoutSentinel
+from core.tibia_bot import TibiaBot, ELEMENT_DETECTORS
+from core.screen_capturer import Frame
+from config.ui_config import UIConfig
+
+
+def render_panels(panels) -> np.ndarray:
+    """Dibuja paneles con marco gris (nombre -> (x, y, w, h))"""
+    screenshot = np.zeros((300, 400, 3), dtype=np.uint8)
+    for x, y, w, h in panels.values():
+        screenshot[y - 4:y + h + 4, x - 4:x + w + 4] = (90, 90, 90)
+        screenshot[y:y + h, x:x + w] = (20, 20, 20)
+    return screenshot
+
+
+class TestLayoutSentinel(unittest.TestCase):
+    """Tests para la clase LayoutSentinel"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.panels = {'battle_list': (250, 40, 100, 150), 'chat': (20, 200, 180, 60)}
+        self.ui_config = UIConfig()
+        self.ui_config.clear()
+        for name, (x, y, w, h) in self.panels.items():
+            self.ui_config.add_element(name, x, y, w, h)
+        self.sentinel = LayoutSentinel(self.ui_config)
+        self.sentinel.arm(render_panels(self.panels))
+
+    def test_stable_layout(self):
+        """Sin cambios en los marcos no se dispara nada"""
+        screenshot = render_panels(self.panels)
+        screenshot[45:185, 255:345] = 200  # El contenido del panel puede cambiar
+        self.assertEqual(self.sentinel.check(screenshot), [])
+        self.assertEqual(self.sentinel.check(screenshot), [])
+
+    def test_moved_panel_triggers_after_consecutive_failures(self):
+        """Solo falla el elemento movido y tras frames consecutivos"""
+        moved = dict(self.panels, battle_list=(200, 20, 100, 150))
+        screenshot = render_panels(moved)
+        self.assertEqual(self.sentinel.check(screenshot), [])
+        self.assertEqual(self.sentinel.check(screenshot), ['battle_list'])
+
+    def test_rearm_single_element(self):
+        """Al re-armar un elemento deja de fallar"""
+        moved = dict(self.panels, battle_list=(200, 20, 100, 150))
+        screenshot = render_panels(moved)
+        self.ui_config.add_element('battle_list', 200, 20, 100, 150)
+        self.sentinel.arm(screenshot, ['battle_list'])
+        self.assertEqual(self.sentinel.check(screenshot), [])
+        self.assertEqual(self.sentinel.check(screenshot), [])
+
+    def test_fingerprint_roundtrip(self):
+        """La huella guardada con la configuración verifica la disposición"""
+        self.ui_config.fingerprint = self.sentinel.export()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / 'ui_positions.json')
+            self.ui_config.save_to_file(path)
+            loaded = UIConfig(path)
+
+        sentinel = LayoutSentinel(loaded)
+        sentinel.restore(loaded.fingerprint)
+        self.assertEqual(sentinel.verify(render_panels(self.panels)), [])
+
+        moved = dict(self.panels, chat=(60, 220, 180, 60))
+        self.assertEqual(sentinel.verify(render_panels(moved)), ['chat'])
+
+
+class TestBotLayoutRedetection(unittest.TestCase):
+    """Re-detección de la disposición desde TibiaBot"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.bot = TibiaBot()
+        self.bot.ui_config.clear()
+        self.bot.ui_config.config_file = str(Path(self.tmp.name) / 'ui_positions.json')
+
+        # 'chat' tiene detector; 'hp_value' solo existe en la configuración
+        self.panels = {'chat': (20, 200, 180, 60), 'hp_value': (250, 40, 100, 20)}
+        for name, (x, y, w, h) in self.panels.items():
+            self.bot.ui_config.add_element(name, x, y, w, h)
+        self.bot.sentinel.arm(render_panels(self.panels))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def check_until_triggered(self, screenshot):
+        for _ in range(self.bot.sentinel.failures_to_trigger):
+            changed = self.bot.check_layout(screenshot)
+        return changed
+
+    def test_check_only_queues(self):
+        """La comprobación no re-detecta ni guarda; process_layout sí"""
+        moved = dict(self.panels, chat=(60, 220, 180, 60))
+        self.assertEqual(self.check_until_triggered(render_panels(moved)), ['chat'])
+        self.assertEqual(self.bot.ui_config.get_element('chat').x, 20)
+        self.assertFalse(Path(self.bot.ui_config.config_file).exists())
+
+        self.assertEqual(self.bot.process_layout(), ['chat'])
+        self.assertNotEqual(self.bot.ui_config.get_element('chat').x, 20)
+        self.assertTrue(Path(self.bot.ui_config.config_file).exists())
+        self.assertEqual(self.bot.process_layout(), [])
+
+    def test_failed_redetection_keeps_position(self):
+        """Un elemento tapado conserva su posición y sigue vigilado"""
+        occluded = dict(self.panels)
+        del occluded['hp_value']
+        self.assertEqual(self.check_until_triggered(render_panels(occluded)), ['hp_value'])
+        self.assertEqual(self.bot.process_layout(), [])
+
+        self.assertEqual(self.bot.ui_config.get_position('hp_value'),
+                         {'x': 250, 'y': 40, 'width': 100, 'height': 20})
+        self.assertIn('hp_value', self.bot.sentinel.references)
+        self.assertEqual(self.bot.check_layout(render_panels(occluded)), ['hp_value'])
+
+    def test_redetection_off_the_tick(self):
+        """Con el centinela disparado el tick sigue corto: la re-detección va en su hilo"""
+        moved = render_panels(dict(self.panels, chat=(60, 220, 180, 60)))
+        self.bot.capturer.capture_frame = lambda tick: Frame(tick, time.monotonic(), moved)
+
+        # Detector lento: no termina hasta que el test lo suelta
+        detecting, release = threading.Event(), threading.Event()
+        detect = self.bot._detect_element
+        def slow_detect(element_name, screenshot):
+            detecting.set()
+            release.wait(5)
+            return detect(element_name, screenshot)
+        self.bot._detect_element = slow_detect
+
+        self.bot.start_layout_worker()
+        self.addCleanup(self.bot.stop_layout_worker)
+        self.addCleanup(release.set)
+
+        durations = []
+        for tick in range(self.bot.sentinel.failures_to_trigger + 3):
+            start = time.monotonic()
+            self.bot.run_cycle(tick * self.bot._scan_every, start)
+            durations.append(time.monotonic() - start)
+            if tick == self.bot.sentinel.failures_to_trigger - 1:
+                self.assertTrue(detecting.wait(2))
+
+        self.assertLess(max(durations), 1.0)
+        self.assertEqual(self.bot.state.bot_status.error_count, 0)
+        self.assertEqual(self.bot.ui_config.get_element('chat').x, 20)
+
+        release.set()
+        end = time.monotonic() + 2
+        while self.bot.ui_config.get_element('chat').x == 20 and time.monotonic() < end:
+            time.sleep(0.01)
+        self.assertNotEqual(self.bot.ui_config.get_element('chat').x, 20)
+
+
+class TestBotWarmStart(unittest.TestCase):
+    """Arranque en caliente de TibiaBot con la disposición guardada"""
+
+    def setUp(self):
+        """Guarda una disposición con su huella, como tras un auto_detect_ui"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.config_file = str(Path(self.tmp.name) / 'ui_positions.json')
+
+        self.panels = {'chat': (20, 200, 180, 60), 'battle_list': (250, 40, 100, 150)}
+        saved = UIConfig()
+        saved.clear()
+        for name, (x, y, w, h) in self.panels.items():
+            saved.add_element(name, x, y, w, h)
+        saved.screen_width, saved.screen_height = 400, 300
+        sentinel = LayoutSentinel(saved)
+        sentinel.arm(render_panels(self.panels))
+        saved.fingerprint = sentinel.export()
+        self.assertTrue(saved.save_to_file(self.config_file))
+
+    def start_bot(self, screenshot):
+        """Bot nuevo que carga la disposición guardada y arranca con la captura dada"""
+        bot = TibiaBot()
+        bot.ui_config.clear()
+        bot.ui_config.config_file = self.config_file
+        self.assertTrue(bot.ui_config.load_from_file(self.config_file))
+        bot.capturer.capture_full_screen = lambda: screenshot
+
+        with mock.patch.object(bot, '_detect_element', wraps=bot._detect_element) as detect:
+            bot.auto_detect_ui()
+        return bot, detect
+
+    def test_matching_layout_skips_detection(self):
+        """Con la misma disposición no se ejecuta ningún detector"""
+        bot, detect = self.start_bot(render_panels(self.panels))
+
+        detect.assert_not_called()
+        self.assertEqual(bot.ui_config.get_element('chat').x, 20)
+        self.assertEqual(sorted(bot.sentinel.references), sorted(self.panels))
+
+    def test_changed_layout_detects_everything(self):
+        """Si la mayoría de los marcos no coinciden se detecta toda la UI"""
+        moved = {'chat': (60, 220, 180, 60), 'battle_list': (200, 20, 100, 150)}
+        bot, detect = self.start_bot(render_panels(moved))
+
+        self.assertEqual(sorted(call.args[0] for call in detect.call_args_list),
+                         sorted(ELEMENT_DETECTORS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests unitarios para CorpseFinder
+"""
+import unittest
+import numpy as np
+
+from detectors.loot_detector import CorpseFinder
+from detectors.creature_tracker import CreatureTrack
+from detectors.viewport_detector import ViewportDetector
+from config.settings import Settings
+
+
+def make_sprite() -> np.ndarray:
+    """Sprite de cadáver 16x16 con patrón reconocible"""
+    rng = np.random.default_rng(7)
+    return rng.integers(0, 255, size=(16, 16, 3), dtype=np.uint8)
+
+
+def dead_track(column: int, row: int, hp: float = 5.0) -> CreatureTrack:
+    """Track perdido cuyo cuerpo ocupa el tile (columna, fila)"""
+    return CreatureTrack(track_id=1, body=(column * 32.0, row * 32.0, 32.0, 32.0),
+                         hp_percentage=hp)
+
+
+class TestCorpseFinder(unittest.TestCase):
+    """Tests para la clase CorpseFinder"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.viewport = ViewportDetector(Settings())
+        self.viewport.set_region(100, 50, 480, 352)
+        self.finder = CorpseFinder(Settings(), self.viewport, corpses_dir='no_existe')
+        self.finder.add_sprite('rat', make_sprite())
+
+        self.screen = np.full((500, 700, 3), 100, dtype=np.uint8)
+
+    def place_corpse(self, column: int, row: int):
+        """Dibuja el sprite escalado en un tile de la vista"""
+        sprite = make_sprite().repeat(2, axis=0).repeat(2, axis=1)
+        x, y = 100 + column * 32, 50 + row * 32
+        self.screen[y:y + 32, x:x + 32] = sprite
+
+    def test_finds_corpse_in_neighbour_tile(self):
+        """Encuentra el cadáver junto al tile estimado de la muerte"""
+        self.place_corpse(6, 4)
+        self.finder.watch([dead_track(5, 4)], now=0.0)
+
+        positions = self.finder.find(self.screen, now=0.5)
+        self.assertEqual(positions, [self.viewport.grid.tile_center(6, 4)])
+        self.assertEqual(self.finder.pending, {})
+
+    def test_ignores_healthy_and_edge_tracks(self):
+        """No vigila criaturas con HP alto ni las que salen por el borde"""
+        self.finder.watch([dead_track(5, 4, hp=80.0), dead_track(0, 4)], now=0.0)
+        self.assertEqual(self.finder.pending, {})
+
+    def test_watch_expires(self):
+        """Los tiles vigilados caducan y no se buscan más"""
+        self.place_corpse(5, 4)
+        self.finder.watch([dead_track(5, 4)], now=0.0)
+        self.assertEqual(self.finder.find(self.screen, now=10.0), [])
+        self.assertEqual(self.finder.pending, {})
+
+    def test_no_match_without_corpse(self):
+        """Sin sprite en la zona no devuelve posiciones y sigue vigilando"""
+        self.finder.watch([dead_track(5, 4)], now=0.0)
+        self.assertEqual(self.finder.find(self.screen, now=0.5), [])
+        self.assertIn((5, 4), self.finder.pending)
+
+
+if __name__ == '__main__':
+    unittest.main()
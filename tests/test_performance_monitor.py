@@ -0,0 +1,107 @@
+"""
+Tests unitarios para los histogramas de latencia
+"""
+import time
+import unittest
+from unittest import mock
+
+from utils.performance_monitor import LatencyHistogram, LatencyTracker
+from core.bot_actions import BotActions
+from core.input_backend import RecordingBackend
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Tests para la clase LatencyHistogram"""
+
+    def test_percentiles(self):
+        """Los percentiles caen en la cubeta correcta (error < 5%)"""
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000)
+
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.percentile(50), 0.050, delta=0.050 * 0.05)
+        self.assertAlmostEqual(histogram.percentile(95), 0.095, delta=0.095 * 0.05)
+        self.assertAlmostEqual(histogram.percentile(99), 0.099, delta=0.099 * 0.05)
+        self.assertEqual(histogram.percentile(100), 0.1)
+
+    def test_empty_and_overflow(self):
+        """Sin muestras devuelve 0; por encima del máximo devuelve el máximo visto"""
+        histogram = LatencyHistogram(max_value=1.0)
+        self.assertEqual(histogram.percentile(50), 0.0)
+
+        histogram.record(5.0)
+        self.assertEqual(histogram.percentile(99), 5.0)
+        self.assertEqual(histogram.to_dict()['max_ms'], 5000.0)
+
+
+class TestLatencyTracker(unittest.TestCase):
+    """Tests para la clase LatencyTracker"""
+
+    def test_report_per_name(self):
+        """Cada nombre tiene su histograma y el informe sale ordenado"""
+        tracker = LatencyTracker()
+        for ms in range(1, 101):
+            tracker.record('heal.capture_to_dispatch', ms / 1000)
+        tracker.record('attack.capture_to_dispatch', 0.2)
+
+        report = tracker.get_report()
+        self.assertEqual(list(report), ['attack.capture_to_dispatch', 'heal.capture_to_dispatch'])
+        heal = report['heal.capture_to_dispatch']
+        self.assertEqual(heal['count'], 100)
+        self.assertAlmostEqual(heal['p95_ms'], 95, delta=95 * 0.05)
+        self.assertEqual(heal['max_ms'], 100.0)
+        self.assertIsNone(tracker.get('mana_potion.capture_to_dispatch'))
+
+        tracker.reset()
+        self.assertEqual(tracker.get_report(), {})
+
+
+class FakeSettings:
+    """Configuración mínima para BotActions"""
+    human_like_variation = 0.0
+
+    def get_action_key(self, action):
+        return {'heal': 'f1'}.get(action)
+
+
+class TestActionLatency(unittest.TestCase):
+    """Latencias captura → decisión → envío en BotActions"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.backend = RecordingBackend()
+        self.actions = BotActions(None, FakeSettings(), logger=mock.Mock(), backend=self.backend)
+        self.actions._human_delay = lambda *args: None
+
+    def test_perform_records_latencies(self):
+        """Cada acción enviada registra sus tres latencias"""
+        captured_at = time.monotonic() - 0.05
+        decided_at = captured_at + 0.02
+
+        result = self.actions.perform('heal', self.actions.heal_character, captured_at, decided_at)
+
+        self.assertTrue(result.success)
+        presses = self.backend.get_events('press')
+        self.assertEqual([event.args for event in presses], [('f1',)])
+        self.assertGreaterEqual(presses[0].timestamp, result.dispatched_at)
+        self.assertGreaterEqual(result.reaction_latency, 0.05)
+
+        report = self.actions.get_latency_report()
+        self.assertEqual(set(report), {'heal.capture_to_decision', 'heal.decision_to_dispatch',
+                                       'heal.capture_to_dispatch'})
+        self.assertAlmostEqual(report['heal.capture_to_decision']['p50_ms'], 20, delta=1)
+        self.assertIn('p99_ms', report['heal.capture_to_dispatch'])
+
+    def test_failed_action_not_recorded(self):
+        """Una acción que no se envía no contamina los histogramas"""
+        result = self.actions.perform('spell', lambda: self.actions.use_hotkey('missing'),
+                                      time.monotonic(), time.monotonic())
+
+        self.assertFalse(result.success)
+        self.assertIsNone(result.reaction_latency)
+        self.assertEqual(self.actions.get_latency_report(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
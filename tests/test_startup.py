@@ -0,0 +1,57 @@
+"""
+Tests unitarios para la importación diferida y el informe de arranque
+"""
+import subprocess
+import sys
+import unittest
+
+from utils.startup import LazyModule, StartupReport, lazy_import
+
+
+class TestLazyImport(unittest.TestCase):
+    """Tests para lazy_import y StartupReport"""
+
+    def test_module_loaded_on_first_use(self):
+        """El módulo real se importa en el primer acceso a un atributo"""
+        loaded = []
+        module = lazy_import('colorsys', on_import=loaded.append)
+        self.assertIsInstance(module, LazyModule)
+        self.assertFalse(module.is_loaded)
+
+        self.assertEqual(module.rgb_to_hsv(1.0, 0.0, 0.0)[0], 0.0)
+        self.assertTrue(module.is_loaded)
+        self.assertEqual([m.__name__ for m in loaded], ['colorsys'])
+
+        module.hsv_to_rgb(0.0, 0.0, 0.0)
+        self.assertEqual(len(loaded), 1)
+
+    def test_missing_module_fails_on_use(self):
+        """Un backend no instalado solo falla al usarse"""
+        module = lazy_import('modulo_que_no_existe')
+        with self.assertRaises(ImportError):
+            module.press('f1')
+
+    def test_report_groups_by_kind(self):
+        """El informe acumula tiempos por tipo y nombre"""
+        report = StartupReport()
+        report.record('pyautogui', 0.5, 'import')
+        with report.timed('UIDetector'):
+            pass
+        with report.timed('UIDetector'):
+            pass
+
+        result = report.get_report()
+        self.assertEqual(result['import'], {'pyautogui': 500.0})
+        self.assertIn('UIDetector', result['init'])
+        self.assertEqual(len(report.entries), 3)
+
+    def test_bot_import_does_not_load_asyncio(self):
+        """Importar TibiaBot no carga el runtime asyncio del pipeline"""
+        code = "import sys, core.tibia_bot; print('asyncio' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                check=True).stdout
+        self.assertEqual(output.strip().splitlines()[-1], 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
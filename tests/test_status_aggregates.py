@@ -0,0 +1,76 @@
+"""
+Tests unitarios para SeriesAggregates
+"""
+import unittest
+
+from core.status_aggregates import SeriesAggregates
+
+
+class TestSeriesAggregates(unittest.TestCase):
+    """Tests para los agregados incrementales"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.agg = SeriesAggregates(window=2.0, ewma_tau=0.5, levels={'low': 50.0})
+
+    def _feed(self, samples):
+        for t, value in samples:
+            self.agg.update(t, value)
+
+    def test_rate_of_linear_loss(self):
+        """Una pérdida lineal da su pendiente exacta"""
+        self._feed((i * 0.1, 100.0 - 20.0 * i * 0.1) for i in range(30))
+
+        self.assertAlmostEqual(self.agg.rate(), -20.0, places=6)
+
+    def test_rate_needs_two_samples(self):
+        """Con una sola muestra no hay ritmo"""
+        self.agg.update(0.0, 80.0)
+        self.assertIsNone(self.agg.rate())
+
+    def test_window_min_max_evict(self):
+        """Mínimo y máximo solo miran la ventana"""
+        self._feed([(0.0, 10.0), (1.0, 90.0), (2.5, 60.0), (3.0, 70.0)])
+
+        self.assertEqual(self.agg.window_min(), 60.0)
+        self.assertEqual(self.agg.window_max(), 90.0)
+        self.agg.update(3.5, 65.0)
+        self.assertEqual(self.agg.window_max(), 70.0)
+
+    def test_ewma_follows_time_constant(self):
+        """Tras una constante de tiempo la media recorre ~63% del salto"""
+        self._feed([(0.0, 0.0), (0.5, 100.0)])
+
+        self.assertAlmostEqual(self.agg.ewma, 100.0 * (1 - 2.718281828 ** -1), places=3)
+
+    def test_threshold_times(self):
+        """Tiempo bajo el nivel y desde la última vez por encima"""
+        self._feed([(0.0, 80.0), (1.0, 40.0), (2.5, 30.0)])
+
+        self.assertEqual(self.agg.time_below('low'), 1.5)
+        self.assertEqual(self.agg.time_above('low'), 0.0)
+        self.assertEqual(self.agg.time_since_above('low', now=3.0), 3.0)
+
+        self.agg.update(3.0, 55.0)
+        self.assertEqual(self.agg.time_below('low'), 0.0)
+        self.assertEqual(self.agg.time_since_below('low'), 0.5)
+
+    def test_ignores_missing_and_out_of_order(self):
+        """None, NaN y muestras fuera de orden no cuentan"""
+        self._feed([(1.0, 50.0), (2.0, None), (2.0, float('nan')), (0.5, 10.0)])
+
+        self.assertEqual(self.agg.samples, 1)
+        self.assertEqual(self.agg.window_min(), 50.0)
+
+    def test_long_run_stays_accurate(self):
+        """Con muchas horas de muestras el ritmo no deriva"""
+        start = 1e6
+        for i in range(20000):
+            self.agg.update(start + i * 0.033, 50.0 + (i % 2))
+        self._feed((start + 20000 * 0.033 + i * 0.1, 100.0 - 10.0 * i * 0.1) for i in range(25))
+
+        self.assertAlmostEqual(self.agg.rate(), -10.0, places=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
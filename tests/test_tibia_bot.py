@@ -0,0 +1,276 @@
+"""
+Tests unitarios para el bucle de TibiaBot (con el backend de grabación, sin pantalla)
+"""
+import time
+import threading
+import unittest
+from unittest import mock
+import numpy as np
+
+from core.tibia_bot import TibiaBot
+from core.input_backend import RecordingBackend
+from core.screen_capturer import Frame
+from detectors.battle_list_detector import BattleEntry
+
+
+def make_bot() -> TibiaBot:
+    """TibiaBot con entradas grabadas y sin pausas humanas"""
+    bot = TibiaBot()
+    bot.actions.input = RecordingBackend()
+    bot.actions._human_delay = lambda *args: None
+    bot.capturer.capture_frame = lambda tick: Frame(tick, time.monotonic(),
+                                                    np.zeros((300, 400, 3), dtype=np.uint8))
+    return bot
+
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    """Espera a que el hilo de entrada cumpla la condición"""
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestBotInputRouting(unittest.TestCase):
+    """Las acciones de ratón pasan por el hilo de entrada"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.bot = make_bot()
+        self.addCleanup(self.bot.actions.dispatcher.stop)
+        self.backend = self.bot.actions.input
+
+        # Hilo desde el que llega cada entrada al backend
+        self.threads = []
+        record = self.backend._record
+        def recording(*args, **kwargs):
+            self.threads.append(threading.current_thread())
+            record(*args, **kwargs)
+        self.backend._record = recording
+
+    def assert_from_dispatcher(self):
+        self.assertTrue(self.threads)
+        for thread in self.threads:
+            self.assertIsNot(thread, threading.current_thread())
+
+    def test_loot_goes_through_dispatcher(self):
+        """Cada cadáver se encola como 'loot' y lo envía el hilo de entrada"""
+        with mock.patch.object(self.bot.detector, 'track_creatures', return_value=[]), \
+             mock.patch.object(self.bot.detector, 'find_corpses', return_value=[(300, 200), (340, 200)]):
+            futures = self.bot.loot_corpses(None, time.monotonic())
+
+        self.assertEqual(len(futures), 2)
+        for future in futures:
+            self.assertTrue(future.result(timeout=2).success)
+        self.assertEqual([event.args for event in self.backend.get_events('click')],
+                         [(300, 200), (340, 200)])
+        self.assert_from_dispatcher()
+
+    def test_attack_goes_through_dispatcher(self):
+        """El click en la lista de batalla se encola como 'attack'"""
+        target = BattleEntry(0, 'Rat', 40.0, (b'rat', 0), (500, 100, 150, 20))
+        self.bot.detector.battle_list.entries = {target.key: target}
+        with mock.patch.object(self.bot.detector, 'read_battle_list'), \
+             mock.patch.object(self.bot.detector.battle_list, 'best_target', return_value=target):
+            future = self.bot.attack_best_target(None, time.monotonic())
+
+        self.assertTrue(future.result(timeout=2).success)
+        self.assertEqual(self.backend.get_events('click')[0].args, target.click_position)
+        self.assert_from_dispatcher()
+
+    def test_no_target_no_attack(self):
+        """Sin objetivos no se encola nada"""
+        with mock.patch.object(self.bot.detector, 'read_battle_list'):
+            self.assertIsNone(self.bot.attack_best_target(None))
+        self.assertEqual(self.bot.actions.dispatcher.stats['submitted'], 0)
+
+class TestBotLootLoop(unittest.TestCase):
+    """El bucle secuencial sigue criaturas y lootea fuera de combate"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.bot = make_bot()
+        self.addCleanup(self.bot.actions.dispatcher.stop)
+        self.backend = self.bot.actions.input
+        self.battle_list = self.bot.detector.battle_list
+
+        patches = [
+            mock.patch.object(self.bot.detector, 'read_battle_list'),
+            mock.patch.object(self.bot.detector, 'track_creatures', return_value=[]),
+            mock.patch.object(self.bot.detector, 'find_corpses', side_effect=[[(300, 200)], [], []])
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.bot.settings.auto_attack_enabled = False
+
+    def run_scan_ticks(self, count: int):
+        """Ejecuta ciclos hasta que el bucle haya leído el mundo count veces"""
+        for i in range(count):
+            self.bot.run_cycle(i * self.bot._scan_every, time.monotonic())
+
+    def test_loot_waits_for_end_of_combat(self):
+        """El cadáver visto en combate se lootea al quedar la lista de batalla vacía"""
+        rat = BattleEntry(0, 'Rat', 40.0, (b'rat', 0), (500, 100, 150, 20))
+        self.battle_list.entries = {rat.key: rat}
+        self.run_scan_ticks(2)
+        self.assertTrue(self.bot.state.character_status.in_combat)
+        self.assertEqual(self.bot.actions.dispatcher.stats['submitted'], 0)
+
+        self.battle_list.entries = {}
+        self.run_scan_ticks(1)
+        self.assertTrue(wait_for(lambda: self.backend.get_events('key_up')))
+
+        self.assertEqual(self.backend.get_events('click')[0].args, (300, 200))
+        self.assertEqual([event.args for event in self.backend.get_events('key_down')], [('ctrl',)])
+        self.assertEqual(self.bot.actions.dispatcher.stats['submitted'], 1)
+        self.assertEqual(self.bot.state.bot_status.error_count, 0)
+
+
+class TestBotAttackLoop(unittest.TestCase):
+    """El bucle ataca al mejor objetivo sin soltar el actual"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.bot = make_bot()
+        self.addCleanup(self.bot.actions.dispatcher.stop)
+        self.backend = self.bot.actions.input
+        self.battle_list = self.bot.detector.battle_list
+
+        patch = mock.patch.object(self.bot.detector, 'read_battle_list')
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def show(self, *entries):
+        """Lista de batalla con las criaturas indicadas"""
+        self.battle_list.entries = {entry.key: entry for entry in entries}
+        self.battle_list.ranked_targets = list(entries)
+
+    def attack_clicks(self):
+        self.assertTrue(wait_for(lambda: not self.bot.actions.dispatcher.pending()))
+        return [event.args for event in self.backend.get_events('click')]
+
+    def test_attacks_once_per_target(self):
+        """Un click por objetivo: no se repite mientras siga en la lista"""
+        rat = BattleEntry(0, 'Rat', 100.0, (b'rat', 0), (500, 100, 150, 20))
+        wolf = BattleEntry(1, 'Wolf', 100.0, (b'wolf', 0), (500, 120, 150, 20))
+
+        self.show(rat, wolf)
+        self.assertIn('attack', self.bot.decide())
+        self.bot.run_cycle(0, time.monotonic())
+        self.assertTrue(wait_for(lambda: self.bot.state.stats['attacks_performed'] == 1))
+        self.assertNotIn('attack', self.bot.decide())
+
+        self.bot.run_cycle(self.bot._scan_every, time.monotonic())
+        self.assertEqual(self.attack_clicks(), [rat.click_position])
+
+        self.show(wolf)
+        self.bot.run_cycle(2 * self.bot._scan_every, time.monotonic())
+        self.assertEqual(self.attack_clicks(), [rat.click_position, wolf.click_position])
+
+    def test_disabled(self):
+        """Con auto_attack_enabled desactivado no se ataca"""
+        self.bot.settings.auto_attack_enabled = False
+        self.show(BattleEntry(0, 'Rat', 100.0, (b'rat', 0), (500, 100, 150, 20)))
+        self.assertNotIn('attack', self.bot.decide())
+        self.bot.run_cycle(0, time.monotonic())
+        self.assertEqual(self.attack_clicks(), [])
+
+
+class TestBotConditions(unittest.TestCase):
+    """Las condiciones leídas en cada ciclo deciden las curas"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.bot = make_bot()
+        self.addCleanup(self.bot.actions.dispatcher.stop)
+        self.backend = self.bot.actions.input
+
+    def run_with_conditions(self, **conditions):
+        with mock.patch.object(self.bot.detector, 'detect_conditions', return_value=conditions):
+            self.bot.run_cycle(1, time.monotonic())
+
+    def test_cures_poison_and_paralysis(self):
+        """El ciclo guarda las condiciones y pulsa sus curas desde el hilo de entrada"""
+        self.run_with_conditions(poisoned=True, paralyzed=True)
+        status = self.bot.state.character_status
+        self.assertTrue(status.poisoned)
+        self.assertTrue(status.paralyzed)
+
+        self.assertTrue(wait_for(lambda: self.bot.state.stats['conditions_cured'] == 2))
+        self.assertEqual([event.args for event in self.backend.get_events('press')],
+                         [('f4',), ('f3',)])
+
+    def test_no_cure_without_conditions(self):
+        """Sin condiciones activas no se encola ninguna cura"""
+        self.run_with_conditions(poisoned=False, paralyzed=False)
+        self.assertFalse(self.bot.state.character_status.poisoned)
+        self.assertEqual([action for action in self.bot.decide() if action.startswith('cure')], [])
+
+    def test_heal_before_cure_poison(self):
+        """Con el HP bajo se cura el HP y el veneno espera"""
+        self.bot.state.character_status.poisoned = True
+        with mock.patch.object(self.bot.state, 'should_heal', return_value=True):
+            actions = self.bot.decide()
+        self.assertIn('heal', actions)
+        self.assertNotIn('cure_poison', actions)
+
+
+class TestBotActionBar(unittest.TestCase):
+    """La barra de acciones se lee en cada modo antes de decidir"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.bot = make_bot()
+        self.addCleanup(self.bot.actions.dispatcher.stop)
+        self.bot.detector.action_bar.region = (100, 500, 400, 34)
+
+        patches = [
+            mock.patch.object(self.bot.detector, 'read_action_bar', return_value=['slot']),
+            mock.patch.object(self.bot.actions.cooldowns, 'observe_action_bar')
+        ]
+        self.read, self.observe = [patch.start() for patch in patches]
+        for patch in patches:
+            self.addCleanup(patch.stop)
+
+    def test_read_in_tick_loop(self):
+        """run_cycle corrige los cooldowns con la captura del propio tick"""
+        self.bot.run_cycle(1, time.monotonic())
+        self.observe.assert_called_once_with(self.bot.detector.action_bar,
+                                             self.bot.last_frame.captured_at)
+
+    def test_read_in_async_detection(self):
+        """La etapa de detección del pipeline también la lee"""
+        frame = self.bot.capturer.capture_frame(0)
+        self.bot._detect_frame(frame)
+        self.observe.assert_called_once_with(self.bot.detector.action_bar, frame.captured_at)
+
+    def test_skipped_during_redetection(self):
+        """Con una re-detección en curso el tick no espera por la barra"""
+        locked = threading.Event()
+        release = threading.Event()
+        def redetect():
+            with self.bot.layout_lock:
+                locked.set()
+                release.wait(2)
+        worker = threading.Thread(target=redetect)
+        worker.start()
+        self.addCleanup(worker.join)
+        self.addCleanup(release.set)
+        self.assertTrue(locked.wait(2))
+
+        self.bot.run_cycle(1, time.monotonic())
+        self.read.assert_not_called()
+
+    def test_not_located_no_read(self):
+        """Sin barra localizada el tick no la busca en la pantalla"""
+        self.bot.detector.action_bar.region = None
+        self.bot.run_cycle(1, time.monotonic())
+        self.read.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
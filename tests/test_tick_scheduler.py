@@ -0,0 +1,90 @@
+"""
+Tests unitarios para TickScheduler
+"""
+import unittest
+
+from core.tick_scheduler import TickScheduler
+
+
+class FakeClock:
+    """Reloj simulado: el tiempo solo avanza al dormir o al trabajar"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTickScheduler(unittest.TestCase):
+    """Tests para la clase TickScheduler"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.clock = FakeClock()
+        self.deadlines = []
+
+    def make_scheduler(self, work, frame_skip=True):
+        """Planificador a 10 Hz cuyo tick tarda lo que indique work(tick)"""
+        def on_tick(tick, deadline):
+            self.deadlines.append(round(deadline - 100.0, 6))
+            self.clock.now += work(tick)
+
+        return TickScheduler(10, on_tick, frame_skip=frame_skip,
+                             clock=self.clock, sleep=self.clock.sleep)
+
+    def test_absolute_deadlines(self):
+        """Los plazos no acumulan deriva aunque cada tick trabaje"""
+        scheduler = self.make_scheduler(lambda tick: 0.03)
+        scheduler.run(max_ticks=5)
+
+        self.assertEqual(self.deadlines, [0.0, 0.1, 0.2, 0.3, 0.4])
+        for seconds in self.clock.sleeps:
+            self.assertAlmostEqual(seconds, 0.07)
+        self.assertEqual(scheduler.stats.missed_deadlines, 0)
+
+    def test_frame_skip_on_overrun(self):
+        """Un tick largo salta los plazos vencidos y cuenta el fallo"""
+        scheduler = self.make_scheduler(lambda tick: 0.25 if tick == 1 else 0.01)
+        scheduler.run(max_ticks=4)
+
+        self.assertEqual(self.deadlines, [0.0, 0.1, 0.4, 0.5])
+        self.assertEqual(scheduler.stats.missed_deadlines, 1)
+        self.assertEqual(scheduler.stats.skipped_ticks, 2)
+
+    def test_catch_up_without_frame_skip(self):
+        """Sin salto de frames los ticks atrasados se ejecutan seguidos"""
+        scheduler = self.make_scheduler(lambda tick: 0.25 if tick == 1 else 0.01, frame_skip=False)
+        scheduler.run(max_ticks=4)
+
+        self.assertEqual(self.deadlines, [0.0, 0.1, 0.2, 0.3])
+        self.assertEqual(scheduler.stats.skipped_ticks, 0)
+        self.assertGreaterEqual(scheduler.stats.missed_deadlines, 1)
+
+    def test_stop_from_tick(self):
+        """stop() termina el bucle al acabar el tick en curso"""
+        scheduler = None
+
+        def work(tick):
+            if tick == 2:
+                scheduler.stop()
+            return 0.0
+
+        scheduler = self.make_scheduler(work)
+        scheduler.run()
+        self.assertEqual(scheduler.stats.ticks, 3)
+        self.assertFalse(scheduler.is_running)
+
+    def test_invalid_rate(self):
+        """La frecuencia debe ser positiva"""
+        with self.assertRaises(ValueError):
+            TickScheduler(0, lambda tick, deadline: None)
+
+
+if __name__ == '__main__':
+    unittest.main()
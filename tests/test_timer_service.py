@@ -0,0 +1,99 @@
+"""
+Tests unitarios para TimerService
+"""
+import random
+import unittest
+
+from core.timer_service import TimerService
+
+
+class FakeClock:
+    """Reloj simulado controlado por el test"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTimerService(unittest.TestCase):
+    """Tests para la clase TimerService"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.clock = FakeClock()
+        self.timers = TimerService(clock=self.clock, rng=random.Random(1))
+        self.fired = []
+
+    def advance(self, seconds: float, step: float = 0.1):
+        """Avanza el reloj llamando a run_due en cada paso"""
+        for _ in range(int(round(seconds / step))):
+            self.clock.now = round(self.clock.now + step, 6)
+            self.timers.run_due()
+
+    def test_fires_at_interval(self):
+        """Una tarea se dispara una vez por intervalo, sin deriva"""
+        self.timers.add('save', 1.0, lambda: self.fired.append(self.clock.now))
+        self.advance(3.05)
+
+        self.assertEqual(self.fired, [1.0, 2.0, 3.0])
+
+    def test_jitter_stays_in_bounds(self):
+        """El jitter varía cada intervalo dentro de ± jitter"""
+        self.timers.add('food', 10.0, lambda: self.fired.append(self.clock.now), jitter=2.0)
+        self.advance(100.0)
+
+        gaps = [b - a for a, b in zip(self.fired, self.fired[1:])]
+        self.assertTrue(all(7.9 <= gap <= 12.1 for gap in gaps))
+        self.assertGreater(len(set(round(gap, 1) for gap in gaps)), 1)
+
+    def test_idle_tick_only_checks_top(self):
+        """Sin vencimientos run_due no dispara nada aunque haya muchas tareas"""
+        for i in range(100):
+            self.timers.add(f"task{i}", 60.0 + i, lambda: self.fired.append(1))
+
+        self.clock.now = 10.0
+        self.assertEqual(self.timers.run_due(), 0)
+        self.assertEqual(self.timers.next_due(), 60.0)
+
+    def test_missed_intervals_do_not_burst(self):
+        """Tras un parón largo la tarea se dispara una vez, no una por intervalo perdido"""
+        self.timers.add('save', 1.0, lambda: self.fired.append(self.clock.now))
+        self.clock.now = 10.5
+        self.assertEqual(self.timers.run_due(), 1)
+        self.assertEqual(self.timers.timers['save'].due, 11.5)
+
+    def test_remove_and_replace(self):
+        """Quitar o sustituir una tarea invalida su programación anterior"""
+        self.timers.add('a', 1.0, lambda: self.fired.append('a'))
+        self.timers.add('b', 1.0, lambda: self.fired.append('b'))
+        self.timers.remove('a')
+        self.timers.add('b', 2.0, lambda: self.fired.append('b2'))
+        self.advance(2.05)
+
+        self.assertEqual(self.fired, ['b2'])
+
+    def test_errors_do_not_stop_service(self):
+        """Una tarea que falla se cuenta y sigue programada"""
+        def fail():
+            raise RuntimeError("sin comida")
+
+        self.timers.add('food', 1.0, fail)
+        with self.assertLogs('core.timer_service', level='ERROR') as logs:
+            self.advance(2.05)
+        self.assertEqual(self.timers.timers['food'].errors, 2)
+        self.assertIn('food', logs.output[0])
+
+    def test_fire_now(self):
+        """fire_now adelanta la tarea al siguiente run_due"""
+        self.timers.add('save', 100.0, lambda: self.fired.append(self.clock.now))
+        self.timers.fire_now('save')
+        self.timers.run_due()
+
+        self.assertEqual(self.fired, [0.0])
+        self.assertEqual(self.timers.next_due(), 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests unitarios para UIDetector
+"""
+import unittest
+import numpy as np
+import cv2
+
+from core.ui_detector import UIDetector
+from config.settings import Settings
+from tests.test_glyph_reader import render_text
+
+
+class TestUIDetector(unittest.TestCase):
+    """Tests para la clase UIDetector"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.settings = Settings("configs/default_settings.json")
+        self.detector = UIDetector(self.settings, None)
+        self.detector.glyph_reader.learn(render_text("0123456789/"), "0123456789/")
+
+        self.screenshot = np.zeros((600, 800, 3), dtype=np.uint8)
+        self.icon = cv2.imread(self.detector.skills_template_path)
+
+    def place_skills_window(self, x: int, y: int, level: str, experience: str):
+        """Dibuja el icono y dos filas de valores en la captura"""
+        self.screenshot[:] = 0
+        icon_h, icon_w = self.icon.shape[:2]
+        self.screenshot[y:y+icon_h, x:x+icon_w] = self.icon
+        for index, text in enumerate([level, experience]):
+            row = render_text(text)
+            row_y = y + icon_h + index * self.detector.skills_reader.row_height
+            self.screenshot[row_y:row_y+row.shape[0], x+150:x+150+row.shape[1]] = row
+
+    def test_analyze_health_bar_reads_exact_value(self):
+        """El porcentaje sale del texto 'actual/máximo' si es legible"""
+        bar = np.zeros((9, 80, 3), dtype=np.uint8)
+        text = render_text("412/1050")
+        bar[:, :text.shape[1]] = text
+        self.assertAlmostEqual(self.detector.analyze_health_bar(bar), 412 * 100.0 / 1050)
+
+    def test_analyze_health_bar_fill_fallback(self):
+        """Sin texto se estima por el relleno de la barra"""
+        bar = np.zeros((10, 100, 3), dtype=np.uint8)
+        bar[:, :25] = (50, 50, 200)
+        self.assertAlmostEqual(self.detector.analyze_health_bar(bar), 25.0)
+        self.assertEqual(self.detector.analyze_health_bar(np.array([])), 0.0)
+
+    def test_detect_skills_window(self):
+        """La ventana se ancla en el icono y reutiliza el ancla cacheada"""
+        self.place_skills_window(300, 100, "8", "4200")
+        region = self.detector.detect_skills_window(self.screenshot)
+        self.assertIsNotNone(region)
+        self.assertEqual(region[:2], (300, 100))
+
+        # Ventana movida: el ancla cacheada falla y se busca de nuevo
+        self.place_skills_window(50, 200, "8", "4200")
+        self.assertEqual(self.detector.detect_skills_window(self.screenshot)[:2], (50, 200))
+
+        self.screenshot[:] = 0
+        self.assertIsNone(self.detector.detect_skills_window(self.screenshot))
+
+    def test_read_skills_incremental(self):
+        """Solo se releen las filas que cambiaron"""
+        self.place_skills_window(300, 100, "8", "4200")
+        self.assertEqual(self.detector.read_skills(self.screenshot),
+                         {'level': 8, 'experience': 4200})
+
+        reader = self.detector.skills_reader
+        rows_read = reader.stats['rows_read']
+        self.assertEqual(self.detector.read_skills(self.screenshot), {})
+        self.assertEqual(reader.stats['rows_read'], rows_read)
+
+        self.place_skills_window(300, 100, "8", "4350")
+        self.assertEqual(self.detector.read_skills(self.screenshot), {'experience': 4350})
+        self.assertEqual(reader.stats['rows_read'], rows_read + 1)
+
+    def test_unreadable_row_is_retried(self):
+        """Una fila que no se pudo leer se relee aunque sus píxeles no cambien"""
+        self.place_skills_window(300, 100, "8", "4200")
+        glyphs = dict(self.detector.glyph_reader.glyphs)
+        self.detector.glyph_reader.glyphs.clear()
+        self.assertEqual(self.detector.read_skills(self.screenshot), {})
+
+        self.detector.glyph_reader.glyphs.update(glyphs)
+        self.assertEqual(self.detector.read_skills(self.screenshot),
+                         {'level': 8, 'experience': 4200})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,67 @@
+"""
+Tests unitarios para ViewportDetector
+"""
+import unittest
+import numpy as np
+import cv2
+
+from detectors.viewport_detector import ViewportDetector, TileGrid
+from config.settings import Settings
+
+
+class TestViewportDetector(unittest.TestCase):
+    """Tests para la clase ViewportDetector"""
+
+    def setUp(self):
+        """Configuración inicial"""
+        self.detector = ViewportDetector(Settings())
+        rng = np.random.default_rng(1)
+
+        # Vista de 15x11 tiles a zoom 2x (64 px) rodeada de un marco
+        self.screenshot = np.full((900, 1200, 3), 40, dtype=np.uint8)
+        self.screenshot[50:50 + 704, 100:100 + 960] = rng.integers(
+            0, 255, (704, 960, 3), dtype=np.uint8)
+        cv2.rectangle(self.screenshot, (99, 49), (100 + 960, 50 + 704), (255, 255, 255), 1)
+
+    def test_locate_grid_and_scale(self):
+        """La rejilla y el zoom se derivan de la vista"""
+        grid = self.detector.locate(self.screenshot)
+        self.assertIsNotNone(grid)
+        self.assertAlmostEqual(grid.scale, 2.0, delta=0.05)
+        self.assertEqual(grid.tile_at(100 + 64 * 3 + 5, 50 + 64 * 2 + 5), (3, 2))
+
+    def test_update_marks_changed_tiles(self):
+        """Solo los tiles modificados aparecen como cambiados"""
+        self.detector.set_region(100, 50, 960, 704)
+        first = self.detector.update(self.screenshot)
+        self.assertTrue(first.all())
+
+        self.assertFalse(self.detector.update(self.screenshot).any())
+
+        frame = self.screenshot.copy()
+        frame[50 + 64 * 4 + 10, 100 + 64 * 7 + 10] += 1
+        changed = self.detector.update(frame)
+        self.assertEqual(int(changed.sum()), 1)
+        self.assertEqual(self.detector.changed_tiles(), [(7, 4)])
+
+    def test_fractional_zoom(self):
+        """Con zoom fraccional se trabaja a tamaño nativo"""
+        grid = self.detector.set_region(0, 0, 720, 528)  # 48 px por tile
+        self.assertEqual(grid.tile_pixels, 48)
+        grid = self.detector.set_region(0, 0, 600, 440)  # 40 px por tile
+        self.assertEqual(grid.tile_pixels, 40)
+        grid = self.detector.set_region(0, 0, 610, 447)
+        self.assertEqual(grid.tile_pixels, 32)
+        view = self.detector.view(self.screenshot)
+        self.assertEqual(view.shape[:2], (11 * 32, 15 * 32))
+
+    def test_tile_grid_helpers(self):
+        """Conversión entre tiles y pantalla"""
+        grid = TileGrid(10, 20, 32.0)
+        self.assertEqual(grid.tile_rect(1, 1), (42, 52, 32, 32))
+        self.assertEqual(grid.tile_center(0, 0), (26, 36))
+        self.assertIsNone(grid.tile_at(0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
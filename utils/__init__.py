@@ -4,10 +4,12 @@ Paquete utils - Utilidades para el bot
 from .logger import AppLogger
 from .helpers import *
 from .file_manager import FileManager
-from .performance_monitor import PerformanceMonitor
+from .performance_monitor import PerformanceMonitor, LatencyHistogram, LatencyTracker
 
 __all__ = [
     'AppLogger',
     'FileManager',
-    'PerformanceMonitor'
+    'PerformanceMonitor',
+    'LatencyHistogram',
+    'LatencyTracker'
 ]
\ No newline at end of file
@@ -1,6 +1,9 @@
 """
 Clase PerformanceMonitor - Monitoreo de rendimiento del bot
 """
+import bisect
+import math
+import threading
 import time
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
@@ -53,6 +56,127 @@ class PerformanceMetrics:
         if len(self.timestamps) > 1000:
             self.timestamps = self.timestamps[-1000:]
 
+class LatencyHistogram:
+    """
+    Histograma de latencias con cubetas logarítmicas
+
+    Registrar es O(log n) y la memoria es fija: los percentiles tienen un
+    error relativo acotado por el factor entre cubetas (5% por defecto).
+    """
+
+    def __init__(self, min_value: float = 1e-4, max_value: float = 10.0, factor: float = 1.05):
+        """
+        Args:
+            min_value: Límite superior de la primera cubeta (segundos)
+            max_value: Latencia máxima distinguible (segundos)
+            factor: Razón entre límites de cubetas consecutivas
+        """
+        self.bounds: List[float] = []
+        bound = min_value
+        while bound < max_value:
+            self.bounds.append(bound)
+            bound *= factor
+        self.bounds.append(max_value)
+
+        # Última cubeta: desbordamiento por encima de max_value
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min_value = float('inf')
+        self.max_value = 0.0
+
+    def record(self, seconds: float):
+        """Registra una latencia en segundos"""
+        seconds = max(0.0, seconds)
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min_value = min(self.min_value, seconds)
+        self.max_value = max(self.max_value, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Percentil aproximado en segundos
+
+        Args:
+            percent: Percentil entre 0 y 100
+
+        Returns:
+            Límite superior de la cubeta que contiene el percentil
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = self.bounds[index] if index < len(self.bounds) else self.max_value
+                return min(max(bound, self.min_value), self.max_value)
+        return self.max_value
+
+    @property
+    def mean(self) -> float:
+        """Latencia media en segundos"""
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Resumen en milisegundos"""
+        return {
+            'count': self.count,
+            'mean_ms': self.mean * 1000,
+            'p50_ms': self.percentile(50) * 1000,
+            'p95_ms': self.percentile(95) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'max_ms': self.max_value * 1000
+        }
+
+class LatencyTracker:
+    """Histogramas de latencia por nombre (p. ej. 'heal.capture_to_dispatch')"""
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.lock = threading.Lock()
+
+    def record(self, name: str, seconds: float):
+        """Registra una latencia (seguro entre hilos)"""
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def get(self, name: str) -> Optional[LatencyHistogram]:
+        """Histograma de un nombre (None si no hay registros)"""
+        return self.histograms.get(name)
+
+    def get_report(self) -> Dict[str, Dict[str, Any]]:
+        """Resumen p50/p95/p99 de cada histograma"""
+        with self.lock:
+            return {name: histogram.to_dict() for name, histogram in sorted(self.histograms.items())}
+
+    def print_report(self):
+        """Imprime el informe de latencias"""
+        report = self.get_report()
+
+        print("\n" + "="*60)
+        print("⏱️  LATENCIAS (ms)")
+        print("="*60)
+
+        if not report:
+            print("Sin mediciones")
+        for name, summary in report.items():
+            print(f"  • {name}: p50={summary['p50_ms']:.1f} p95={summary['p95_ms']:.1f} "
+                  f"p99={summary['p99_ms']:.1f} max={summary['max_ms']:.1f} (n={summary['count']})")
+
+        print("="*60)
+
+    def reset(self):
+        """Borra todos los histogramas"""
+        with self.lock:
+            self.histograms.clear()
+
 class PerformanceMonitor:
     """Monitor de rendimiento para el bot"""
     
@@ -0,0 +1,124 @@
+"""
+Importación diferida de dependencias pesadas e informe de tiempos de arranque
+"""
+import importlib
+import sys
+import time
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class StartupReport:
+    """Acumula el tiempo de importación e inicialización por módulo"""
+
+    def __init__(self):
+        self.entries: List[Tuple[str, str, float]] = []
+        self.start_time = time.perf_counter()
+
+    def record(self, name: str, seconds: float, kind: str = 'init'):
+        """
+        Registra una medida
+
+        Args:
+            name: Módulo o componente medido
+            seconds: Duración en segundos
+            kind: 'import' o 'init'
+        """
+        self.entries.append((kind, name, seconds))
+
+    @contextmanager
+    def timed(self, name: str, kind: str = 'init'):
+        """Mide el bloque y lo registra con el nombre dado"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, kind)
+
+    def get_report(self) -> Dict[str, Dict[str, float]]:
+        """Tiempos acumulados en milisegundos, agrupados por tipo"""
+        report: Dict[str, Dict[str, float]] = {'import': {}, 'init': {}}
+        for kind, name, seconds in self.entries:
+            group = report.setdefault(kind, {})
+            group[name] = group.get(name, 0.0) + seconds * 1000
+        return report
+
+    def print_report(self):
+        """Imprime el desglose de tiempos de arranque"""
+        report = self.get_report()
+        total = (time.perf_counter() - self.start_time) * 1000
+
+        print("\n" + "=" * 50)
+        print("⏱️  TIEMPOS DE ARRANQUE")
+        print("=" * 50)
+        for kind, title in (('import', 'Importaciones'), ('init', 'Inicialización')):
+            if not report.get(kind):
+                continue
+            print(f"\n{title}:")
+            for name, ms in sorted(report[kind].items(), key=lambda item: -item[1]):
+                print(f"   {name:<30} {ms:8.1f} ms")
+        print(f"\nTotal desde el inicio: {total:.1f} ms")
+        print("=" * 50)
+
+
+# Informe global del proceso
+startup_report = StartupReport()
+
+
+class LazyModule(ModuleType):
+    """Módulo que se importa en el primer acceso a uno de sus atributos"""
+
+    def __init__(self, name: str, on_import: Optional[Callable[[ModuleType], None]] = None):
+        super().__init__(name)
+        self._lazy_name = name
+        self._lazy_module: Optional[ModuleType] = None
+        self._lazy_on_import = on_import
+
+    def _load(self) -> ModuleType:
+        """Importa el módulo real (una sola vez) y registra su coste"""
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            name = self.__dict__['_lazy_name']
+            already_loaded = name in sys.modules
+            start = time.perf_counter()
+            module = importlib.import_module(name)
+            if not already_loaded:
+                startup_report.record(name, time.perf_counter() - start, 'import')
+            self.__dict__['_lazy_module'] = module
+
+            on_import = self.__dict__['_lazy_on_import']
+            if on_import is not None:
+                on_import(module)
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        """True si el módulo real ya se importó"""
+        return self.__dict__['_lazy_module'] is not None
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._load(), attribute)
+
+    def __setattr__(self, attribute: str, value):
+        if attribute.startswith('_lazy_'):
+            self.__dict__[attribute] = value
+        else:
+            setattr(self._load(), attribute, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str, on_import: Optional[Callable[[ModuleType], None]] = None) -> LazyModule:
+    """
+    Devuelve un módulo que solo se importa cuando se usa
+
+    Args:
+        name: Nombre del módulo (ej. 'pyautogui', 'pynput.mouse')
+        on_import: Función llamada con el módulo real tras importarlo
+
+    Returns:
+        Proxy del módulo
+    """
+    return LazyModule(name, on_import)
@@ -2,10 +2,14 @@
 """
 Alertas visuales simples sin OBS
 """
-import tkinter as tk
-from tkinter import messagebox
 import threading
 
+from utils.startup import lazy_import
+
+# tkinter solo se carga al mostrar la primera alerta
+tk = lazy_import('tkinter')
+messagebox = lazy_import('tkinter.messagebox')
+
 class VisualAlert:
     """Muestra alertas visuales"""
     